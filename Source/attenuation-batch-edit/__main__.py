@@ -1,21 +1,54 @@
 import logging
 import os
+import queue
 import socket
+import threading
+import time
 import tkinter.messagebox as mb
+from tkinter import filedialog
 from pathlib import Path
 
+_imports_started = time.perf_counter()
 import customtkinter as ctk
 import numpy as np
 from PIL import Image
 from waapi import WaapiClient
-import matplotlib
 
-matplotlib.use('TkAgg')  # Must be called before importing pyplot, because pyplot locks in the backend on import.
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from curves import (
+    POSITIVE_CURVES,
+    CurveModel,
+    attenuation_map,
+    display_to_shape,
+    evaluate_curve,
+    points_to_arrays,
+    shape_display_map,
+    simplify_curve,
+    y_to_positions,
+)
+from batch_apply import BatchApplier, CurveCache, build_calls, find_conflicts, radius_max
+from curve_export import CurveTable, export_curves
+from curve_plot import apply_curve_layout, curve_color, style_axes
+from duplicates import find_duplicates, format_report
+from presets import save_preset
+from snapshots import SNAPSHOT_DIR, SnapshotError, load_snapshot
+from targets import (
+    TargetQueryError,
+    attenuations_of,
+    referenced_attenuation_id,
+    resolve_targets,
+    selected_objects,
+)
+from waapi_batch import DEFAULT_CONCURRENCY, WaapiPool
+
+# matplotlib is not imported here: it is the slowest import by far and only the graph needs it (load_plotting).
+IMPORT_SECONDS = time.perf_counter() - _imports_started
 
 WAAPI_HOST = "127.0.0.1"
 WAAPI_PORT = 8080
+# Calls kept in flight by batch operations; each one uses its own WAAPI connection.
+BATCH_CONCURRENCY = int(os.environ.get("WAAPI_CONCURRENCY", DEFAULT_CONCURRENCY))
+# Overlay menu entries -> how the Set targets' curves are drawn behind the edited one.
+OVERLAY_MODES = {"No overlay": None, "Overlay: relative X": "relative", "Overlay: absolute X": "absolute"}
 
 logger = logging.getLogger(__name__)
 logger.addHandler(logging.NullHandler())
@@ -49,6 +82,25 @@ def get_icon(path: Path, size: tuple[int, int]) -> ctk.CTkImage:
     return ICON_CACHE[key]
 
 
+_plotting = None  # (Figure, FigureCanvasTkAgg, LineCollection) once load_plotting ran
+_plotting_lock = threading.Lock()
+
+
+def load_plotting():
+    """Import the matplotlib classes the graph uses, once. Safe to call from a worker thread."""
+    global _plotting
+    with _plotting_lock:
+        if _plotting is None:
+            started = time.perf_counter()
+            # Figure + the Tk canvas directly: pyplot (and its global figure manager) isn't needed.
+            from matplotlib.collections import LineCollection
+            from matplotlib.figure import Figure
+            from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+            _plotting = (Figure, FigureCanvasTkAgg, LineCollection)
+            logger.debug("matplotlib imported in %.0f ms", (time.perf_counter() - started) * 1000)
+    return _plotting
+
+
 def wwise_is_reachable(host=WAAPI_HOST, port=WAAPI_PORT, timeout=0.25):
     """One short TCP probe of Wwise's WAAPI port. WaapiClient() retries the
     connection internally when Wwise is closed, hanging startup for seconds; a
@@ -60,145 +112,6 @@ def wwise_is_reachable(host=WAAPI_HOST, port=WAAPI_PORT, timeout=0.25):
         return False
 
 
-attenuation_map = {
-    "Volume": "VolumeDryUsage",
-    "Auxiliary send volumes (Game-defined)": "VolumeWetGameUsage",
-    "Auxiliary send volumes (User-defined)": "VolumeWetUserUsage",
-    "Low-pass filter": "LowPassFilterUsage",
-    "High-pass filter": "HighPassFilterUsage",
-    "Spread": "SpreadUsage",
-    "Focus": "FocusUsage",
-    "Obstruction Volume": "ObstructionVolumeUsage",
-    "Obstruction Low-pass filter": "ObstructionLPFUsage",
-    "Obstruction High-pass filter": "ObstructionHPFUsage",
-    "Occlusion Volume": "OcclusionVolumeUsage",
-    "Occlusion Low-pass filter": "OcclusionLPFUsage",
-    "Occlusion High-pass filter": "OcclusionHPFUsage",
-    "Diffraction Volume": "DiffractionVolumeUsage",
-    "Diffraction Low-pass filter": "DiffractionLPFUsage",
-    "Diffraction High-pass filter": "DiffractionHPFUsage",
-    "Transmission Volume": "TransmissionVolumeUsage",
-    "Transmission Low-pass filter": "TransmissionLPFUsage",
-    "Transmission High-pass filter": "TransmissionHPFUsage",
-}
-
-shape_display_map = {
-    "Constant": "Constant",
-    "Linear": "Linear",
-    "Log3": "Logarithmic Base 3",
-    "Log2": "Sine (Constant Power Fade In)",
-    "Log1": "Logarithmic (Base 1.41)",
-    "InvertedSCurve": "Inverted S-Curve",
-    "SCurve": "S-Curve",
-    "Exp1": "Exponential (Base 1.41)",
-    "Exp2": "Sine (Constant Power Fade Out)",
-    "Exp3": "Exponential Base 3"
-}
-display_to_shape = {disp: key for key, disp in shape_display_map.items()}
-
-# dB axis mapping used by both the y-position helper and the graph y-ticks
-Y_VALUES = [-200.0, -18.1, -12.0, -8.5, -6.0, -4.1, -2.5, -1.2, 0.0]
-Y_POSITIONS = np.linspace(0.0, 1.0, num=9).tolist()
-
-
-def linear_interpolation(x0, y0, x1, y1, num_points=50):
-    x = np.linspace(x0, x1, num_points)
-    y = np.linspace(y0, y1, num_points)
-    return x, y
-
-
-def logarithmic_interpolation(x0, y0, x1, y1, base, num_points=50):
-    x = np.linspace(x0, x1, num_points)
-    t = np.linspace(0, 1, num_points)
-    log_scale = (np.log1p((base - 1) * t)) / np.log(base)
-    y = y0 + (y1 - y0) * log_scale
-    return x, y
-
-
-def exponential_interpolation(x0, y0, x1, y1, exponent, num_points=50):
-    x = np.linspace(x0, x1, num_points)
-    exp_scale = np.linspace(0, 1, num_points) ** exponent
-    y = y0 + (y1 - y0) * exp_scale
-    return x, y
-
-
-def s_curve_interpolation(x0, y0, x1, y1, num_points=50):
-    x = np.linspace(x0, x1, num_points)
-    t = (x - x0) / (x1 - x0)
-    s_curve = t * t * (3 - 2 * t)
-    y = y0 + (y1 - y0) * s_curve
-    return x, y
-
-
-def inverted_s_curve_interpolation(x0, y0, x1, y1, num_points=100):
-    x = np.linspace(x0, x1, num_points)
-    t = (x - x0) / (x1 - x0)
-    steepness = 2.5
-    p1y = 1 - steepness / 10
-    p2y = steepness / 10
-    bezier = (1 - t) ** 3 * 0 + 3 * (1 - t) ** 2 * t * p1y + 3 * (1 - t) * t ** 2 * p2y + t ** 3 * 1
-    y = y0 + (y1 - y0) * bezier
-    return x, y
-
-
-def constant_interpolation(x0, y0, x1, y1, num_points=2):
-    return [x0, x1], [y0, y0]
-
-
-def y_to_position(y):
-    if y > 0.0:
-        y = 0.0
-    elif y < -200.0:
-        y = -200.0
-    return np.interp(y, Y_VALUES, Y_POSITIONS)
-
-
-# Shape name -> interpolator
-SHAPE_INTERPOLATORS = {
-    "Linear": lambda x0, y0, x1, y1: linear_interpolation(x0, y0, x1, y1),
-    "Log1": lambda x0, y0, x1, y1: logarithmic_interpolation(x0, y0, x1, y1, base=3.5),
-    "Log2": lambda x0, y0, x1, y1: logarithmic_interpolation(x0, y0, x1, y1, base=10),
-    "Log3": lambda x0, y0, x1, y1: logarithmic_interpolation(x0, y0, x1, y1, base=30),
-    "Exp1": lambda x0, y0, x1, y1: exponential_interpolation(x0, y0, x1, y1, exponent=1.3),
-    "Exp2": lambda x0, y0, x1, y1: exponential_interpolation(x0, y0, x1, y1, exponent=2),
-    "Exp3": lambda x0, y0, x1, y1: exponential_interpolation(x0, y0, x1, y1, exponent=4),
-    "SCurve": lambda x0, y0, x1, y1: s_curve_interpolation(x0, y0, x1, y1),
-    "InvertedSCurve": lambda x0, y0, x1, y1: inverted_s_curve_interpolation(x0, y0, x1, y1),
-    "Constant": lambda x0, y0, x1, y1: constant_interpolation(x0, y0, x1, y1),
-}
-
-COLOR_MAPPING = {
-    "VolumeWetGameUsage": "#c98036",
-    "VolumeWetUserUsage": "#7c4d1d",
-    "VolumeDryUsage": "#da2121",
-    "LowPassFilterUsage": "#0080ff",
-    "HighPassFilterUsage": "#30bffd",
-    "SpreadUsage": "#8bd100",
-    "FocusUsage": "#639400",
-    "ObstructionVolumeUsage": "#c97a3c",
-    "ObstructionLPFUsage": "#c97a3c",
-    "ObstructionHPFUsage": "#e8a878",
-    "OcclusionVolumeUsage": "#7c5fbe",
-    "OcclusionLPFUsage": "#7c5fbe",
-    "OcclusionHPFUsage": "#a497d4",
-    "DiffractionVolumeUsage": "#bf5894",
-    "DiffractionLPFUsage": "#bf5894",
-    "DiffractionHPFUsage": "#d289b8",
-    "TransmissionVolumeUsage": "#3848bc",
-    "TransmissionLPFUsage": "#3848bc",
-    "TransmissionHPFUsage": "#6c80df",
-}
-
-# Curve types whose Y range is [0, 100]. Everything else is dB in [-200, 0].
-POSITIVE_CURVES = {
-    "LowPassFilterUsage", "HighPassFilterUsage", "SpreadUsage", "FocusUsage",
-    "ObstructionLPFUsage", "ObstructionHPFUsage",
-    "OcclusionLPFUsage", "OcclusionHPFUsage",
-    "DiffractionLPFUsage", "DiffractionHPFUsage",
-    "TransmissionLPFUsage", "TransmissionHPFUsage",
-}
-
-
 class ChangeValueButton:
     """Clickable icon, used as the +/- nudge buttons on each AttenuationPoint row."""
 
@@ -218,6 +131,11 @@ class ChangeValueButton:
 
 
 class AttenuationPoint:
+    """
+    One recycled editor row. Rows own no point data: bind(index) shows model point `index`
+    and every edit is written straight back to editor.model, so the row pool stays a
+    fixed size however many points the curve has.
+    """
     # (attr_name, icon, size, axis, delta, column, sticky)
     BUTTON_SPECS = [
         ('x_decrease_button_large', 'minus', 17, 'x', -10, 2, 'e'),
@@ -229,20 +147,13 @@ class AttenuationPoint:
         ('y_increase_button_small', 'plus', 10, 'y', 1, 11, 'w'),
         ('y_increase_button_large', 'plus', 17, 'y', 10, 13, 'w'),
     ]
-    ABSOLUTE_X_MAX = 1_000_000.0
-
-    def __init__(self, master, editor, x=0, y=0, on_delete=lambda index: None, index=0, on_change=lambda: None):
 
+    def __init__(self, master, editor, slot):
         self.editor = editor
-        self.x = ctk.StringVar(value=x)
-        self.y = ctk.StringVar(value=y)
-        self.on_delete = on_delete
-        self.on_change_callback = on_change
-        self.index = index
-
-        # Snapshot of last validated value; used to restore the entry after a failed edit.
-        self.previous_x_value = x
-        self.previous_y_value = y
+        self.slot = slot
+        self.index = None  # model index currently shown, None while hidden
+        self.x = ctk.StringVar(value="")
+        self.y = ctk.StringVar(value="")
 
         # Absolute/relative toggle. Hidden on endpoints via _apply_endpoint_visibility.
         self.is_absolute = ctk.BooleanVar(value=False)
@@ -250,7 +161,6 @@ class AttenuationPoint:
             master, text="abs", variable=self.is_absolute, width=20,
             command=self._on_absolute_toggle,
         )
-        self.absolute_checkbox.grid(row=index, column=0, sticky="w", padx=5, pady=5)
 
         # X entry + suffix label (% / abs) so the unit is visible without checking the checkbox.
         self.x_cell = ctk.CTkFrame(master, fg_color="transparent")
@@ -260,173 +170,114 @@ class AttenuationPoint:
         )
         self.x_entry.pack(side="left")
         self.unit_label.pack(side="left", padx=(2, 0))
-        # Trace fires regardless of who flips is_absolute (checkbox, _enforce_absolute_prefix,
-        # _create_point reuse), so the suffix never gets out of sync.
+        # Trace fires regardless of who flips is_absolute (checkbox or bind), so the suffix never gets out of sync.
         self.is_absolute.trace_add("write", lambda *_: self.unit_label.configure(
             text="abs" if self.is_absolute.get() else "%"
         ))
 
         self.y_entry = ctk.CTkEntry(master, textvariable=self.y, width=80)
         self.delete_button = ctk.CTkButton(
-            master, text="Delete", command=lambda: self.on_delete(self.index),
+            master, text="Delete", command=lambda: self.editor.delete_point(self.index),
             fg_color="#404040", hover_color="#303030",
         )
 
-        self.x_cell.grid(row=index, column=4, sticky="ew", padx=5, pady=5)
-        self.y_entry.grid(row=index, column=10, sticky="ew", padx=5, pady=5)
-        self.delete_button.grid(row=index, column=14, pady=5, sticky="e", padx=5)
-
         for attr, icon, size, axis, delta, col, sticky in self.BUTTON_SPECS:
             btn = ChangeValueButton(
                 master, ICON_DIR / f"{icon}_icon.png", size=(size, size),
                 command=lambda a=axis, d=delta: self.change_x_or_y_value(a, d),
             )
-            btn.grid(row=index, column=col, sticky=sticky, padx=5, pady=5)
             setattr(self, attr, btn)
 
         self.shape_var = ctk.StringVar(value=shape_display_map["Linear"])
         self.shape_combo = ctk.CTkComboBox(
             master, values=list(shape_display_map.values()), variable=self.shape_var,
-            state="readonly", command=lambda val: self.on_change_callback(),
+            state="readonly", command=self._on_shape_changed,
         )
-        self.shape_combo.grid(row=index, column=1, sticky="w", padx=5, pady=5)
 
-        self.x_entry.bind('<FocusIn>', self.store_previous_x_value)
         self.x_entry.bind('<FocusOut>', self.validate_x_entry)
         self.x_entry.bind('<Return>', self.validate_x_entry)
-
-        self.y_entry.bind('<FocusIn>', self.store_previous_y_value)
         self.y_entry.bind('<FocusOut>', self.validate_y_entry)
         self.y_entry.bind('<Return>', self.validate_y_entry)
 
-    # Store as float (not the StringVar's string) so payload builders that read
-    # previous_*_value send WAAPI a "number" type instead of "1.0" as a string.
-    def store_previous_x_value(self, event=None):
-        try:
-            self.previous_x_value = float(self.x.get())
-        except (ValueError, ctk.TclError):
-            self.previous_x_value = 0.0
+    @property
+    def model(self):
+        return self.editor.model
 
-    def store_previous_y_value(self, event=None):
-        try:
-            self.previous_y_value = float(self.y.get())
-        except (ValueError, ctk.TclError):
-            self.previous_y_value = 0.0
-
-    def _set_validated_x(self, new_value_raw):
-        """
-        Attempts to set a new X value after validation.
-        Validation:
-            * Convert to float; revert on failure.
-            * Clamp [0, 100] for relative or [0, ABSOLUTE_X_MAX] for absolute.
-            * Collision check only against same-type neighbors (different units don't compete).
-        Returns True if the value was successfully set, False otherwise.
-        """
-        try:
-            new_value_float = float(new_value_raw)
-        except (ValueError, TypeError):
-            self.x.set(self.previous_x_value)
-            return False
-
-        upper_clamp = self.ABSOLUTE_X_MAX if self.is_absolute.get() else 100.0
-        clamped_value = max(0.0, min(upper_clamp, new_value_float))
-
-        # Collision check against same-type neighbors (skipped for endpoints, which are locked).
-        is_endpoint = (self.index == 0 or self.index == len(self.editor.active_points) - 1)
-        if not is_endpoint:
-            prev_x = self.get_prev_same_type_x()
-            next_x = self.get_next_same_type_x()
-            if (next_x is not None and clamped_value >= next_x) or \
-                    (prev_x is not None and clamped_value <= prev_x):
-                self.x.set(f"{self.previous_x_value:.3f}")
-                self.on_change_callback()
-                return False
-
-        self.x.set(f"{clamped_value:.3f}")
-        self.previous_x_value = clamped_value
-        self.on_change_callback()
-        return True
-
-    def _set_validated_y(self, new_value_raw):
-        """
-        Attempts to set a new Y value after validation.
-        Validation includes: conversion to float and clamping
-        depending on the type of attenuation curve.
-        Returns True if the value was successfully set, False otherwise.
-        """
+    def bind(self, index):
+        """Show model point `index` in this row."""
+        self.index = index
+        model = self.model
+        self.x.set(f"{model.x[index]:.3f}")
+        self.y.set(f"{model.y[index]:.3f}")
+        self.shape_var.set(shape_display_map.get(model.shape_key(index), shape_display_map["Linear"]))
+        self.is_absolute.set(bool(model.absolute[index]))
+        self.regrid_row(self.slot)
+        self._apply_endpoint_visibility(is_first=(index == 0), is_last=(index == len(model) - 1))
+
+    def unbind(self):
+        self.index = None
+        self.grid_forget()
 
-        try:
-            new_value_float = float(new_value_raw)
-        except (ValueError, TypeError):
-            self.y.set(self.previous_y_value)
-            return False
+    def _apply_endpoint_visibility(self, is_first, is_last):
+        """Endpoints can't be moved off their X position, can't be deleted, can't be made absolute."""
+        if is_first or is_last:
+            self.delete_button.grid_forget()
+            self.absolute_checkbox.grid_forget()
+        # Last point: locked at right boundary -> hide X- buttons
+        if is_last:
+            self.x_decrease_button_small.grid_forget()
+            self.x_decrease_button_large.grid_forget()
+        # First point: locked at left boundary -> hide X+ buttons
+        if is_first:
+            self.x_increase_button_small.grid_forget()
+            self.x_increase_button_large.grid_forget()
 
-        # POSITIVE_CURVES (LPF/HPF/Spread/Focus + spatial LPF/HPF) → [0, 100].
-        # Everything else (Volume curves incl. spatial Volume) → [-200, 0] dB.
-        att_label = self.editor.att_var_string.get()
-        curve_type = attenuation_map.get(att_label, "")
-        if curve_type in POSITIVE_CURVES:
-            clamped_value = max(0.0, min(100.0, new_value_float))
-        else:
-            clamped_value = max(-200.0, min(0.0, new_value_float))
+    def _edited(self):
+        # Rebind shows the validated value (or reverts a rejected edit).
+        self.bind(self.index)
+        self.editor.update_graph()
 
-        self.y.set(f"{clamped_value:.3f}")
-        self.previous_y_value = clamped_value
-        self.on_change_callback()
-        return True
+    def validate_x_entry(self, event=None):
+        if self.index is None or self.x_entry.get() == f"{self.model.x[self.index]:.3f}":
+            return
+        self.model.set_x(self.index, self.x_entry.get())
+        self._edited()
 
-    def validate_x_entry(self, event):
-        self._set_validated_x(self.x_entry.get())
+    def validate_y_entry(self, event=None):
+        if self.index is None or self.y_entry.get() == f"{self.model.y[self.index]:.3f}":
+            return
+        self.model.set_y(self.index, self.y_entry.get(), self.editor.is_positive_curve())
+        self._edited()
 
-    def validate_y_entry(self, event):
-        self._set_validated_y(self.y_entry.get())
+    def commit_edits(self):
+        """Write typed-but-unconfirmed entry text to the model before the row is rebound."""
+        self.validate_x_entry()
+        self.validate_y_entry()
 
     def change_x_or_y_value(self, axis, value):
+        if self.index is None:
+            return
         if axis == 'x':
-            current = float(self.x.get())
-            new = current + value
             # Boundaries from same-type neighbors only; different-type neighbors don't compete.
-            prev_x = self.get_prev_same_type_x()
-            next_x = self.get_next_same_type_x()
-            lower = prev_x if prev_x is not None else 0.0
-            upper = next_x if next_x is not None else (
-                self.ABSOLUTE_X_MAX if self.is_absolute.get() else 100.0
-            )
-            if new <= lower or new >= upper:
+            if not self.model.nudge_x(self.index, value):
                 return
-            self._set_validated_x(new)
         elif axis == 'y':
-            current = float(self.y.get())
-            new = current + value
-            self._set_validated_y(new)
-
-    def get_prev_same_type_x(self):
-        """X of nearest previous point with the same is_absolute as self, or None."""
-        my_abs = self.is_absolute.get()
-        for i in range(self.index - 1, -1, -1):
-            pt = self.editor.active_points[i]
-            if pt.is_absolute.get() == my_abs:
-                try:
-                    return float(pt.x.get())
-                except (ValueError, ctk.TclError):
-                    return None
-        return None
-
-    def get_next_same_type_x(self):
-        """X of nearest next point with the same is_absolute as self, or None."""
-        my_abs = self.is_absolute.get()
-        for i in range(self.index + 1, len(self.editor.active_points)):
-            pt = self.editor.active_points[i]
-            if pt.is_absolute.get() == my_abs:
-                try:
-                    return float(pt.x.get())
-                except (ValueError, ctk.TclError):
-                    return None
-        return None
+            self.model.set_y(self.index, self.model.y[self.index] + value, self.editor.is_positive_curve())
+        self._edited()
+
+    def _on_shape_changed(self, value):
+        if self.index is None:
+            return
+        self.model.set_shape(self.index, display_to_shape[value])
+        self.editor.update_graph()
 
     def _on_absolute_toggle(self):
-        self.editor._enforce_absolute_prefix(self)
-        self.on_change_callback()
+        if self.index is None:
+            return
+        # May flip other points too (absolute prefix rule) -> refresh every visible row.
+        self.model.set_absolute(self.index, self.is_absolute.get(), self.editor.current_max_x)
+        self.editor.refresh_points()
+        self.editor.update_graph()
 
     def _value_buttons(self):
         """All +/- buttons defined by BUTTON_SPECS, in declaration order."""
@@ -443,7 +294,7 @@ class AttenuationPoint:
 
     def grid_forget(self):
         """
-        Hide all of this point's widgets, but only if they're currently managed by grid.
+        Hide all of this row's widgets, but only if they're currently managed by grid.
         Safely ignores any widgets that have been destroyed.
         """
         widgets = [self.absolute_checkbox, self.shape_combo, self.x_cell, self.y_entry, self.delete_button]
@@ -470,23 +321,55 @@ class AttenuationPoint:
 class AttenuationCurveEditor:
     def __init__(self, master):
         self.master = master
-        self.MAX_ROWS = 20
+        self.VISIBLE_ROWS = 5
         self.row_pool: list[AttenuationPoint] = []
-        self.active_points: list[AttenuationPoint] = []
-        self.max_x_values = {}
+        self.model = CurveModel()  # the edited curve; rows in row_pool are views onto it
+        self.first_point = 0  # model index shown in the top row
         self.selected_att = ""
+        self.source_att_id = None  # attenuation the editor curve was read from (Get)
         self.project_name = ""
         self.client = None  # set by _connect_to_wwise
+        self.pool = None  # WaapiPool for batch calls, opened on first use
+        self.batch = None  # BatchApplier over pool + curve_cache, see _get_batch
+        self.curve_cache = CurveCache()
         self.current_max_x = 100
+        self.overlay_targets = []  # attenuations drawn by the overlay (Set targets when it was turned on)
+        self.overlay = None  # (curve type, [(x, y, shape codes, RadiusMax)]) of overlay_targets
+        self._overlay_version = 0  # bumped whenever `overlay` changes, part of the graph layout key
+        self._batch_cancel = None  # threading.Event of the running background job, if any
+        self._batch_events = queue.Queue()
         self._init_ui()
 
     def _init_ui(self):
         self.graph_display_status = 'no_att_selected'
+        self.canvas = None  # set by _build_graph once matplotlib is loaded
         self._build_top_controls()
         self._build_points_pool()
-        self._build_graph()
+        self._build_graph_placeholder()
         self._build_info_frame()
+        # Everything slow happens after the window is on screen.
+        self.master.after(10, self._finish_startup)
+
+    def _finish_startup(self):
+        self.master.update_idletasks()  # flush the first paint before blocking on the connection
+        started = time.perf_counter()
         self._connect_to_wwise()
+        logger.debug("WAAPI connection took %.0f ms", (time.perf_counter() - started) * 1000)
+        threading.Thread(target=load_plotting, name="load-matplotlib", daemon=True).start()
+        self._wait_for_plotting()
+
+    def _wait_for_plotting(self):
+        if self.canvas is not None:
+            return  # a Get already built it
+        if _plotting is None:
+            self.master.after(50, self._wait_for_plotting)
+            return
+        self._build_graph()
+
+    def _ensure_graph(self):
+        # Get before the background import finished: wait for it here.
+        if self.canvas is None:
+            self._build_graph()
 
     def _build_top_controls(self):
         """Curve type combo + Get/Set buttons + X/Y headers (headers stay hidden until a curve loads)."""
@@ -496,6 +379,7 @@ class AttenuationCurveEditor:
             state="readonly",
             variable=self.att_var_string,
             values=list(attenuation_map.keys()),
+            command=self._on_curve_type_changed,
         )
         self.curve_type_combo.grid(row=1, column=0, pady=5, sticky="w", padx=12)
 
@@ -510,37 +394,149 @@ class AttenuationCurveEditor:
             fg_color="#404040", hover_color="#303030",
         )
         self.get_attenuation_button.grid(row=0, column=0, pady=5, padx=12, sticky="w")
+        # Fits dense curves (measured/generated data) into a few shaped points.
+        self.simplify_button = ctk.CTkButton(
+            self.master, text="Simplify", width=80, command=self.simplify_points,
+            fg_color="#404040", hover_color="#303030",
+        )
+
+        # Set targets: empty = Wwise selection, otherwise a name pattern or "$ ..." WAQL (see targets.py).
+        self.target_query_entry = ctk.CTkEntry(
+            self.master, width=300,
+            placeholder_text="Set targets: selection, name pattern or $ WAQL",
+        )
+
+        # Set also copies every other used curve of the Get source (RadiusMax-scaled per target).
+        self.all_curves_var = ctk.BooleanVar(value=False)
+        self.all_curves_checkbox = ctk.CTkCheckBox(
+            self.master, text="All curve types", variable=self.all_curves_var,
+        )
+        # The Set targets' curves of the current type, drawn behind the edited one for comparison.
+        self.overlay_mode_var = ctk.StringVar(value="No overlay")
+        self.overlay_menu = ctk.CTkOptionMenu(
+            self.master, width=150, values=list(OVERLAY_MODES), variable=self.overlay_mode_var,
+            command=self._on_overlay_mode_changed, fg_color="#404040", button_color="#404040",
+            button_hover_color="#303030",
+        )
+        # Set reads the targets' curves first and leaves the ones that already match alone.
+        self.skip_unchanged_var = ctk.BooleanVar(value=True)
+        self.skip_unchanged_checkbox = ctk.CTkCheckBox(
+            self.master, text="Skip unchanged", variable=self.skip_unchanged_var,
+        )
 
     def _build_points_pool(self):
-        """Scrollable frame + pre-allocate MAX_ROWS AttenuationPoint widgets, all hidden initially."""
-        self.active_points_frame = ctk.CTkScrollableFrame(self.master, width=745, height=180)
-        self.active_points_frame.grid(row=2, column=0, columnspan=16, sticky="nsew")
-        for i in range(self.MAX_ROWS):
-            pt = AttenuationPoint(
-                self.active_points_frame, self,
-                x=0, y=0,
-                on_delete=lambda idx=i: self.delete_point(idx),
-                index=i,
-                on_change=self.update_graph,
-            )
-            pt.grid_forget()
-            self.row_pool.append(pt)
+        """
+        Fixed-height list with VISIBLE_ROWS recycled AttenuationPoint rows + scrollbar.
+        Scrolling rebinds rows to other model points, so curves of any length cost the same widgets.
+        """
+        self.points_view = ctk.CTkFrame(self.master, width=745, height=180)
+        self.points_view.grid(row=2, column=0, columnspan=16, sticky="nsew")
+        self.points_view.grid_propagate(False)
+        self.points_view.pack_propagate(False)
+        self.active_points_frame = ctk.CTkFrame(self.points_view, fg_color="transparent")
+        self.active_points_frame.pack(side="left", fill="both", expand=True)
+        self.points_scrollbar = ctk.CTkScrollbar(self.points_view, command=self._points_yview)
+        self.points_scrollbar.pack(side="right", fill="y")
+        for slot in range(self.VISIBLE_ROWS):
+            self.row_pool.append(AttenuationPoint(self.active_points_frame, self, slot))
+
+        # CTk widgets refuse bind_all; the toplevel's bindtag sees the wheel over any child widget.
+        toplevel = self.points_view.winfo_toplevel()
+        toplevel.bind("<MouseWheel>", self._on_points_wheel, add="+")
+        toplevel.bind("<Button-4>", lambda e: self._on_points_wheel(e, -1), add="+")
+        toplevel.bind("<Button-5>", lambda e: self._on_points_wheel(e, 1), add="+")
+
+    def refresh_points(self):
+        """Rebind the visible rows to model[first_point:first_point + VISIBLE_ROWS]."""
+        total = len(self.model)
+        self.first_point = max(0, min(self.first_point, total - self.VISIBLE_ROWS))
+        for slot, row in enumerate(self.row_pool):
+            index = self.first_point + slot
+            if index < total:
+                row.bind(index)
+            else:
+                row.unbind()
+        if total:
+            self.points_scrollbar.set(self.first_point / total,
+                                      min(1.0, (self.first_point + self.VISIBLE_ROWS) / total))
+        else:
+            self.points_scrollbar.set(0.0, 1.0)
+
+    def scroll_points_to(self, first_point):
+        first_point = max(0, min(first_point, len(self.model) - self.VISIBLE_ROWS))
+        if first_point != self.first_point:
+            for row in self.row_pool:
+                row.commit_edits()
+            self.first_point = first_point
+            self.refresh_points()
+
+    def _points_yview(self, *args):
+        # Scrollbar protocol: ("moveto", fraction) or ("scroll", n, "units"/"pages")
+        if args[0] == "moveto":
+            self.scroll_points_to(round(float(args[1]) * len(self.model)))
+        elif args[0] == "scroll":
+            step = self.VISIBLE_ROWS if args[2] == "pages" else 1
+            self.scroll_points_to(self.first_point + int(args[1]) * step)
+
+    def _on_points_wheel(self, event, direction=None):
+        # The widget under the pointer, not event.widget: on Windows the wheel goes to the focus widget.
+        under = self.points_view.winfo_containing(event.x_root, event.y_root)
+        path = str(self.points_view)
+        if under is None or not (str(under) == path or str(under).startswith(path + ".")):
+            return
+        if direction is None:
+            direction = -1 if event.delta > 0 else 1
+        self.scroll_points_to(self.first_point + direction)
+
+    def is_positive_curve(self):
+        # POSITIVE_CURVES (LPF/HPF/Spread/Focus + spatial LPF/HPF) -> [0, 100], Volume curves -> [-200, 0] dB.
+        return attenuation_map.get(self.att_var_string.get(), "") in POSITIVE_CURVES
+
+    def _build_graph_placeholder(self):
+        """Stand-in with the graph's size and look, shown until _build_graph replaces it."""
+        self.graph_placeholder = ctk.CTkLabel(
+            self.master, text="No Attenuation Loaded", height=200,
+            fg_color="#333333", text_color="#9f9f9f", font=ctk.CTkFont(size=24),
+        )
+        self.graph_placeholder.grid(row=3, column=0, columnspan=16, pady=10, sticky="ew")
 
     def _build_graph(self):
-        """Matplotlib figure + canvas; the empty-state render is done by update_graph()."""
-        self.fig, self.ax = plt.subplots(figsize=(5, 2))
+        """
+        Matplotlib figure + canvas with a persistent artist set. The curve and point
+        markers are animated artists blitted over a cached background, so point edits
+        only redraw data; axes/ticks/title are rebuilt only when the layout changes.
+        """
+        started = time.perf_counter()
+        Figure, FigureCanvasTkAgg, LineCollection = load_plotting()
+        self.fig = Figure(figsize=(5, 2))
+        self.ax = self.fig.add_subplot()
         self.canvas = FigureCanvasTkAgg(self.fig, master=self.master)
         self.widget = self.canvas.get_tk_widget()
+        self.graph_placeholder.destroy()
         self.widget.grid(row=3, column=0, columnspan=16, pady=10, sticky="ew")
 
-        self.update_graph()
+        style_axes(self.fig, self.ax)
+
+        # Overlay curves: one collection, part of the cached background (only redrawn on layout changes).
+        self.overlay_lines = LineCollection([], linewidths=1, alpha=0.35, visible=False)
+        self.ax.add_collection(self.overlay_lines)
+        self.curve_line, = self.ax.plot([], [], marker='', animated=True)
+        self.points_line, = self.ax.plot([], [], 'o', animated=True)
+        self.empty_text = self.ax.text(
+            0.5, 0.5,
+            "No Attenuation Loaded",
+            fontsize=24,
+            color='#9f9f9f',
+            ha='center', va='center',
+            transform=self.ax.transAxes,
+        )
+        self._graph_background = None
+        self._graph_layout = None
+        self._graph_redraw_pending = False
+        self.canvas.mpl_connect('draw_event', self._on_graph_draw)
 
-        self.ax.tick_params(axis='x', colors='#9f9f9f')
-        self.ax.tick_params(axis='y', colors='#9f9f9f')
-        self.ax.xaxis.label.set_color('#9f9f9f')
-        self.ax.yaxis.label.set_color('#9f9f9f')
-        for spine in self.ax.spines.values():
-            spine.set_edgecolor('#9f9f9f')
+        self._redraw_graph()
+        logger.debug("Graph built in %.0f ms", (time.perf_counter() - started) * 1000)
 
     def _build_info_frame(self):
         """Bottom strip — connection status / project name lives here."""
@@ -548,6 +544,40 @@ class AttenuationCurveEditor:
         self.info_frame.grid(row=4, column=0, columnspan=16, sticky="ew")
         self.info_frame.columnconfigure(0, weight=1)
         self.info_frame.columnconfigure(1, weight=1)
+        self.connection_status_label = ctk.CTkLabel(self.info_frame, text="Connecting...", text_color="#9f9f9f")
+        self.connection_status_label.grid(row=0, column=0, sticky="w", padx=12)
+
+        # Batch progress (column 1); hidden while no background job runs.
+        self.progress_label = ctk.CTkLabel(self.info_frame, text="", text_color="#9f9f9f")
+        self.progress_label.grid(row=0, column=1, sticky="e", padx=(0, 8))
+        self.progress_bar = ctk.CTkProgressBar(self.info_frame, width=160)
+        self.progress_bar.set(0)
+        self.cancel_button = ctk.CTkButton(
+            self.info_frame, text="Cancel", width=60, command=self.cancel_batch,
+            fg_color="#404040", hover_color="#303030",
+        )
+        # Project-wide curve export (column 4), independent of the loaded curve.
+        self.export_button = ctk.CTkButton(
+            self.info_frame, text="Export...", width=80, command=self.export_project,
+            fg_color="#404040", hover_color="#303030",
+        )
+        self.export_button.grid(row=0, column=4, sticky="e", padx=(0, 12), pady=4)
+        self.duplicates_button = ctk.CTkButton(
+            self.info_frame, text="Duplicates...", width=90, command=self.find_duplicate_attenuations,
+            fg_color="#404040", hover_color="#303030",
+        )
+        self.duplicates_button.grid(row=0, column=5, sticky="e", padx=(0, 12), pady=4)
+        self.restore_button = ctk.CTkButton(
+            self.info_frame, text="Restore...", width=80, command=self.restore_snapshot,
+            fg_color="#404040", hover_color="#303030",
+        )
+        self.restore_button.grid(row=0, column=6, sticky="e", padx=(0, 12), pady=4)
+        # The curves Set would write, as a preset file for batch_cli.py.
+        self.save_preset_button = ctk.CTkButton(
+            self.info_frame, text="Save preset...", width=90, command=self.save_preset,
+            fg_color="#404040", hover_color="#303030",
+        )
+        self.save_preset_button.grid(row=0, column=7, sticky="e", padx=(0, 12), pady=4)
 
     def _connect_to_wwise(self):
         """Connect to Wwise and populate the status label."""
@@ -560,263 +590,485 @@ class AttenuationCurveEditor:
                 self.project_name = self.client.call("ak.wwise.core.getProjectInfo")['name']
                 text = str(self.project_name)
                 text_color = "#4ade80"
+                # Edits made in Wwise (or by another tool) drop the affected cache entries.
+                for topic in ("ak.wwise.core.object.attenuationCurveChanged",
+                              "ak.wwise.core.object.attenuationCurveLinkChanged"):
+                    self.client.subscribe(topic, self._on_curve_changed)
             except Exception:
                 logger.exception("Failed to connect to Wwise")
                 self.client = None
-        self.connection_status_label = ctk.CTkLabel(self.info_frame, text=text, text_color=text_color)
-        self.connection_status_label.grid(row=0, column=0, sticky="w", padx=12)
+        self.connection_status_label.configure(text=text, text_color=text_color)
 
     def show_controls(self):
         self.x_header_label.grid(row=1, column=4, pady=5)
         self.y_header_label.grid(row=1, column=12, pady=5)
         self.set_attenuation_button.grid(row=0, column=15, pady=5, padx=21, sticky="e")
+        self.simplify_button.grid(row=0, column=12, pady=5, sticky="e")
+        self.overlay_menu.grid(row=0, column=13, columnspan=2, pady=5, padx=(8, 0), sticky="e")
+        self.target_query_entry.grid(row=0, column=1, columnspan=10, pady=5, padx=5, sticky="ew")
+        self.all_curves_checkbox.grid(row=1, column=15, pady=5, padx=21, sticky="e")
+        self.skip_unchanged_checkbox.grid(row=1, column=14, pady=5, sticky="e")
 
     def hide_controls(self):
         self.x_header_label.grid_forget()
         self.y_header_label.grid_forget()
         self.set_attenuation_button.grid_forget()
-
-    @staticmethod
-    def _apply_endpoint_visibility(pt, is_first, is_last):
-        """Endpoints can't be moved off their X position, can't be deleted, can't be made absolute."""
-        if is_first or is_last:
-            pt.delete_button.grid_forget()
-            pt.absolute_checkbox.grid_forget()
-        # Last point: locked at right boundary -> hide X- buttons
-        if is_last:
-            pt.x_decrease_button_small.grid_forget()
-            pt.x_decrease_button_large.grid_forget()
-        # First point: locked at left boundary -> hide X+ buttons
-        if is_first:
-            pt.x_increase_button_small.grid_forget()
-            pt.x_increase_button_large.grid_forget()
-
-    def sort_points(self):
-        self.active_points.sort(key=lambda p: float(p.x.get()))
-        n = len(self.active_points)
-        for i, pt in enumerate(self.active_points):
-            pt.index = i
-            pt.regrid_row(i)
-            self._apply_endpoint_visibility(pt, is_first=(i == 0), is_last=(i == n - 1))
-
-    def _convert_x_to_match_type(self, pt):
-        """
-        Convert pt.x between percent and absolute units to match pt.is_absolute.
-        Called right after the BooleanVar flips, so pt.x still holds the OLD-type value.
-        Result is clamped to the type's valid range.
-        """
-        max_x = self.current_max_x or 100
-        if max_x <= 0:
-            return
-        try:
-            cur_x = float(pt.x.get())
-        except (ValueError, ctk.TclError):
+        self.simplify_button.grid_forget()
+        self.overlay_menu.grid_forget()
+        self.target_query_entry.grid_forget()
+        self.all_curves_checkbox.grid_forget()
+        self.skip_unchanged_checkbox.grid_forget()
+
+    def simplify_points(self):
+        """Replace the editor curve by at most SIMPLIFY_MAX_POINTS shaped points (see curves.simplify_curve)."""
+        before = len(self.model)
+        if before <= 2:
             return
-        if pt.is_absolute.get():
-            # was %, now absolute units
-            new_x = cur_x * max_x / 100.0
-            new_x = max(0.0, min(pt.ABSOLUTE_X_MAX, new_x))
-        else:
-            # was absolute, now %
-            new_x = (cur_x / max_x) * 100.0
-            new_x = max(0.0, min(100.0, new_x))
-        pt.x.set(f"{new_x:.3f}")
-        pt.previous_x_value = new_x
-
-    def _enforce_absolute_prefix(self, toggled_pt):
-        """
-        Absolute middle points must form a contiguous prefix:
-            [rel(locked), abs, abs, rel, ..., rel(locked)]
-        - Checking point N  -> also check all earlier middle points.
-        - Unchecking point N -> also uncheck all later middle points.
-        Endpoints (first/last) are always relative and ignored.
-        Each point whose state changes also has its X value converted between % and absolute units.
-        """
-        middle_pts = self.active_points[1:-1]
-        if toggled_pt not in middle_pts:
+        # Fit the curve as drawn (final X, shaped segments); the result is all relative points.
+        xs, ys = evaluate_curve(self.model.final_x(self.current_max_x), self.model.y, self.model.shapes)
+        x, y, shapes, max_error = simplify_curve(xs, ys)
+        if len(x) >= before:
+            self.progress_label.configure(text="Curve is already minimal")
             return
-
-        # Toggled point's BooleanVar already flipped — convert its X to match the new type.
-        self._convert_x_to_match_type(toggled_pt)
-
-        idx = middle_pts.index(toggled_pt)
-        if toggled_pt.is_absolute.get():
-            for pt in middle_pts[:idx]:
-                if not pt.is_absolute.get():
-                    pt.is_absolute.set(True)
-                    self._convert_x_to_match_type(pt)
-        else:
-            for pt in middle_pts[idx + 1:]:
-                if pt.is_absolute.get():
-                    pt.is_absolute.set(False)
-                    self._convert_x_to_match_type(pt)
-
-    def _create_point(self, x: float, y: float, shape_key: str = "Linear") -> AttenuationPoint:
-        idx = len(self.active_points)
-        if idx >= self.MAX_ROWS:
-            return None  # too many points
-
-        pt = self.row_pool[idx]
-        pt.x.set(f"{x:.3f}")
-        pt.y.set(f"{y:.3f}")
-        pt.previous_x_value = x
-        pt.previous_y_value = y
-        pt.shape_var.set(shape_display_map.get(shape_key, shape_display_map["Linear"]))
-        pt.is_absolute.set(False)  # pool widgets are reused — always start as relative
-        pt.regrid_row(idx)
-        self.active_points.append(pt)
-        return pt
+        self.model = CurveModel(x / x[-1] * 100.0, y, shapes)
+        self.first_point = 0
+        self.refresh_points()
+        self.update_graph()
+        self.progress_label.configure(text=f"Simplified {before} -> {len(x)} points (max error {max_error:.2f})")
 
     def delete_point(self, index):
         # Endpoints (first/last) are locked.
-        if index == 0 or index == len(self.active_points) - 1:
+        if index is None or not self.model.delete(index):
             return
-        pt = self.active_points.pop(index)
-        pt.grid_forget()
-        self.sort_points()
+        self.refresh_points()
         self.update_graph()
 
-    def _load_max_x_values(self):
-        # max_x = the attenuation's RadiusMax: every curve's X domain is [0, RadiusMax],
-        # and Wwise rejects a Set whose last endpoint X != RadiusMax ("invalid endpoints").
-        # No try/except here: caller (set_attenuation) wraps the whole flow.
-        self.max_x_values.clear()
-        selected = self.client.call("ak.wwise.ui.getSelectedObjects", {}, options={"return": ["id"]})['objects']
-        ids = [obj['id'] for obj in selected]
-        if not ids:
-            return
-        result = self.client.call(
-            "ak.wwise.core.object.get",
-            {"from": {"id": ids}},
-            options={"return": ["id", "@RadiusMax"]},
-        )['return']
-        for entry in result:
-            self.max_x_values[entry['id']] = entry.get('@RadiusMax', 100)
-
     def update_graph(self, event=None):
-        if not self.active_points or self.graph_display_status in ('no_points', 'no_att_selected'):
-            self.ax.cla()
-            self.ax.text(
-                0.5, 0.5,
-                "No Attenuation Loaded",
-                fontsize=24,
-                color='#9f9f9f',
-                ha='center', va='center',
-            )
-            self.ax.set_xticks([])
-            self.ax.set_yticks([])
-            self.ax.set_facecolor('#2b2b2b')
-            self.fig.patch.set_facecolor('#333333')
-            self.canvas.draw()
+        """Coalesce redraw requests: a burst of spinner clicks costs one redraw per Tk idle."""
+        if self.canvas is None:
+            return  # _build_graph draws the current state
+        if not self._graph_redraw_pending:
+            self._graph_redraw_pending = True
+            self.master.after_idle(self._redraw_graph)
+
+    def _on_graph_draw(self, event=None):
+        # Full draws render everything but the animated artists: cache that as the blit background.
+        self._graph_background = self.canvas.copy_from_bbox(self.fig.bbox)
+        self.ax.draw_artist(self.curve_line)
+        self.ax.draw_artist(self.points_line)
+
+    def _redraw_graph(self):
+        self._graph_redraw_pending = False
+        if not len(self.model) or self.graph_display_status in ('no_points', 'no_att_selected'):
+            self._apply_graph_layout(('empty',))
             return
 
         max_x = self.current_max_x
         # Absolute points use literal X; relative points are rescaled from [0,100] to [0,max_x].
-        x_vals = [self._final_x_for_object(pt, max_x) for pt in self.active_points]
-        y_vals = [float(pt.y.get()) for pt in self.active_points]
-        shapes = [display_to_shape[pt.shape_var.get()] for pt in self.active_points]
+        x_vals = self.model.final_x(max_x)
+        y_vals = self.model.y
+        shape_codes = self.model.shapes
         # Extend the chart's X range if any absolute point overshoots max_x.
-        chart_max = max(max_x, max(x_vals)) if x_vals else max_x
-        self.ax.cla()
-
-        selected_display = self.att_var_string.get()
-        selected_type = attenuation_map[selected_display]
-        selected_color = COLOR_MAPPING.get(selected_type, "#000000")
-
-        if selected_type in POSITIVE_CURVES:
-            margin = 5
-            ymin, ymax = 0, 100
-            self.ax.set_ylim(ymin - margin, ymax + margin)
-            self.ax.set_yticks(np.arange(0, 101, 10))
-            y_vals_plot = y_vals
-        else:
-            margin = 0.05
-            ymin, ymax = 0, 1
-            self.ax.set_ylim(ymin - margin, ymax + margin)
-            self.ax.set_yticks(Y_POSITIONS)
-            self.ax.set_yticklabels([str(y) for y in Y_VALUES])
-            y_vals_plot = [y_to_position(y) for y in y_vals]
-
-        for i in range(len(x_vals) - 1):
-            x0, y0 = x_vals[i], y_vals_plot[i]
-            x1, y1 = x_vals[i + 1], y_vals_plot[i + 1]
-            interp = SHAPE_INTERPOLATORS.get(shapes[i], SHAPE_INTERPOLATORS["Linear"])
-            xi, yi = interp(x0, y0, x1, y1)
-            self.ax.plot(xi, yi, marker='', color=selected_color)
-
-        self.ax.plot(x_vals, y_vals_plot, 'o', color=selected_color)
-        self.ax.grid(color='#3a3a3a')
-        self.ax.set_facecolor('#2b2b2b')
-        self.fig.patch.set_facecolor('#333333')
-        if self.selected_att:
-            self.ax.set_title(self.selected_att, color='#c8c3c3')
-
-        # Pad the X range so endpoint markers aren't clipped at the axis edge.
-        pad = chart_max * 0.05
-        self.ax.set_xlim(-pad, chart_max + pad)
-
-        # Explicit ticks so the last tick equals chart_max (matplotlib's auto-ticks round it).
-        xticks = np.linspace(0, chart_max, num=6)
-        self.ax.set_xticks(xticks)
-        self.ax.set_xticklabels([str(int(t)) for t in xticks])
+        chart_max = max(max_x, x_vals.max()) if x_vals.size else max_x
+
+        selected_type = attenuation_map[self.att_var_string.get()]
+        db_axis = selected_type not in POSITIVE_CURVES
+        overlay_mode = OVERLAY_MODES[self.overlay_mode_var.get()]
+        if self.overlay is None or self.overlay[0] != selected_type:
+            overlay_mode = None  # nothing loaded for this curve type (yet)
+        if overlay_mode == "absolute" and self.overlay[1]:
+            chart_max = max(chart_max, max(curve[0][-1] for curve in self.overlay[1]))
+
+        # Whole curve (every segment + dB mapping) sampled in one pass, drawn as one line.
+        curve_x, curve_y = evaluate_curve(x_vals, y_vals, shape_codes, db_axis=db_axis)
+        self.curve_line.set_data(curve_x, curve_y)
+        self.points_line.set_data(x_vals, y_to_positions(y_vals) if db_axis else y_vals)
+
+        overlay_key = (self._overlay_version, overlay_mode, float(max_x))
+        if not self._apply_graph_layout(('curve', selected_type, float(chart_max), self.selected_att, overlay_key)):
+            self._blit_graph()
+
+    def _apply_graph_layout(self, layout):
+        """Rebuild axes decorations when `layout` changed; returns True if a full draw was done."""
+        if layout == self._graph_layout and self._graph_background is not None:
+            return False
+        self._graph_layout = layout
+
+        if layout[0] == 'empty':
+            self.curve_line.set_visible(False)
+            self.points_line.set_visible(False)
+            self.overlay_lines.set_visible(False)
+            self.empty_text.set_visible(True)
+            self.ax.grid(False)
+            self.ax.set_title('')
+            self.ax.set_xticks([])
+            self.ax.set_yticks([])
+            self.canvas.draw()
+            return True
 
+        _, selected_type, chart_max, title, (_, overlay_mode, max_x) = layout
+        selected_color = curve_color(selected_type)
+        self.curve_line.set_color(selected_color)
+        self.points_line.set_color(selected_color)
+        if overlay_mode is None:
+            self.overlay_lines.set_visible(False)
+        else:
+            self.overlay_lines.set_segments(self._overlay_segments(overlay_mode, max_x, selected_type not in POSITIVE_CURVES))
+            self.overlay_lines.set_color(selected_color)
+            self.overlay_lines.set_visible(True)
+        self.curve_line.set_visible(True)
+        self.points_line.set_visible(True)
+        self.empty_text.set_visible(False)
+
+        apply_curve_layout(self.ax, selected_type, chart_max, title)
         self.canvas.draw()
+        return True
 
-    def _final_x_with_overflow(self, point, max_x):
+    def _overlay_segments(self, mode, max_x, db_axis):
+        """One (samples, 2) polyline per overlay curve; relative mode stretches each to the editor's max_x."""
+        segments = []
+        for x, y, shape_codes, target_max_x in self.overlay[1]:
+            if mode == "relative":
+                x = x / (target_max_x or 1.0) * max_x
+            curve_x, curve_y = evaluate_curve(x, y, shape_codes, db_axis=db_axis)
+            segments.append(np.column_stack((curve_x, curve_y)))
+        return segments
+
+    def _blit_graph(self):
+        self.canvas.restore_region(self._graph_background)
+        self.ax.draw_artist(self.curve_line)
+        self.ax.draw_artist(self.points_line)
+        self.canvas.blit(self.fig.bbox)
+
+    def _point_specs(self):
+        """Editor points as plain (ui_x, y, shape_key, is_absolute) tuples, safe to use off the Tk thread."""
+        return self.model.specs()
+
+    def _get_pool(self):
+        if self.pool is None:
+            self.pool = WaapiPool(BATCH_CONCURRENCY)
+        return self.pool
+
+    def _get_batch(self):
+        if self.batch is None:
+            self.batch = BatchApplier(self._get_pool(), self.curve_cache)
+        return self.batch
+
+    def _run_background(self, label, job, on_done):
         """
-        Returns (final_x, overflow) for a point against a target attenuation's max_x.
-            * relative point: final_x = ui_x * max_x / 100, overflow always False.
-            * absolute point: final_x = ui_x, overflow True if ui_x > max_x.
-        Reads from previous_x_value (float) — the entry's :.3f display loses precision
-        that Wwise then rejects on Set.
+        Run job(report, cancel_event) on a worker thread with the progress strip shown.
+        `report(done, total)` may be called from any thread; on_done(result) runs on the
+        Tk thread. Only one job runs at a time.
         """
-        ui_x = point.previous_x_value
-        if point.is_absolute.get():
-            return ui_x, ui_x > max_x
-        return (ui_x / 100.0) * max_x, False
-
-    def _final_x_for_object(self, point, max_x):
-        final_x, _ = self._final_x_with_overflow(point, max_x)
-        return final_x
-
-    def _build_payload_for_object(self, max_x):
-        """Build the WAAPI points payload for a single object."""
-        payload = []
-        for point in self.active_points:
-            real_x = self._final_x_for_object(point, max_x)
-            real_y = point.previous_y_value  # full precision, not the :.3f display
-            shape_key = display_to_shape[point.shape_var.get()]
-            payload.append({"x": real_x, "y": real_y, "shape": shape_key})
-        return payload
+        if self._batch_cancel is not None:
+            return False
+        cancel_event = threading.Event()
+        self._batch_cancel = cancel_event
+        self.progress_bar.set(0)
+        self.progress_label.configure(text=f"{label}...")
+        self.progress_bar.grid(row=0, column=2, sticky="e", padx=(0, 8))
+        self.cancel_button.grid(row=0, column=3, sticky="e", padx=(0, 12))
+        self.get_attenuation_button.configure(state="disabled")
+        self.set_attenuation_button.configure(state="disabled")
+        self.export_button.configure(state="disabled")
+        self.duplicates_button.configure(state="disabled")
+        self.restore_button.configure(state="disabled")
+        self.save_preset_button.configure(state="disabled")
+        # The curve on screen must stay the one of the selected type until the job is over.
+        self.curve_type_combo.configure(state="disabled")
+
+        def report(done, total, phase=label):
+            self._batch_events.put(("progress", phase, done, total))
+
+        def worker():
+            try:
+                self._batch_events.put(("done", on_done, job(report, cancel_event)))
+            except Exception as exc:
+                logger.exception("%s failed", label)
+                self._batch_events.put(("error", label, exc))
+
+        threading.Thread(target=worker, name="attenuation-batch", daemon=True).start()
+        self.master.after(50, self._poll_background)
+        return True
+
+    def _poll_background(self):
+        finished = None
+        while True:
+            try:
+                event = self._batch_events.get_nowait()
+            except queue.Empty:
+                break
+            if event[0] == "progress":
+                _, label, done, total = event
+                self.progress_bar.set(done / total if total else 1)
+                self.progress_label.configure(text=f"{label}: {done}/{total}")
+            else:
+                finished = event
+        if finished is None:
+            self.master.after(50, self._poll_background)
+            return
+
+        self._batch_cancel = None
+        self.progress_bar.grid_forget()
+        self.cancel_button.grid_forget()
+        self.get_attenuation_button.configure(state="normal")
+        self.set_attenuation_button.configure(state="normal")
+        self.export_button.configure(state="normal")
+        self.duplicates_button.configure(state="normal")
+        self.restore_button.configure(state="normal")
+        self.save_preset_button.configure(state="normal")
+        self.curve_type_combo.configure(state="readonly")
+        if finished[0] == "done":
+            _, on_done, result = finished
+            on_done(result)
+        else:
+            _, label, exc = finished
+            self.progress_label.configure(text=f"{label} failed")
+            mb.showerror("Batch failed", f"{label} failed: {exc}", parent=self.master)
+
+    def cancel_batch(self):
+        if self._batch_cancel is not None:
+            self._batch_cancel.set()
+            self.progress_label.configure(text="Cancelling...")
 
     def _apply_to_objects(self, objects):
-        """Send setAttenuationCurve for each object."""
+        """
+        Send setAttenuationCurve for each object, pipelined on the pool off the Tk thread.
+        All or nothing, see batch_apply.BatchApplier.apply.
+        """
+        curve_type = attenuation_map[self.att_var_string.get()]
+        # Editor state is read here, before the worker starts.
+        specs = self._point_specs()
+        source_id = self.source_att_id if self.all_curves_var.get() else None
+        skip_unchanged = self.skip_unchanged_var.get()
+        project = str(self.project_name)
+
+        def job(report, cancel_event):
+            batch = self._get_batch()
+            # curve type -> (use, specs); the edited curve always comes from the editor.
+            curves = {}
+            if source_id is not None:
+                curves = batch.source_curves(source_id, report, cancel_event)
+            curves[curve_type] = ("Custom", specs)
+            return batch.apply(build_calls(objects, curves), skip_unchanged, project, report, cancel_event)
+
+        self._run_background("Applying", job, self._report_apply_results)
+
+    def save_preset(self):
+        """Save the edited curve (plus the Get source's other curves with All curve types) as a preset."""
+        if not len(self.model):
+            mb.showinfo("Nothing to save", "Get an attenuation first.", parent=self.master)
+            return
+        path = filedialog.asksaveasfilename(
+            parent=self.master,
+            title="Save curve preset",
+            defaultextension=".json",
+            filetypes=[("Curve preset", "*.json")],
+            initialfile=f"{self.selected_att or 'curve'}_preset.json",
+        )
+        if not path:
+            return
         curve_type = attenuation_map[self.att_var_string.get()]
-        for obj in objects:
-            obj_id = obj['id']
-            max_x = self.max_x_values.get(obj_id, 100)
-            args = {
-                "object": obj_id,
-                "curveType": curve_type,
-                "use": "Custom",
-                "points": self._build_payload_for_object(max_x),
-            }
-            self.client.call("ak.wwise.core.object.setAttenuationCurve", args)
-
-    def _check_object_conflict(self, obj):
+        specs = self._point_specs()
+        source_id = self.source_att_id if self.all_curves_var.get() else None
+        name = Path(path).stem
+
+        def job(report, cancel_event):
+            # Same curves as _apply_to_objects would send.
+            curves = {}
+            if source_id is not None:
+                curves = self._get_batch().source_curves(source_id, report, cancel_event)
+            curves[curve_type] = ("Custom", specs)
+            save_preset(path, curves, name)
+            return path, len(curves)
+
+        self._run_background("Saving preset", job, self._report_preset_saved)
+
+    def _report_preset_saved(self, result):
+        path, count = result
+        self.progress_label.configure(text=f"Saved {count} curves to {Path(path).name}")
+
+    def _report_apply_results(self, outcome):
+        results = outcome.results
+        # Our own writes make the cached curves stale, whatever the outcome.
+        for r in results:
+            self.curve_cache.invalidate(r.key['id'], r.key['curveType'])
+        failed = [r for r in results if not r.ok and r.error != "Cancelled"]
+        cancelled = sum(1 for r in results if r.error == "Cancelled")
+        if outcome.rollback is None:
+            # Counts are setAttenuationCurve calls: with All curve types one attenuation takes several.
+            attenuations = len({r.key['id'] for r in results})
+            summary = f"Applied {len(results)} curves to {attenuations} attenuations"
+            if outcome.skipped:
+                summary += f", {outcome.skipped} curves already up to date"
+            self.progress_label.configure(text=summary)
+            logger.info("%s (snapshot %s)", summary, outcome.snapshot_path)
+            return
+
+        not_restored = [r for r in outcome.rollback if not r.ok]
+        if not not_restored:
+            summary = (f"Rolled back ({len(failed)} curves failed in {len({r.key['id'] for r in failed})} "
+                       f"attenuations, {cancelled} cancelled): nothing was changed")
+        else:
+            summary = f"Rollback incomplete: {len(not_restored)} curves not restored"
+        self.progress_label.configure(text=summary)
+        logger.warning(summary)
+        if not_restored:
+            mb.showerror(
+                "Rollback incomplete",
+                f"{summary}. Use Restore... with the snapshot\n{outcome.snapshot_path}\n"
+                "to put them back once Wwise responds.\n\n" + self._failure_lines(not_restored),
+                parent=self.master,
+            )
+        elif failed:
+            mb.showwarning("Apply rolled back", summary + "\n\n" + self._failure_lines(failed), parent=self.master)
+
+    @staticmethod
+    def _failure_lines(failed):
+        """Bulleted "name (curve type): error" list of failed CallResults, capped at MAX_LIST."""
+        MAX_LIST = 20
+        lines = [
+            f"  • {r.key.get('name', r.key['id'])} ({r.key['curveType']}): {r.error}"
+            for r in failed[:MAX_LIST]
+        ]
+        if len(failed) > MAX_LIST:
+            lines.append(f"  ... and {len(failed) - MAX_LIST} more")
+        return "\n".join(lines)
+
+    def restore_snapshot(self):
+        """Write back every curve of a snapshot saved by a previous Set (see snapshots.py)."""
+        if self.client is None:
+            mb.showerror("Connection error", "Cannot reach Wwise. Make sure it's running with WAAPI enabled.",
+                         parent=self.master)
+            return
+        path = filedialog.askopenfilename(
+            parent=self.master,
+            title="Restore attenuation snapshot",
+            initialdir=SNAPSHOT_DIR if SNAPSHOT_DIR.is_dir() else None,
+            filetypes=[("Attenuation snapshot", "*.json")],
+        )
+        if not path:
+            return
+        try:
+            snapshot = load_snapshot(path)
+        except SnapshotError as exc:
+            mb.showerror("Invalid snapshot", str(exc), parent=self.master)
+            return
+        taken = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(snapshot.get("created", 0)))
+        message = f"Put {len(snapshot['curves'])} curves back as they were before the Set of {taken}?"
+        if snapshot.get("project") and snapshot["project"] != str(self.project_name):
+            message += f"\n\nThe snapshot was taken in project {snapshot['project']}."
+        if not mb.askyesno("Restore snapshot", message, parent=self.master):
+            return
+
+        def job(report, cancel_event):
+            return self._get_batch().restore(snapshot["curves"], report, cancel_event)
+
+        self._run_background("Restoring", job, self._report_restore_results)
+
+    def _report_restore_results(self, results):
+        for r in results:
+            self.curve_cache.invalidate(r.key['id'], r.key['curveType'])
+        failed = [r for r in results if not r.ok and r.error != "Cancelled"]
+        restored = sum(1 for r in results if r.ok)
+        summary = f"Restored {restored}/{len(results)}"
+        if failed:
+            summary += f", {len(failed)} failed"
+        self.progress_label.configure(text=summary)
+        logger.info(summary)
+        if failed:
+            mb.showwarning("Some curves failed", summary + "\n\n" + self._failure_lines(failed), parent=self.master)
+
+    def export_project(self):
+        """Export every attenuation's curves to an .npz file; re-exporting to the same file is incremental."""
+        if self.client is None:
+            mb.showerror("Connection error", "Cannot reach Wwise. Make sure it's running with WAAPI enabled.",
+                         parent=self.master)
+            return
+        path = filedialog.asksaveasfilename(
+            parent=self.master,
+            title="Export attenuation curves",
+            defaultextension=".npz",
+            filetypes=[("NumPy archive", "*.npz")],
+            initialfile=f"{self.project_name or 'attenuations'}_curves.npz",
+            confirmoverwrite=False,  # an existing export is updated, not replaced
+        )
+        if not path:
+            return
+        pool = self._get_pool()
+        project = str(self.project_name)
+
+        def job(report, cancel_event):
+            return export_curves(path, pool, project, report=lambda done, total: report(done, total, "Exporting"),
+                                 cancel_event=cancel_event)
+
+        self._run_background("Exporting", job, self._report_export_result)
+
+    def _report_export_result(self, result):
+        summary = f"Exported {result.objects} ({result.fetched} fetched, {result.reused} unchanged)"
+        if result.cancelled:
+            summary += f", {result.cancelled} cancelled"
+        if result.failed:
+            summary += f", {len(result.failed)} failed"
+        self.progress_label.configure(text=summary)
+        if result.failed:
+            MAX_LIST = 20
+            lines = [f"  • {name}: {error}" for name, error in result.failed[:MAX_LIST]]
+            if len(result.failed) > MAX_LIST:
+                lines.append(f"  ... and {len(result.failed) - MAX_LIST} more")
+            mb.showwarning("Some attenuations failed", summary + "\n\n" + "\n".join(lines),
+                           parent=self.master)
+
+    def find_duplicate_attenuations(self):
+        """List attenuations of an export file (Export...) that are identical or within tolerance of each other."""
+        path = filedialog.askopenfilename(
+            parent=self.master,
+            title="Find duplicate attenuations in export",
+            filetypes=[("NumPy archive", "*.npz")],
+        )
+        if not path:
+            return
+
+        def job(report, cancel_event):
+            table = CurveTable.load(path)
+            if table is None:
+                raise ValueError(f"{Path(path).name} is not an attenuation export")
+            return table, find_duplicates(table)
+
+        self._run_background("Finding duplicates", job, self._show_duplicates)
+
+    def _show_duplicates(self, result):
+        table, groups = result
+        exact = sum(1 for group in groups if group.exact)
+        self.progress_label.configure(text=f"{exact} identical, {len(groups) - exact} similar groups")
+        window = ctk.CTkToplevel(self.master)
+        window.title(f"Duplicate attenuations - {table.project}")
+        window.attributes("-topmost", True)
+        text = ctk.CTkTextbox(window, width=640, height=420)
+        text.pack(fill="both", expand=True, padx=10, pady=10)
+        text.insert("1.0", format_report(table, groups))
+        text.configure(state="disabled")
+
+    def _check_object_conflicts(self, objects):
+        """
+        Vectorized pre-flight over every target (see batch_apply.find_conflicts).
+        Returns (valid_objects, conflict_labels); each label names the object and its worst overflow.
         """
-        Returns True if applying the curve to this object would produce a conflict:
-            * an absolute point exceeds the object's max_x, or
-            * the resulting X sequence is not strictly increasing.
+        valid_objects, conflicts = find_conflicts([self._point_specs()], objects)
+        return valid_objects, [f"{obj.get('name', 'Unknown')} ({reason})" for obj, reason in conflicts]
+
+    def _current_targets(self):
+        """
+        Attenuations Set would write, as (targets, query, users): the target box query if any,
+        else the Wwise selection. `users` counts selected sounds/containers that stand for
+        their Attenuation ShareSet (shared ones are returned once).
         """
-        max_x = self.max_x_values.get(obj['id'], 100)
-        final_xs = []
-        for point in self.active_points:
-            final_x, overflow = self._final_x_with_overflow(point, max_x)
-            if overflow:
-                return True
-            final_xs.append(final_x)
-        return any(final_xs[i] >= final_xs[i + 1] for i in range(len(final_xs) - 1))
+        query = self.target_query_entry.get().strip()
+        if query:
+            return resolve_targets(self.client, query), query, 0
+        selection = selected_objects(self.client)
+        users = sum(1 for obj in selection if obj.get('type') != 'Attenuation' and referenced_attenuation_id(obj))
+        return attenuations_of(self.client, selection), query, users
 
     def set_attenuation(self):
         if self.client is None:
@@ -824,27 +1076,36 @@ class AttenuationCurveEditor:
                          parent=self.master)
             return
         try:
-            self._load_max_x_values()
-            selected = self.client.call(
-                "ak.wwise.ui.getSelectedObjects",
-                {},
-                options={"return": ["id", "name"]},
-            )['objects']
+            # One read feeds both the conflict check and the apply, so they see the same targets.
+            selected, query, users = self._current_targets()
+            if query:
+                if not selected:
+                    mb.showinfo("No targets", f"No attenuations match {query}", parent=self.master)
+                    return
+                if not mb.askyesno("Confirm targets", f"Apply the curve to {len(selected)} attenuations "
+                                   f"matching {query}?", parent=self.master):
+                    return
+            else:
+                if not selected:
+                    mb.showinfo("No targets", "The selection has no attenuations and uses none.",
+                                parent=self.master)
+                    return
+                if users and not mb.askyesno(
+                        "Confirm targets",
+                        f"The {users} selected sounds/containers use {len(selected)} attenuations "
+                        f"(shared ones count once). Apply the curve to them?", parent=self.master):
+                    return
 
             # Pre-flight: split into valid vs conflicting
-            valid_objects = []
-            conflict_names = []
-            for obj in selected:
-                if self._check_object_conflict(obj):
-                    conflict_names.append(obj.get('name', 'Unknown'))
-                else:
-                    valid_objects.append(obj)
+            valid_objects, conflict_names = self._check_object_conflicts(selected)
 
             if conflict_names:
                 self._show_conflict_modal(conflict_names, valid_objects, len(selected))
             else:
                 self._apply_to_objects(selected)
 
+        except TargetQueryError as exc:
+            mb.showerror("Invalid target query", str(exc), parent=self.master)
         except Exception:
             logger.exception("Failed to apply attenuation curve")
             mb.showerror("Connection error", "Cannot reach Wwise. Make sure it's running with WAAPI enabled.",
@@ -895,42 +1156,51 @@ class AttenuationCurveEditor:
                 self.hide_controls()
                 return
             first_object = selected[0]
-            first_object_id = first_object['id']
-            first_object_name = first_object.get('name', 'Unknown')
-            self.selected_att = first_object_name
-            for pt in self.active_points:
-                pt.grid_forget()
-            self.active_points.clear()
-            get_args = {"object": first_object_id, "curveType": attenuation_map[self.att_var_string.get()]}
-            get_att = self.client.call("ak.wwise.core.object.getAttenuationCurve", get_args)
-            points = get_att.get('points', [])
-
-            if len(points) > self.MAX_ROWS:
-                mb.showwarning(
-                    "Too many points",
-                    f"Curve has {len(points)} points, but the maximum supported is {self.MAX_ROWS}."
-                )
-                self.hide_controls()
-                self.graph_display_status = 'no_points'
-                self.update_graph()
-                return
+            self.selected_att = first_object.get('name', 'Unknown')
+            self.source_att_id = first_object['id']
+            self._ensure_graph()
+            self._load_curve(self.source_att_id, attenuation_map[self.att_var_string.get()])
+            self._prefetch_curves(self.source_att_id)
+        except Exception:
+            logger.exception("Failed to read attenuation curve")
+            mb.showerror(
+                "Read failed",
+                "Couldn't read the attenuation curve. Check the selected object and WAAPI connection.",
+                parent=self.master,
+            )
 
-            if points:
-                # Normalize the loaded curve's X to fill the UI's 0-100 range so the
-                # locked endpoints land at 0 and 100. Set scales 100 back to RadiusMax.
-                max_x_value = max(p['x'] for p in points)
-                self.current_max_x = max_x_value
-                for p in points:
-                    scaled_x = (p['x'] / max_x_value) * 100
-                    new_point = self._create_point(scaled_x, p['y'])
-                    new_point.shape_var.set(shape_display_map[p.get('shape', 'Linear')])
-                self.graph_display_status = 'points'
-                self.show_controls()
-            else:
-                self.graph_display_status = 'no_points'
-                self.hide_controls()
-            self.update_graph()
-            self.sort_points()  # also re-applies endpoint visibility (hides Delete on first/last)
+    def _fetch_curve(self, object_id, curve_type):
+        """getAttenuationCurve result for one curve, from the cache when possible."""
+        curve = self.curve_cache.get(object_id, curve_type)
+        if curve is None:
+            get_args = {"object": object_id, "curveType": curve_type}
+            curve = self.client.call("ak.wwise.core.object.getAttenuationCurve", get_args)
+            self.curve_cache.put(object_id, curve_type, curve)
+        return curve
+
+    def _prefetch_curves(self, object_id):
+        """Warm the cache with every curve type of `object_id` in the background."""
+        missing = [ct for ct in attenuation_map.values() if self.curve_cache.get(object_id, ct) is None]
+        if not missing:
+            return
+        calls = [(ct, {"object": object_id, "curveType": ct}) for ct in missing]
+
+        def prefetch():
+            try:
+                for result in self._get_pool().call_many("ak.wwise.core.object.getAttenuationCurve", calls):
+                    if result.ok:
+                        self.curve_cache.put(object_id, result.key, result.result)
+            except Exception:
+                logger.exception("Curve prefetch failed")
+
+        threading.Thread(target=prefetch, name="curve-prefetch", daemon=True).start()
+
+    def _on_curve_type_changed(self, _value=None):
+        # Re-show the Get source's curve of the new type; instant once the prefetch has landed.
+        if self.source_att_id is None or self.client is None or self._batch_cancel is not None:
+            return
+        try:
+            self._load_curve(self.source_att_id, attenuation_map[self.att_var_string.get()])
         except Exception:
             logger.exception("Failed to read attenuation curve")
             mb.showerror(
@@ -938,8 +1208,92 @@ class AttenuationCurveEditor:
                 "Couldn't read the attenuation curve. Check the selected object and WAAPI connection.",
                 parent=self.master,
             )
+            return
+        if self.overlay_targets:
+            self._load_overlay()
+
+    def _on_overlay_mode_changed(self, choice):
+        """Any overlay choice re-reads the Set targets (cache first), so picking it again after a Set refreshes it."""
+        if OVERLAY_MODES[choice] is None or self.client is None:
+            self.overlay_mode_var.set("No overlay")
+            self.overlay_targets = []
+            self.overlay = None
+            self._overlay_version += 1
+            self.update_graph()
+            return
+        try:
+            targets, query, _ = self._current_targets()
+        except TargetQueryError as exc:
+            mb.showerror("Invalid target query", str(exc), parent=self.master)
+            return
+        except Exception:
+            logger.exception("Failed to read overlay targets")
+            mb.showerror("Connection error", "Cannot reach Wwise. Make sure it's running with WAAPI enabled.",
+                         parent=self.master)
+            return
+        if not targets:
+            mb.showinfo("No targets", f"No attenuations match {query}" if query else
+                        "The selection has no attenuations and uses none.", parent=self.master)
+            self._on_overlay_mode_changed("No overlay")
+            return
+        self.overlay_targets = targets
+        self._load_overlay()
+
+    def _load_overlay(self):
+        """Read overlay_targets' curves of the current type (cache first) in the background."""
+        curve_type = attenuation_map[self.att_var_string.get()]
+        targets = self.overlay_targets
+
+        def job(report, cancel_event):
+            curves = self._get_batch().read_curves([(obj['id'], curve_type) for obj in targets], report, cancel_event)
+            overlay = []
+            for obj in targets:
+                curve = curves.get((obj['id'], curve_type))
+                # Unused and linked (UseVolumeDry...) curves have nothing of their own to draw.
+                if curve and curve.get('use') == 'Custom' and curve.get('points'):
+                    overlay.append((*points_to_arrays(curve['points']), float(radius_max(obj))))
+            return curve_type, overlay
+
+        self._run_background("Loading overlay", job, self._show_overlay)
+
+    def _show_overlay(self, overlay):
+        self.overlay = overlay
+        self._overlay_version += 1
+        drawn = len(overlay[1])
+        summary = f"Overlay: {drawn} curves"
+        if drawn < len(self.overlay_targets):
+            summary += f", {len(self.overlay_targets) - drawn} without a custom {overlay[0]}"
+        self.progress_label.configure(text=summary)
+        self.update_graph()
+
+    def _on_curve_changed(self, *args, **kwargs):
+        # WAAPI event thread: only touches the (locked) cache.
+        obj = kwargs.get('object') or {}
+        if obj.get('id'):
+            self.curve_cache.invalidate(obj['id'], kwargs.get('curveType'))
+
+    def _load_curve(self, object_id, curve_type):
+        points = self._fetch_curve(object_id, curve_type).get('points', [])
+        self.first_point = 0
+        if points:
+            # Normalize the loaded curve's X to fill the UI's 0-100 range so the
+            # locked endpoints land at 0 and 100. Set scales 100 back to RadiusMax.
+            self.model, self.current_max_x = CurveModel.from_points(points)
+            self.graph_display_status = 'points'
+            self.show_controls()
+        else:
+            self.model = CurveModel()
+            self.graph_display_status = 'no_points'
+            self.hide_controls()
+        self.refresh_points()  # also re-applies endpoint visibility (hides Delete on first/last)
+        self.update_graph()
 
     def close_connection(self):
+        self.cancel_batch()
+        if self.pool is not None:
+            self.pool.close()
+            self.pool = None
+            self.batch = None
         if self.client is None:
             return
         try:
@@ -950,6 +1304,7 @@ class AttenuationCurveEditor:
 
 def main():
     setup_logging()
+    logger.debug("Startup imports took %.0f ms", IMPORT_SECONDS * 1000)
     app = ctk.CTk()
     app.resizable(False, False)
     app.attributes("-topmost", True)
@@ -959,7 +1314,6 @@ def main():
 
     def on_closing():
         editor.close_connection()
-        plt.close('all')
         app.quit()
         app.after(50, app.destroy)
 
@@ -0,0 +1,274 @@
+"""Batch apply of curves to many attenuations, without any widgets.
+
+Shared by the editor's Set and the command line (batch_cli.py). A curve to apply is
+given as specs: (ui_x, y, shape_key, is_absolute) per point, ui_x in percent of the
+target's RadiusMax for relative points and literal distance for absolute ones. A set
+of curves is {curveType: (use, specs)}.
+
+BatchApplier.apply is all or nothing: the targets' current curves are snapshotted
+(see snapshots.py), the writes run in one Wwise undo group, and everything written
+is put back if any write fails or the batch is cancelled.
+"""
+import logging
+import threading
+
+import numpy as np
+
+from curves import attenuation_map, check_conflicts, curve_matches
+from snapshots import SNAPSHOT_DIR, restore_calls, save_snapshot, snapshot_entry
+from waapi_batch import CallResult
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+UNDO_GROUP_NAME = "Attenuation Batch Edit"
+# Specs of a curve whose use is a link (UseVolumeDry...): Wwise ignores the points but still wants
+# two, and presets need endpoints at 0 and 100 (see snapshots.restore_calls for the same rule).
+LINKED_CURVE_SPECS = [(0.0, 0.0, "Linear", False), (100.0, 0.0, "Linear", False)]
+
+
+def radius_max(obj):
+    # max_x = the attenuation's RadiusMax: every curve's X domain is [0, RadiusMax],
+    # and Wwise rejects a Set whose last endpoint X != RadiusMax ("invalid endpoints").
+    return obj.get('@RadiusMax', 100)
+
+
+def specs_payload(specs, max_x):
+    """WAAPI points payload of `specs` for a target whose RadiusMax is max_x."""
+    return [
+        {"x": ui_x if is_absolute else (ui_x / 100.0) * max_x, "y": y, "shape": shape_key}
+        for ui_x, y, shape_key, is_absolute in specs
+    ]
+
+
+def relative_specs(points):
+    """Fetched WAAPI points -> relative specs, X normalized to 0-100 like Get does."""
+    max_x_value = max((p['x'] for p in points), default=0) or 1.0
+    return [
+        ((p['x'] / max_x_value) * 100, p['y'], p.get('shape', 'Linear'), False)
+        for p in points
+    ]
+
+
+def find_conflicts(specs_list, objects):
+    """
+    Vectorized pre-flight of every curve in `specs_list` against every target (see
+    curves.check_conflicts). Returns (valid_objects, conflicts); conflicts holds
+    (object, reason) for targets where any of the curves conflicts.
+    """
+    max_xs = [radius_max(obj) for obj in objects]
+    conflicts = np.zeros(len(objects), dtype=bool)
+    worst_overflow = np.zeros(len(objects))
+    for specs in specs_list:
+        curve_conflicts, curve_overflow = check_conflicts([s[0] for s in specs], [s[3] for s in specs], max_xs)
+        conflicts |= curve_conflicts
+        worst_overflow = np.maximum(worst_overflow, curve_overflow)
+
+    valid_objects = []
+    conflicting = []
+    for obj, conflict, overflow in zip(objects, conflicts.tolist(), worst_overflow.tolist()):
+        if not conflict:
+            valid_objects.append(obj)
+        elif overflow > 0:
+            conflicting.append((obj, f"absolute point {overflow:.3f} past max"))
+        else:
+            conflicting.append((obj, "points out of order"))
+    return valid_objects, conflicting
+
+
+def build_calls(objects, curves):
+    """setAttenuationCurve (key, args) per target and curve type; keys are the target dicts plus curveType."""
+    calls = []
+    for obj in objects:
+        max_x = radius_max(obj)
+        for curve_type, (use, specs) in curves.items():
+            args = {
+                "object": obj['id'],
+                "curveType": curve_type,
+                "use": use,
+                "points": specs_payload(specs, max_x),
+            }
+            calls.append((dict(obj, curveType=curve_type), args))
+    return calls
+
+
+def drop_unchanged(calls, current):
+    """
+    Drop setAttenuationCurve calls whose target already holds the payload; returns (calls, skipped).
+    `current` maps (object id, curveType) to the target's curve, as read by read_curves.
+    """
+    remaining = [
+        (key, args) for key, args in calls
+        if not curve_matches(current.get((args['object'], args['curveType'])), args['use'], args['points'])
+    ]
+    return remaining, len(calls) - len(remaining)
+
+
+def _no_report(done, total, phase=None):
+    pass
+
+
+class CurveCache:
+    """(object id, curveType) -> getAttenuationCurve result. Locked: filled from worker threads."""
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, object_id, curve_type):
+        with self._lock:
+            return self._entries.get((object_id, curve_type))
+
+    def put(self, object_id, curve_type, curve):
+        if curve is None:
+            return
+        with self._lock:
+            self._entries[(object_id, curve_type)] = curve
+
+    def invalidate(self, object_id, curve_type=None):
+        """Drop one curve, or every curve of `object_id` when curve_type is None."""
+        with self._lock:
+            if curve_type is not None:
+                self._entries.pop((object_id, curve_type), None)
+            else:
+                for key in [k for k in self._entries if k[0] == object_id]:
+                    del self._entries[key]
+
+
+class ApplyOutcome:
+    """Result of a batch apply."""
+    __slots__ = ("results", "skipped", "rollback", "snapshot_path")
+
+    def __init__(self, results, skipped=0, rollback=None, snapshot_path=None):
+        self.results = results  # CallResults of the writes
+        self.skipped = skipped  # writes dropped because the target already matched
+        self.rollback = rollback  # CallResults of the rollback writes, None if nothing was rolled back
+        self.snapshot_path = snapshot_path
+
+
+class BatchApplier:
+    """
+    Reads and writes curves over a WaapiPool. `cache` (a CurveCache) is optional; reads
+    fill it and use it unless refreshed. `report(done, total, phase)` arguments receive
+    progress from pool threads.
+    """
+
+    def __init__(self, pool, cache=None, snapshot_dir=SNAPSHOT_DIR):
+        self.pool = pool
+        self.cache = cache if cache is not None else CurveCache()
+        self.snapshot_dir = snapshot_dir
+
+    def read_curves(self, pairs, report=_no_report, cancel_event=None, refresh=False):
+        """
+        (object id, curveType) pairs -> {pair: getAttenuationCurve result}, cached or fetched
+        in parallel (always fetched with refresh). Pairs that couldn't be read map to None.
+        """
+        curves = {}
+        calls = []
+        for pair in dict.fromkeys(pairs):
+            cached = None if refresh else self.cache.get(*pair)
+            if cached is None:
+                calls.append((pair, {"object": pair[0], "curveType": pair[1]}))
+            else:
+                curves[pair] = cached
+        results = self.pool.call_many(
+            "ak.wwise.core.object.getAttenuationCurve", calls,
+            on_progress=lambda done, total: report(done, total, "Reading curves"),
+            cancel_event=cancel_event,
+        )
+        for r in results:
+            if r.ok:
+                self.cache.put(*r.key, r.result)
+            curves[r.key] = r.result
+        return curves
+
+    def read_all_curves(self, object_id, report=_no_report, cancel_event=None):
+        """Every curve type of one attenuation: {curveType: curve}. Raises if one can't be read."""
+        curves = self.read_curves([(object_id, ct) for ct in attenuation_map.values()], report, cancel_event)
+        for (_, curve_type), curve in curves.items():
+            if curve is None:
+                raise RuntimeError(f"Could not read {curve_type} from the source attenuation")
+        return {curve_type: curve for (_, curve_type), curve in curves.items()}
+
+    def source_curves(self, object_id, report=_no_report, cancel_event=None):
+        """
+        Every used curve of attenuation `object_id` as {curveType: (use, relative specs)};
+        linked curves get LINKED_CURVE_SPECS, whatever points Wwise returned for them.
+        """
+        return {
+            curve_type: (curve['use'], relative_specs(curve.get('points', []))
+                         if curve['use'] == 'Custom' else LINKED_CURVE_SPECS)
+            for curve_type, curve in self.read_all_curves(object_id, report, cancel_event).items()
+            if curve.get('use', 'None') != 'None'
+        }
+
+    def apply(self, calls, skip_unchanged=True, project="", report=_no_report, cancel_event=None):
+        """
+        Run setAttenuationCurve `calls` (see build_calls) as one transaction; returns an ApplyOutcome.
+        Raises, with nothing written, if a target curve can't be read for the snapshot.
+        """
+        # Snapshot read straight from Wwise: the cache may lag behind edits made a moment ago.
+        current = self.read_curves([(args['object'], args['curveType']) for _, args in calls],
+                                   report, cancel_event, refresh=True)
+        if cancel_event is not None and cancel_event.is_set():
+            return ApplyOutcome([CallResult(key, error="Cancelled") for key, _ in calls], rollback=[])
+        unreadable = [key for key, args in calls if current[(args['object'], args['curveType'])] is None]
+        if unreadable:
+            names = ", ".join(f"{key.get('name', key['id'])} ({key['curveType']})" for key in unreadable[:5])
+            raise RuntimeError(f"Could not read {len(unreadable)} target curves for the rollback "
+                               f"snapshot ({names}); nothing was written")
+
+        skipped = 0
+        if skip_unchanged:
+            calls, skipped = drop_unchanged(calls, current)
+        if not calls:
+            return ApplyOutcome([], skipped)
+        snapshot = [snapshot_entry(key, args['curveType'], current[(args['object'], args['curveType'])])
+                    for key, args in calls]
+        snapshot_path = save_snapshot(snapshot, project, self.snapshot_dir)
+        return self._write_transaction(calls, snapshot, skipped, snapshot_path, report, cancel_event)
+
+    def restore(self, entries, report=_no_report, cancel_event=None):
+        """Write snapshot `entries` back as one undo step; returns the CallResults."""
+        grouped = self._undo_group("ak.wwise.core.undo.beginGroup", {})
+        try:
+            return self.pool.call_many(
+                "ak.wwise.core.object.setAttenuationCurve", restore_calls(entries),
+                on_progress=lambda done, total: report(done, total, "Restoring"),
+                cancel_event=cancel_event,
+            )
+        finally:
+            if grouped:
+                self._undo_group("ak.wwise.core.undo.endGroup", {"displayName": f"{UNDO_GROUP_NAME} (restore)"})
+
+    def _undo_group(self, uri, args):
+        """begin/endGroup of the Wwise undo history; False if Wwise refused (the batch still runs)."""
+        result, = self.pool.call_many(uri, [(uri, args)])
+        if not result.ok:
+            logger.warning("%s failed: %s", uri, result.error)
+        return result.ok
+
+    def _write_transaction(self, calls, snapshot, skipped, snapshot_path, report, cancel_event):
+        """
+        Write `calls` as one Wwise undo step; if any write fails or is cancelled, write
+        `snapshot` (entries in the same order as calls) back over every attempted target.
+        """
+        grouped = self._undo_group("ak.wwise.core.undo.beginGroup", {})
+        try:
+            results = self.pool.call_many(
+                "ak.wwise.core.object.setAttenuationCurve", calls,
+                on_progress=lambda done, total: report(done, total, "Applying"),
+                cancel_event=cancel_event,
+            )
+            if all(r.ok for r in results):
+                return ApplyOutcome(results, skipped, snapshot_path=snapshot_path)
+            # A failed call may still have reached Wwise, so only never-started ones are left alone.
+            attempted = [entry for entry, r in zip(snapshot, results) if r.error != "Cancelled"]
+            rollback = self.pool.call_many(
+                "ak.wwise.core.object.setAttenuationCurve", restore_calls(attempted),
+                on_progress=lambda done, total: report(done, total, "Rolling back"),
+            )
+            return ApplyOutcome(results, skipped, rollback, snapshot_path)
+        finally:
+            if grouped:
+                self._undo_group("ak.wwise.core.undo.endGroup", {"displayName": UNDO_GROUP_NAME})
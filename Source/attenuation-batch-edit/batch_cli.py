@@ -0,0 +1,152 @@
+"""Apply a curve preset to many attenuations without the GUI.
+
+    python batch_cli.py PRESET.json --waql '$ from type Attenuation where name : "Weapon"'
+    python batch_cli.py PRESET.json --match "Footstep_*" --report report.json
+    python batch_cli.py PRESET.json --ids {...} {...} --dry-run
+
+Run from this folder with Wwise open. PRESET.json is saved by Save preset... in the
+editor (see presets.py). Targets resolve like the editor's target box (targets.py):
+ids and WAQL results that are sounds or containers stand for the Attenuation they use.
+The preset goes through the same conflict check, RadiusMax scaling and all-or-nothing
+apply as Set (batch_apply.py). A JSON report is printed, or written with --report;
+progress goes to stderr.
+
+Exit codes: 0 every target applied (or would be, with --dry-run); 3 the same, but
+conflicting targets were skipped (--skip-conflicts) and are listed under "conflicts";
+2 the preset can't be used; 1 anything else (nothing applied, or rolled back).
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+
+from waapi import WaapiClient
+
+from batch_apply import BatchApplier, build_calls, find_conflicts, radius_max
+from presets import PresetError, load_preset
+from targets import TargetQueryError, is_waql, resolve_ids, resolve_targets
+from waapi_batch import DEFAULT_CONCURRENCY, WaapiPool
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+BATCH_CONCURRENCY = int(os.environ.get("WAAPI_CONCURRENCY", DEFAULT_CONCURRENCY))
+EXIT_CONFLICTS_SKIPPED = 3
+
+
+def _target_entry(obj, **fields):
+    return dict({"id": obj["id"], "name": obj.get("name", ""), "radiusMax": radius_max(obj)}, **fields)
+
+
+def _call_entry(result):
+    return {"id": result.key["id"], "name": result.key.get("name", ""), "curveType": result.key["curveType"],
+            "error": result.error}
+
+
+def resolve(client, args):
+    if args.ids:
+        return resolve_ids(client, args.ids)
+    if args.waql:
+        return resolve_targets(client, args.waql if is_waql(args.waql) else "$ " + args.waql)
+    return resolve_targets(client, args.match)
+
+
+def run(args, report):
+    """Resolve, check and apply; fills the `report` dict and returns the exit code."""
+    name, curves = load_preset(args.preset)
+    report.update(preset=name or args.preset, curveTypes=list(curves))
+
+    client = WaapiClient()
+    pool = WaapiPool(BATCH_CONCURRENCY)
+    try:
+        report["project"] = project = client.call("ak.wwise.core.getProjectInfo")["name"]
+        targets = resolve(client, args)
+        valid, conflicts = find_conflicts([specs for _, specs in curves.values()], targets)
+        report["targets"] = [_target_entry(obj) for obj in valid]
+        report["conflicts"] = [_target_entry(obj, reason=reason) for obj, reason in conflicts]
+        if not targets:
+            report["status"] = "no targets"
+            return 1
+        if conflicts and not args.skip_conflicts:
+            report["status"] = "conflicts"
+            return 1
+        if not valid:
+            report["status"] = "no valid targets"
+            return 1
+        if args.dry_run:
+            report["status"] = "dry run, conflicts skipped" if conflicts else "dry run"
+            return EXIT_CONFLICTS_SKIPPED if conflicts else 0
+
+        def progress(done, total, phase):
+            sys.stderr.write(f"\r{phase} {done}/{total}   ")
+            sys.stderr.flush()
+
+        outcome = BatchApplier(pool).apply(build_calls(valid, curves), not args.no_skip_unchanged,
+                                           project, progress)
+        sys.stderr.write("\n")
+    finally:
+        pool.close()
+        client.disconnect()
+
+    failed = [r for r in outcome.results if not r.ok]
+    report.update(
+        applied=sum(1 for r in outcome.results if r.ok),
+        skipped=outcome.skipped,
+        failed=[_call_entry(r) for r in failed],
+        snapshot=str(outcome.snapshot_path) if outcome.snapshot_path else None,
+    )
+    if outcome.rollback is None:
+        # A partial apply is not success: scripts must see that conflicting targets were left as they were.
+        if report["conflicts"]:
+            report["status"] = "applied, conflicts skipped"
+            return EXIT_CONFLICTS_SKIPPED
+        report["status"] = "applied"
+        return 0
+    not_restored = [r for r in outcome.rollback if not r.ok]
+    report["notRestored"] = [_call_entry(r) for r in not_restored]
+    report["status"] = "rollback incomplete" if not_restored else "rolled back"
+    return 1
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Apply a curve preset to many attenuations.")
+    parser.add_argument("preset", help="preset file saved by the editor (Save preset...)")
+    targets = parser.add_mutually_exclusive_group(required=True)
+    targets.add_argument("--ids", nargs="+", metavar="ID", help="object ids (attenuations, sounds, containers)")
+    targets.add_argument("--waql", help="WAQL query; the leading $ is optional")
+    targets.add_argument("--match", metavar="PATTERN", help="name pattern, e.g. Footstep_* (path if it has a \\)")
+    parser.add_argument("--skip-conflicts", action="store_true",
+                        help="apply to the valid targets when some conflict (default: apply nothing)")
+    parser.add_argument("--no-skip-unchanged", action="store_true",
+                        help="write targets that already hold the preset too")
+    parser.add_argument("--dry-run", action="store_true", help="resolve and check the targets only")
+    parser.add_argument("--report", help="write the JSON report here instead of stdout")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=os.environ.get("LOG_LEVEL", "WARNING").upper(), stream=sys.stderr)
+
+    report = {}
+    try:
+        code = run(args, report)
+    except PresetError as exc:
+        parser.exit(2, f"{exc}\n")
+    except TargetQueryError as exc:
+        report.update(status="invalid target query", error=str(exc))
+        code = 1
+    except Exception as exc:
+        # Connection failures, a snapshot that couldn't be read or saved...: nothing was written.
+        logger.debug("Batch failed", exc_info=True)
+        report.update(status="error", error=str(exc) or type(exc).__name__)
+        code = 1
+
+    text = json.dumps(report, indent=2)
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as file:
+            file.write(text + "\n")
+    else:
+        print(text)
+    return code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
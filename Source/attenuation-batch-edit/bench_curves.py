@@ -0,0 +1,90 @@
+"""Micro-benchmark: per-segment SHAPE_INTERPOLATORS vs the precomputed unit-shape tables.
+
+    python bench_curves.py [segments]
+
+Run from this folder. Prints the time per curve of each path and the largest
+difference between them.
+"""
+import sys
+import timeit
+
+import numpy as np
+
+from curves import (
+    SHAPE_CODES,
+    SHAPE_INTERPOLATORS,
+    SHAPE_KEYS,
+    evaluate_curve,
+    unit_shape_lookup,
+    unit_shapes,
+)
+
+
+def make_curve(segments, seed=0):
+    rng = np.random.default_rng(seed)
+    x = np.sort(rng.uniform(0.0, 100.0, segments + 1))
+    x[0], x[-1] = 0.0, 100.0
+    y = -np.sort(rng.uniform(0.0, 200.0, segments + 1))
+    codes = rng.integers(0, len(SHAPE_KEYS), segments + 1)
+    return x, y, codes
+
+
+def interpolators_path(x, y, codes):
+    """What the graph did before: one SHAPE_INTERPOLATORS call per segment, recomputing the shape."""
+    xs, ys = [], []
+    for i in range(len(x) - 1):
+        seg_x, seg_y = SHAPE_INTERPOLATORS[SHAPE_KEYS[codes[i]]](x[i], y[i], x[i + 1], y[i + 1])
+        xs.append(seg_x)
+        ys.append(seg_y)
+    return np.concatenate(xs), np.concatenate(ys)
+
+
+def analytic_path(x, y, codes, num_points=50):
+    """evaluate_curve with the unit shapes recomputed on every call (no table)."""
+    t = np.linspace(0.0, 1.0, num_points)
+    unit = unit_shapes(t)[codes[:-1]]
+    xs = x[:-1, None] + (x[1:, None] - x[:-1, None]) * t
+    ys = y[:-1, None] + (y[1:, None] - y[:-1, None]) * unit
+    return xs.ravel(), ys.ravel()
+
+
+def report(name, func, number):
+    seconds = min(timeit.repeat(func, number=number, repeat=5)) / number
+    print(f"  {name:<34} {seconds * 1e6:10.1f} us")
+
+
+def main():
+    segments = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    x, y, codes = make_curve(segments)
+    number = max(10, 20000 // segments)
+    print(f"Whole curve, {segments} segments x 50 samples:")
+    report("SHAPE_INTERPOLATORS per segment", lambda: interpolators_path(x, y, codes), number)
+    report("unit_shapes recomputed", lambda: analytic_path(x, y, codes), number)
+    report("unit_shape_table (evaluate_curve)", lambda: evaluate_curve(x, y, codes), number)
+
+    _, table_y = evaluate_curve(x, y, codes)
+    _, analytic_y = analytic_path(x, y, codes)
+    print(f"  max |table - analytic|: {np.abs(table_y - analytic_y).max():.2e}")
+    # Constant and InvertedSCurve interpolators sample differently, so compare on the other shapes.
+    same_sampling = [SHAPE_CODES[k] for k in SHAPE_KEYS if k not in ("Constant", "InvertedSCurve")]
+    legacy_codes = np.array(same_sampling)[codes % len(same_sampling)]
+    _, legacy_y = interpolators_path(x, y, legacy_codes)
+    print(f"  max |table - interpolators|: {np.abs(evaluate_curve(x, y, legacy_codes)[1] - legacy_y).max():.2e}")
+
+    rng = np.random.default_rng(1)
+    t = rng.uniform(0.0, 1.0, 100_000)
+    sample_codes = rng.integers(0, len(SHAPE_KEYS), t.size)
+    print("Arbitrary t, one shape per sample, 100k samples (sample_curve):")
+    report("unit_shapes + pick", lambda: unit_shapes(t)[sample_codes, np.arange(t.size)], 20)
+    report("unit_shape_lookup (LUT)", lambda: unit_shape_lookup(t, sample_codes), 20)
+
+    # simplify_curve fits every shape to short runs of samples.
+    short = t[:30]
+    print("Arbitrary t, all shapes, 30 samples (simplify_curve segment fit):")
+    report("unit_shapes", lambda: unit_shapes(short), 2000)
+    report("unit_shape_lookup (LUT)", lambda: unit_shape_lookup(short), 2000)
+    print(f"  max |lookup - analytic|: {np.abs(unit_shape_lookup(t) - unit_shapes(t)).max():.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+"""Project-wide export of attenuation curves to a columnar NumPy file (.npz).
+
+Layout (one flat array per column, no pickled objects):
+    object_id, object_name, radius_max               one entry per attenuation
+    curve_object, curve_type, curve_use,             one entry per used curve;
+    curve_start, curve_count                         curve_object indexes the object
+                                                     arrays, start/count slice the points
+    point_x, point_y, point_shape                    every point of every curve;
+                                                     point_shape indexes shape_keys
+    shape_keys, project, exported_at, format_version
+
+Re-exporting to an existing file is incremental: attenuations whose work unit file
+hasn't changed since the previous export (and has no unsaved edits) keep their stored
+curves, everything else is refetched with pipelined getAttenuationCurve calls.
+"""
+import logging
+import os
+import time
+
+import numpy as np
+
+from curves import SHAPE_CODES, SHAPE_KEYS, attenuation_map, points_to_arrays
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+FORMAT_VERSION = 1
+CURVE_TYPES = list(attenuation_map.values())
+ATTENUATION_WAQL = "$ from type Attenuation"
+OBJECT_RETURN = ["id", "name", "@RadiusMax", "filePath", "workunitIsDirty"]
+# Attenuations fetched per call_many round; bounds how many results are held at once.
+CHUNK_OBJECTS = 128
+
+
+class CurveTable:
+    """Columnar attenuation curves, as written by export_curves."""
+
+    def __init__(self, arrays):
+        self.object_id = arrays["object_id"]
+        self.object_name = arrays["object_name"]
+        self.radius_max = arrays["radius_max"]
+        self.curve_object = arrays["curve_object"]
+        self.curve_type = arrays["curve_type"]
+        self.curve_use = arrays["curve_use"]
+        self.curve_start = arrays["curve_start"]
+        self.curve_count = arrays["curve_count"]
+        self.point_x = arrays["point_x"]
+        self.point_y = arrays["point_y"]
+        self.point_shape = arrays["point_shape"]
+        self.project = str(arrays["project"])
+        self.exported_at = float(arrays["exported_at"])
+        self._object_index = None
+
+    @classmethod
+    def load(cls, path):
+        """Read an export; None if the file is missing or not a compatible export."""
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                if int(data["format_version"]) != FORMAT_VERSION:
+                    return None
+                # Stored codes follow the writer's SHAPE_KEYS; remap in case ours differ.
+                remap = np.array([SHAPE_CODES.get(str(k), SHAPE_CODES["Linear"]) for k in data["shape_keys"]],
+                                 dtype=np.int8)
+                arrays = {key: data[key] for key in data.files}
+        except (OSError, KeyError, ValueError):
+            return None
+        arrays["point_shape"] = remap[arrays["point_shape"]]
+        return cls(arrays)
+
+    def __len__(self):
+        return int(self.object_id.size)
+
+    def index_of(self, object_id):
+        if self._object_index is None:
+            self._object_index = {oid: i for i, oid in enumerate(self.object_id.tolist())}
+        return self._object_index.get(object_id)
+
+    def points(self, curve):
+        """(x, y, shape_codes) of curve row `curve`."""
+        start = int(self.curve_start[curve])
+        stop = start + int(self.curve_count[curve])
+        return self.point_x[start:stop], self.point_y[start:stop], self.point_shape[start:stop]
+
+    def curves_of(self, object_index):
+        """Curve rows belonging to object row `object_index`."""
+        return np.flatnonzero(self.curve_object == object_index)
+
+
+class _TableBuilder:
+    def __init__(self):
+        self.objects = []  # (id, name, radius_max)
+        self.curves = []  # (object index, curve type, use, point count)
+        self.xs, self.ys, self.shapes = [], [], []
+
+    def add_object(self, object_id, name, radius_max):
+        self.objects.append((object_id, name, float(radius_max)))
+        return len(self.objects) - 1
+
+    def add_curve(self, object_index, curve_type, use, x, y, shapes):
+        self.curves.append((object_index, curve_type, use, len(x)))
+        self.xs.append(np.asarray(x, dtype=float))
+        self.ys.append(np.asarray(y, dtype=float))
+        self.shapes.append(np.asarray(shapes, dtype=np.int8))
+
+    def arrays(self, project, exported_at):
+        counts = np.array([c[3] for c in self.curves], dtype=np.int32)
+        return {
+            "format_version": np.int32(FORMAT_VERSION),
+            "project": np.str_(project),
+            "exported_at": np.float64(exported_at),
+            "shape_keys": np.array(SHAPE_KEYS),
+            "object_id": np.array([o[0] for o in self.objects], dtype=str),
+            "object_name": np.array([o[1] for o in self.objects], dtype=str),
+            "radius_max": np.array([o[2] for o in self.objects], dtype=float),
+            "curve_object": np.array([c[0] for c in self.curves], dtype=np.int32),
+            "curve_type": np.array([c[1] for c in self.curves], dtype=str),
+            "curve_use": np.array([c[2] for c in self.curves], dtype=str),
+            "curve_start": (np.cumsum(counts) - counts).astype(np.int64),
+            "curve_count": counts,
+            "point_x": np.concatenate(self.xs) if self.xs else np.zeros(0),
+            "point_y": np.concatenate(self.ys) if self.ys else np.zeros(0),
+            "point_shape": np.concatenate(self.shapes) if self.shapes else np.zeros(0, dtype=np.int8),
+        }
+
+
+class ExportResult:
+    __slots__ = ("path", "objects", "fetched", "reused", "failed", "cancelled")
+
+    def __init__(self, path):
+        self.path = path
+        self.objects = 0  # attenuations written
+        self.fetched = 0
+        self.reused = 0
+        self.failed = []  # (name, error)
+        self.cancelled = 0
+
+
+def list_attenuations(pool, waql=ATTENUATION_WAQL):
+    """Every attenuation matched by `waql`, with OBJECT_RETURN fields."""
+    result, = pool.call_many("ak.wwise.core.object.get", [("list", {"waql": waql})],
+                             options={"return": OBJECT_RETURN})
+    if not result.ok:
+        raise RuntimeError(f"Could not list attenuations: {result.error}")
+    return result.result.get("return", [])
+
+
+def _unchanged_since(obj, since, mtimes):
+    """True if obj's work unit file is saved and older than `since`."""
+    if since is None or obj.get("workunitIsDirty"):
+        return False
+    path = obj.get("filePath")
+    if not path:
+        return False
+    if path not in mtimes:
+        try:
+            mtimes[path] = os.path.getmtime(path)
+        except OSError:
+            mtimes[path] = None  # e.g. Wwise runs on another machine: always refetch
+    return mtimes[path] is not None and mtimes[path] <= since
+
+
+def export_curves(path, pool, project="", incremental=True, report=None, cancel_event=None):
+    """
+    Export every used curve of every attenuation in the project to `path`.
+        report(done, total)  progress over the attenuations to fetch
+        cancel_event         stops fetching; whatever finished is still written
+    Attenuations with a failed or cancelled call are left out, so the next
+    incremental export fetches them again. Returns an ExportResult.
+    """
+    started = time.time()
+    previous = CurveTable.load(path) if incremental else None
+    since = previous.exported_at if previous is not None else None
+    outcome = ExportResult(path)
+    builder = _TableBuilder()
+    mtimes = {}
+
+    to_fetch = []
+    for obj in list_attenuations(pool):
+        old_index = previous.index_of(obj["id"]) if previous is not None else None
+        if old_index is not None and _unchanged_since(obj, since, mtimes):
+            index = builder.add_object(obj["id"], obj.get("name", ""), obj.get("@RadiusMax", 100))
+            for curve in previous.curves_of(old_index):
+                builder.add_curve(index, str(previous.curve_type[curve]), str(previous.curve_use[curve]),
+                                  *previous.points(curve))
+            outcome.reused += 1
+        else:
+            to_fetch.append(obj)
+
+    total = len(to_fetch)
+    for chunk_start in range(0, total, CHUNK_OBJECTS):
+        chunk = to_fetch[chunk_start:chunk_start + CHUNK_OBJECTS]
+        calls = [
+            ((i, curve_type), {"object": obj["id"], "curveType": curve_type})
+            for i, obj in enumerate(chunk)
+            for curve_type in CURVE_TYPES
+        ]
+        def progress(done, _total, offset=chunk_start):
+            if report is not None:
+                report(offset + done // len(CURVE_TYPES), total)
+
+        results = pool.call_many("ak.wwise.core.object.getAttenuationCurve", calls,
+                                 on_progress=progress, cancel_event=cancel_event)
+
+        by_object = [[] for _ in chunk]
+        for result in results:
+            by_object[result.key[0]].append(result)
+        for obj, object_results in zip(chunk, by_object):
+            errors = [r.error for r in object_results if not r.ok]
+            if "Cancelled" in errors:
+                outcome.cancelled += 1
+                continue
+            if errors:
+                outcome.failed.append((obj.get("name", obj["id"]), errors[0]))
+                continue
+            index = builder.add_object(obj["id"], obj.get("name", ""), obj.get("@RadiusMax", 100))
+            for r in object_results:
+                use = r.result.get("use", "None")
+                if use != "None":
+                    builder.add_curve(index, r.key[1], use, *points_to_arrays(r.result.get("points", [])))
+            outcome.fetched += 1
+
+    # Write next to the target and swap, so an interrupted export never leaves a broken file.
+    # The start time is recorded: anything saved while exporting is refetched next time.
+    tmp_path = f"{path}.tmp.npz"
+    np.savez_compressed(tmp_path, **builder.arrays(project, started))
+    os.replace(tmp_path, path)
+    outcome.objects = len(builder.objects)
+    logger.info("Exported %d attenuations to %s (%d fetched, %d reused, %d failed, %d cancelled)",
+                outcome.objects, path, outcome.fetched, outcome.reused, len(outcome.failed), outcome.cancelled)
+    return outcome
@@ -0,0 +1,61 @@
+"""Styling of the curve graph, shared by the editor and the offscreen renderer.
+
+Works on matplotlib Figure/Axes objects passed in; nothing here imports matplotlib,
+so the editor can keep loading it lazily.
+"""
+import numpy as np
+
+from curves import COLOR_MAPPING, POSITIVE_CURVES, Y_POSITIONS, Y_VALUES
+
+TEXT_COLOR = '#9f9f9f'
+TITLE_COLOR = '#c8c3c3'
+GRID_COLOR = '#3a3a3a'
+AXES_COLOR = '#2b2b2b'
+FIGURE_COLOR = '#333333'
+
+
+def curve_color(curve_type):
+    return COLOR_MAPPING.get(curve_type, "#000000")
+
+
+def style_axes(fig, ax):
+    """Dark theme of the editor graph: colors of the background, ticks and spines."""
+    ax.tick_params(axis='x', colors=TEXT_COLOR)
+    ax.tick_params(axis='y', colors=TEXT_COLOR)
+    ax.xaxis.label.set_color(TEXT_COLOR)
+    ax.yaxis.label.set_color(TEXT_COLOR)
+    for spine in ax.spines.values():
+        spine.set_edgecolor(TEXT_COLOR)
+    ax.set_facecolor(AXES_COLOR)
+    fig.patch.set_facecolor(FIGURE_COLOR)
+
+
+def apply_curve_layout(ax, curve_type, chart_max, title, title_size=None):
+    """
+    Axis limits, ticks, grid and title for one curve type over [0, chart_max].
+    dB curves use the Y_VALUES axis (plot y_to_positions of the values); the others 0-100.
+    """
+    if curve_type in POSITIVE_CURVES:
+        margin = 5
+        ymin, ymax = 0, 100
+        ax.set_ylim(ymin - margin, ymax + margin)
+        # Labels given explicitly: a reused axes may still carry the dB labels below.
+        ax.set_yticks(np.arange(0, 101, 10), labels=[str(v) for v in range(0, 101, 10)])
+    else:
+        margin = 0.05
+        ymin, ymax = 0, 1
+        ax.set_ylim(ymin - margin, ymax + margin)
+        ax.set_yticks(Y_POSITIONS)
+        ax.set_yticklabels([str(y) for y in Y_VALUES])
+
+    ax.grid(color=GRID_COLOR)
+    ax.set_title(title or '', color=TITLE_COLOR, fontsize=title_size)
+
+    # Pad the X range so endpoint markers aren't clipped at the axis edge.
+    pad = chart_max * 0.05
+    ax.set_xlim(-pad, chart_max + pad)
+
+    # Explicit ticks so the last tick equals chart_max (matplotlib's auto-ticks round it).
+    xticks = np.linspace(0, chart_max, num=6)
+    ax.set_xticks(xticks)
+    ax.set_xticklabels([str(int(t)) for t in xticks])
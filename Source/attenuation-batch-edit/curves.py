@@ -0,0 +1,569 @@
+"""Widget-free curve data and math shared by the editor and batch tooling.
+
+Nothing here imports Tk or matplotlib, so it can be used from scripts that
+analyse attenuation curves outside the GUI.
+"""
+import functools
+import heapq
+
+import numpy as np
+
+attenuation_map = {
+    "Volume": "VolumeDryUsage",
+    "Auxiliary send volumes (Game-defined)": "VolumeWetGameUsage",
+    "Auxiliary send volumes (User-defined)": "VolumeWetUserUsage",
+    "Low-pass filter": "LowPassFilterUsage",
+    "High-pass filter": "HighPassFilterUsage",
+    "Spread": "SpreadUsage",
+    "Focus": "FocusUsage",
+    "Obstruction Volume": "ObstructionVolumeUsage",
+    "Obstruction Low-pass filter": "ObstructionLPFUsage",
+    "Obstruction High-pass filter": "ObstructionHPFUsage",
+    "Occlusion Volume": "OcclusionVolumeUsage",
+    "Occlusion Low-pass filter": "OcclusionLPFUsage",
+    "Occlusion High-pass filter": "OcclusionHPFUsage",
+    "Diffraction Volume": "DiffractionVolumeUsage",
+    "Diffraction Low-pass filter": "DiffractionLPFUsage",
+    "Diffraction High-pass filter": "DiffractionHPFUsage",
+    "Transmission Volume": "TransmissionVolumeUsage",
+    "Transmission Low-pass filter": "TransmissionLPFUsage",
+    "Transmission High-pass filter": "TransmissionHPFUsage",
+}
+
+shape_display_map = {
+    "Constant": "Constant",
+    "Linear": "Linear",
+    "Log3": "Logarithmic Base 3",
+    "Log2": "Sine (Constant Power Fade In)",
+    "Log1": "Logarithmic (Base 1.41)",
+    "InvertedSCurve": "Inverted S-Curve",
+    "SCurve": "S-Curve",
+    "Exp1": "Exponential (Base 1.41)",
+    "Exp2": "Sine (Constant Power Fade Out)",
+    "Exp3": "Exponential Base 3"
+}
+display_to_shape = {disp: key for key, disp in shape_display_map.items()}
+
+# Integer code per shape key, used by the array kernels (index into SHAPE_KEYS).
+SHAPE_KEYS = list(shape_display_map)
+SHAPE_CODES = {key: code for code, key in enumerate(SHAPE_KEYS)}
+
+# dB axis mapping used by both the y-position helper and the graph y-ticks
+Y_VALUES = [-200.0, -18.1, -12.0, -8.5, -6.0, -4.1, -2.5, -1.2, 0.0]
+Y_POSITIONS = np.linspace(0.0, 1.0, num=9).tolist()
+
+COLOR_MAPPING = {
+    "VolumeWetGameUsage": "#c98036",
+    "VolumeWetUserUsage": "#7c4d1d",
+    "VolumeDryUsage": "#da2121",
+    "LowPassFilterUsage": "#0080ff",
+    "HighPassFilterUsage": "#30bffd",
+    "SpreadUsage": "#8bd100",
+    "FocusUsage": "#639400",
+    "ObstructionVolumeUsage": "#c97a3c",
+    "ObstructionLPFUsage": "#c97a3c",
+    "ObstructionHPFUsage": "#e8a878",
+    "OcclusionVolumeUsage": "#7c5fbe",
+    "OcclusionLPFUsage": "#7c5fbe",
+    "OcclusionHPFUsage": "#a497d4",
+    "DiffractionVolumeUsage": "#bf5894",
+    "DiffractionLPFUsage": "#bf5894",
+    "DiffractionHPFUsage": "#d289b8",
+    "TransmissionVolumeUsage": "#3848bc",
+    "TransmissionLPFUsage": "#3848bc",
+    "TransmissionHPFUsage": "#6c80df",
+}
+
+# Curve types whose Y range is [0, 100]. Everything else is dB in [-200, 0].
+POSITIVE_CURVES = {
+    "LowPassFilterUsage", "HighPassFilterUsage", "SpreadUsage", "FocusUsage",
+    "ObstructionLPFUsage", "ObstructionHPFUsage",
+    "OcclusionLPFUsage", "OcclusionHPFUsage",
+    "DiffractionLPFUsage", "DiffractionHPFUsage",
+    "TransmissionLPFUsage", "TransmissionHPFUsage",
+}
+
+
+def linear_interpolation(x0, y0, x1, y1, num_points=50):
+    x = np.linspace(x0, x1, num_points)
+    y = np.linspace(y0, y1, num_points)
+    return x, y
+
+
+def logarithmic_interpolation(x0, y0, x1, y1, base, num_points=50):
+    x = np.linspace(x0, x1, num_points)
+    t = np.linspace(0, 1, num_points)
+    log_scale = (np.log1p((base - 1) * t)) / np.log(base)
+    y = y0 + (y1 - y0) * log_scale
+    return x, y
+
+
+def exponential_interpolation(x0, y0, x1, y1, exponent, num_points=50):
+    x = np.linspace(x0, x1, num_points)
+    exp_scale = np.linspace(0, 1, num_points) ** exponent
+    y = y0 + (y1 - y0) * exp_scale
+    return x, y
+
+
+def s_curve_interpolation(x0, y0, x1, y1, num_points=50):
+    x = np.linspace(x0, x1, num_points)
+    t = (x - x0) / (x1 - x0)
+    s_curve = t * t * (3 - 2 * t)
+    y = y0 + (y1 - y0) * s_curve
+    return x, y
+
+
+def inverted_s_curve_interpolation(x0, y0, x1, y1, num_points=100):
+    x = np.linspace(x0, x1, num_points)
+    t = (x - x0) / (x1 - x0)
+    steepness = 2.5
+    p1y = 1 - steepness / 10
+    p2y = steepness / 10
+    bezier = (1 - t) ** 3 * 0 + 3 * (1 - t) ** 2 * t * p1y + 3 * (1 - t) * t ** 2 * p2y + t ** 3 * 1
+    y = y0 + (y1 - y0) * bezier
+    return x, y
+
+
+def constant_interpolation(x0, y0, x1, y1, num_points=2):
+    return [x0, x1], [y0, y0]
+
+
+def y_to_position(y):
+    if y > 0.0:
+        y = 0.0
+    elif y < -200.0:
+        y = -200.0
+    return np.interp(y, Y_VALUES, Y_POSITIONS)
+
+
+def y_to_positions(y):
+    """Vectorized y_to_position: dB values (any shape) -> [0, 1] axis positions."""
+    return np.interp(np.clip(y, -200.0, 0.0), Y_VALUES, Y_POSITIONS)
+
+
+# Shape name -> interpolator
+SHAPE_INTERPOLATORS = {
+    "Linear": lambda x0, y0, x1, y1: linear_interpolation(x0, y0, x1, y1),
+    "Log1": lambda x0, y0, x1, y1: logarithmic_interpolation(x0, y0, x1, y1, base=3.5),
+    "Log2": lambda x0, y0, x1, y1: logarithmic_interpolation(x0, y0, x1, y1, base=10),
+    "Log3": lambda x0, y0, x1, y1: logarithmic_interpolation(x0, y0, x1, y1, base=30),
+    "Exp1": lambda x0, y0, x1, y1: exponential_interpolation(x0, y0, x1, y1, exponent=1.3),
+    "Exp2": lambda x0, y0, x1, y1: exponential_interpolation(x0, y0, x1, y1, exponent=2),
+    "Exp3": lambda x0, y0, x1, y1: exponential_interpolation(x0, y0, x1, y1, exponent=4),
+    "SCurve": lambda x0, y0, x1, y1: s_curve_interpolation(x0, y0, x1, y1),
+    "InvertedSCurve": lambda x0, y0, x1, y1: inverted_s_curve_interpolation(x0, y0, x1, y1),
+    "Constant": lambda x0, y0, x1, y1: constant_interpolation(x0, y0, x1, y1),
+}
+
+
+def unit_shapes(t):
+    """
+    Normalized shape curves on t in [0, 1]: row SHAPE_CODES[key] holds the 0->1 ramp
+    SHAPE_INTERPOLATORS[key] draws between two points. Returns (len(SHAPE_KEYS), len(t)).
+    """
+    t = np.asarray(t, dtype=float)
+    steepness = 2.5
+    p1y = 1 - steepness / 10
+    p2y = steepness / 10
+    rows = {
+        "Constant": np.zeros_like(t),
+        "Linear": t,
+        "Log1": np.log1p(2.5 * t) / np.log(3.5),
+        "Log2": np.log1p(9.0 * t) / np.log(10.0),
+        "Log3": np.log1p(29.0 * t) / np.log(30.0),
+        "Exp1": t ** 1.3,
+        "Exp2": t ** 2,
+        "Exp3": t ** 4,
+        "SCurve": t * t * (3 - 2 * t),
+        "InvertedSCurve": 3 * (1 - t) ** 2 * t * p1y + 3 * (1 - t) * t ** 2 * p2y + t ** 3,
+    }
+    return np.stack([rows[key] for key in SHAPE_KEYS])
+
+
+# Unit shapes only depend on the shape key: tabulate them once and scale/offset per segment.
+LUT_SIZE = 4097
+UNIT_SHAPE_LUT = unit_shapes(np.linspace(0.0, 1.0, LUT_SIZE))
+UNIT_SHAPE_LUT.flags.writeable = False
+
+
+@functools.lru_cache(maxsize=8)
+def unit_shape_table(num_points):
+    """unit_shapes at num_points evenly spaced t, computed once per sample count (read-only)."""
+    table = unit_shapes(np.linspace(0.0, 1.0, num_points))
+    table.flags.writeable = False
+    return table
+
+
+unit_shape_table(50)  # evaluate_curve's default sampling
+
+
+def unit_shape_lookup(t, shape_codes=None):
+    """
+    Unit shapes at arbitrary t in [0, 1], read from UNIT_SHAPE_LUT (linear between entries).
+        shape_codes None  every shape: (len(SHAPE_KEYS), len(t))
+        shape_codes       one code per t: (len(t),)
+    """
+    position = np.clip(np.asarray(t, dtype=float), 0.0, 1.0) * (LUT_SIZE - 1)
+    lower = np.minimum(position.astype(np.intp), LUT_SIZE - 2)
+    fraction = position - lower
+    if shape_codes is None:
+        low = UNIT_SHAPE_LUT[:, lower]
+        return low + (UNIT_SHAPE_LUT[:, lower + 1] - low) * fraction
+    # Flat indices: one gather per sample instead of a 2-D fancy index.
+    index = np.asarray(shape_codes, dtype=np.intp) * LUT_SIZE + lower
+    flat = UNIT_SHAPE_LUT.ravel()
+    low = flat[index]
+    return low + (flat[index + 1] - low) * fraction
+
+
+def points_to_arrays(points):
+    """WAAPI points list ({x, y, shape}) -> (x, y, shape_codes) float/float/int arrays."""
+    x = np.fromiter((p['x'] for p in points), dtype=float, count=len(points))
+    y = np.fromiter((p['y'] for p in points), dtype=float, count=len(points))
+    codes = np.fromiter((SHAPE_CODES.get(p.get('shape', 'Linear'), SHAPE_CODES["Linear"]) for p in points),
+                        dtype=np.intp, count=len(points))
+    return x, y, codes
+
+
+def evaluate_curve(x, y, shape_codes, num_points=50, db_axis=False):
+    """
+    Sample a whole curve in one NumPy pass.
+        x, y         point coordinates (n,)
+        shape_codes  SHAPE_CODES of each point; point i's shape drives segment i -> i+1
+        db_axis      map Y through the dB axis (y_to_positions) before interpolating,
+                     as the graph does for non-POSITIVE_CURVES
+    Returns flat (xs, ys) of (n - 1) * num_points samples. Constant segments hold y0
+    up to x1, so the polyline steps vertically at the next point.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    if x.size < 2:
+        return x.copy(), (y_to_positions(y) if db_axis else y.copy())
+    if db_axis:
+        y = y_to_positions(y)
+
+    t = np.linspace(0.0, 1.0, num_points)
+    unit = unit_shape_table(num_points)[np.asarray(shape_codes[:-1], dtype=np.intp)]  # (n-1, P)
+
+    x0, x1 = x[:-1, None], x[1:, None]
+    y0, y1 = y[:-1, None], y[1:, None]
+    xs = x0 + (x1 - x0) * t
+    ys = y0 + (y1 - y0) * unit
+    return xs.ravel(), ys.ravel()
+
+
+def sample_curve(x, y, shape_codes, grid):
+    """
+    Value of the curve at each X in `grid`, following every segment's shape.
+    Left of the first point holds its Y, right of the last point holds the last Y.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    grid = np.asarray(grid, dtype=float)
+    if x.size < 2:
+        return np.full(grid.shape, y[0] if y.size else 0.0)
+    segment = np.clip(np.searchsorted(x, grid, side="right") - 1, 0, x.size - 2)
+    x0, x1 = x[segment], x[segment + 1]
+    width = np.where(x1 > x0, x1 - x0, 1.0)
+    t = np.clip((grid - x0) / width, 0.0, 1.0)
+    unit = unit_shape_lookup(t, np.asarray(shape_codes, dtype=np.intp)[segment])
+    values = y[segment] + (y[segment + 1] - y[segment]) * unit
+    return np.where(grid >= x[-1], y[-1], values)
+
+
+CURVE_MATCH_TOLERANCE = 1e-4
+
+
+def curve_matches(curve, use, points, tolerance=CURVE_MATCH_TOLERANCE):
+    """
+    True if a getAttenuationCurve result already holds `use` and `points`: same shapes,
+    X/Y equal within `tolerance` (plus a relative 1e-6 for Wwise's float round trip).
+    """
+    if curve is None or curve.get('use', 'None') != use:
+        return False
+    if use != 'Custom':
+        return True  # linked and unused curves have no points of their own
+    current = curve.get('points', [])
+    if len(current) != len(points):
+        return False
+    cx, cy, cshapes = points_to_arrays(current)
+    px, py, pshapes = points_to_arrays(points)
+    return (np.array_equal(cshapes, pshapes)
+            and np.allclose(cx, px, rtol=1e-6, atol=tolerance)
+            and np.allclose(cy, py, rtol=1e-6, atol=tolerance))
+
+
+def check_conflicts(ui_x, is_absolute, max_xs):
+    """
+    Pre-flight conflict check of one editor curve against many targets at once.
+        ui_x         editor X per point (percent for relative points, distance for absolute)
+        is_absolute  bool per point
+        max_xs       RadiusMax per target
+    A target conflicts when an absolute point lands past its RadiusMax, or when the
+    final X sequence is not strictly increasing. Returns (conflict mask, worst overflow)
+    per target; worst overflow is how far the furthest absolute point passes RadiusMax (0 if none).
+    """
+    ui_x = np.asarray(ui_x, dtype=float)
+    is_absolute = np.asarray(is_absolute, dtype=bool)
+    max_xs = np.asarray(max_xs, dtype=float)
+
+    final_x = np.where(is_absolute, ui_x, ui_x / 100.0 * max_xs[:, None])  # (targets, points)
+    overflow = np.where(is_absolute, ui_x - max_xs[:, None], -np.inf)
+    worst_overflow = np.maximum(overflow.max(axis=1, initial=-np.inf), 0.0)
+
+    not_increasing = (np.diff(final_x, axis=1) <= 0).any(axis=1)
+    conflicts = (worst_overflow > 0) | not_increasing
+    return conflicts, worst_overflow
+
+
+SIMPLIFY_MAX_POINTS = 16
+SIMPLIFY_TOLERANCE = 0.5  # dB for volume curves, % for POSITIVE_CURVES
+
+
+def _fit_segment(x, y, start, end):
+    """
+    Best shape for the segment start -> end of a dense curve.
+    Returns (max abs error, shape code, index of the worst sample) over the interior samples.
+    """
+    if end - start < 2:
+        return 0.0, SHAPE_CODES["Linear"], start
+    x0, x1 = x[start], x[end]
+    y0, y1 = y[start], y[end]
+    t = (x[start + 1:end] - x0) / (x1 - x0)
+    predicted = y0 + (y1 - y0) * unit_shape_lookup(t)  # (shapes, samples)
+    errors = np.abs(predicted - y[start + 1:end])
+    max_errors = errors.max(axis=1)
+    code = int(max_errors.argmin())
+    return float(max_errors[code]), code, start + 1 + int(errors[code].argmax())
+
+
+def simplify_curve(x, y, max_points=SIMPLIFY_MAX_POINTS, tolerance=SIMPLIFY_TOLERANCE):
+    """
+    Reduce a dense curve to at most `max_points` points, each segment drawn with the
+    SHAPE_KEYS shape that fits its samples best.
+    Top-down Douglas-Peucker with the distance measured in Y (dB) against the fitted
+    shape rather than the chord: the worst segment is split at its worst sample until
+    every segment is within `tolerance` or the point budget is used up.
+    Returns (x, y, shape_codes, max_error).
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    # Sort by X; on repeated X keep the last sample so vertical steps end up as Constant segments.
+    order = np.argsort(x, kind="stable")
+    x, y = x[order], y[order]
+    last = np.append(x[1:] != x[:-1], True)
+    x, y = x[last], y[last]
+    if x.size <= 2:
+        return x, y, np.full(x.size, SHAPE_CODES["Linear"], dtype=np.intp), 0.0
+
+    max_points = max(2, int(max_points))
+    shapes = {}  # segment start -> shape code
+    heap = []
+    kept = 2
+
+    def push(start, end):
+        error, code, worst = _fit_segment(x, y, start, end)
+        shapes[start] = code
+        heapq.heappush(heap, (-error, start, end, worst))
+
+    push(0, x.size - 1)
+    while heap and kept < max_points and -heap[0][0] > tolerance:
+        _, start, end, worst = heapq.heappop(heap)
+        push(start, worst)
+        push(worst, end)
+        kept += 1
+
+    max_error = max((-entry[0] for entry in heap), default=0.0)
+
+    # Splitting can leave points a merged segment fits just as well (e.g. the sample before a step).
+    keep = sorted(shapes) + [x.size - 1]
+    i = 1
+    while i < len(keep) - 1:
+        error, code, _ = _fit_segment(x, y, keep[i - 1], keep[i + 1])
+        if error <= max(tolerance, max_error):
+            shapes[keep[i - 1]] = code
+            max_error = max(max_error, error)
+            del keep[i]
+        else:
+            i += 1
+
+    codes = np.array([shapes[i] for i in keep[:-1]] + [SHAPE_CODES["Linear"]], dtype=np.intp)
+    return x[keep], y[keep], codes, max_error
+
+
+def simplify_points(points, max_points=SIMPLIFY_MAX_POINTS, tolerance=SIMPLIFY_TOLERANCE, num_points=50):
+    """
+    WAAPI points list -> (simplified points list, max_error). Shaped segments are sampled
+    first (evaluate_curve) so the fit follows the curve Wwise plays, not just its points.
+    """
+    x, y, codes = points_to_arrays(points)
+    xs, ys = evaluate_curve(x, y, codes, num_points=num_points)
+    sx, sy, scodes, max_error = simplify_curve(xs, ys, max_points, tolerance)
+    simplified = [
+        {"x": float(px), "y": float(py), "shape": SHAPE_KEYS[code]}
+        for px, py, code in zip(sx, sy, scodes)
+    ]
+    return simplified, max_error
+
+
+class CurveModel:
+    """
+    Editable curve as parallel arrays, without any widgets.
+        x         editor X: percent of RadiusMax for relative points, literal distance for absolute ones
+        y         dB for volume curves, 0-100 for POSITIVE_CURVES
+        shapes    SHAPE_CODES of the segment that starts at each point
+        absolute  absolute middle points form a contiguous prefix: [rel, abs, abs, rel, ..., rel]
+    Endpoints are always relative and can't be deleted.
+    """
+    ABSOLUTE_X_MAX = 1_000_000.0
+
+    def __init__(self, x=(), y=(), shapes=(), absolute=()):
+        self.x = np.array(x, dtype=float)
+        self.y = np.array(y, dtype=float)
+        self.shapes = np.array(shapes, dtype=np.intp)
+        self.absolute = np.array(absolute, dtype=bool)
+        if self.shapes.size != self.x.size:
+            self.shapes = np.full(self.x.size, SHAPE_CODES["Linear"], dtype=np.intp)
+        if self.absolute.size != self.x.size:
+            self.absolute = np.zeros(self.x.size, dtype=bool)
+
+    @classmethod
+    def from_points(cls, points):
+        """
+        WAAPI points -> (model, max_x). X is normalized to fill 0-100 so the locked endpoints
+        land at 0 and 100; Set scales 100 back to each target's RadiusMax.
+        """
+        x, y, shapes = points_to_arrays(points)
+        max_x = float(x.max()) if x.size else 100.0
+        # x / max_x * 100, not x * (100 / max_x): the latter gives 100.00000000000001 for some RadiusMax.
+        model = cls(x / max_x * 100.0 if max_x else np.zeros_like(x), y, shapes)
+        model.sort()
+        if len(model) >= 2:
+            model.x[0], model.x[-1] = 0.0, 100.0
+        return model, max_x
+
+    def __len__(self):
+        return int(self.x.size)
+
+    def is_endpoint(self, index):
+        return index == 0 or index == len(self) - 1
+
+    def shape_key(self, index):
+        return SHAPE_KEYS[self.shapes[index]]
+
+    def specs(self):
+        """(ui_x, y, shape_key, is_absolute) per point."""
+        return [
+            (float(x), float(y), SHAPE_KEYS[code], bool(absolute))
+            for x, y, code, absolute in zip(self.x, self.y, self.shapes, self.absolute)
+        ]
+
+    def final_x(self, max_x):
+        """Target X per point: relative points rescaled from [0,100] to [0,max_x], absolute ones literal."""
+        return np.where(self.absolute, self.x, self.x / 100.0 * max_x)
+
+    def payload(self, max_x):
+        """WAAPI points payload for one target."""
+        return [
+            {"x": float(x), "y": float(y), "shape": SHAPE_KEYS[code]}
+            for x, y, code in zip(self.final_x(max_x), self.y, self.shapes)
+        ]
+
+    def prev_same_type_x(self, index):
+        """X of nearest previous point with the same absolute flag, or None."""
+        same = np.flatnonzero(self.absolute[:index] == self.absolute[index])
+        return float(self.x[same[-1]]) if same.size else None
+
+    def next_same_type_x(self, index):
+        """X of nearest next point with the same absolute flag, or None."""
+        same = np.flatnonzero(self.absolute[index + 1:] == self.absolute[index])
+        return float(self.x[index + 1 + same[0]]) if same.size else None
+
+    def set_x(self, index, value):
+        """
+        Validated X edit; returns False (value unchanged) when rejected.
+            * Clamp [0, 100] for relative or [0, ABSOLUTE_X_MAX] for absolute.
+            * Collision check only against same-type neighbors (different units don't compete).
+        """
+        try:
+            value = float(value)
+        except (ValueError, TypeError):
+            return False
+        upper_clamp = self.ABSOLUTE_X_MAX if self.absolute[index] else 100.0
+        value = max(0.0, min(upper_clamp, value))
+
+        # Collision check against same-type neighbors (skipped for endpoints, which are locked).
+        if not self.is_endpoint(index):
+            prev_x = self.prev_same_type_x(index)
+            next_x = self.next_same_type_x(index)
+            if (next_x is not None and value >= next_x) or (prev_x is not None and value <= prev_x):
+                return False
+        self.x[index] = value
+        return True
+
+    def nudge_x(self, index, delta):
+        """+/- button step: refused if it would reach a same-type neighbor or the range edge."""
+        new = self.x[index] + delta
+        prev_x = self.prev_same_type_x(index)
+        next_x = self.next_same_type_x(index)
+        lower = prev_x if prev_x is not None else 0.0
+        upper = next_x if next_x is not None else (self.ABSOLUTE_X_MAX if self.absolute[index] else 100.0)
+        if new <= lower or new >= upper:
+            return False
+        return self.set_x(index, new)
+
+    def set_y(self, index, value, positive):
+        """Validated Y edit, clamped to [0, 100] for POSITIVE_CURVES or [-200, 0] dB otherwise."""
+        try:
+            value = float(value)
+        except (ValueError, TypeError):
+            return False
+        self.y[index] = max(0.0, min(100.0, value)) if positive else max(-200.0, min(0.0, value))
+        return True
+
+    def set_shape(self, index, shape_key):
+        self.shapes[index] = SHAPE_CODES.get(shape_key, SHAPE_CODES["Linear"])
+
+    def _convert_x_to_match_type(self, index, max_x):
+        """Convert x[index] between percent and absolute units to match absolute[index] (just flipped)."""
+        max_x = max_x or 100
+        if max_x <= 0:
+            return
+        if self.absolute[index]:
+            # was %, now absolute units
+            self.x[index] = max(0.0, min(self.ABSOLUTE_X_MAX, self.x[index] * max_x / 100.0))
+        else:
+            # was absolute, now %
+            self.x[index] = max(0.0, min(100.0, self.x[index] / max_x * 100.0))
+
+    def set_absolute(self, index, flag, max_x):
+        """
+        Flip one middle point and keep the absolute points a contiguous prefix:
+        - Checking point N  -> also check all earlier middle points.
+        - Unchecking point N -> also uncheck all later middle points.
+        Each point whose state changes has its X converted using the source's max_x.
+        """
+        if self.is_endpoint(index) or bool(self.absolute[index]) == bool(flag):
+            return
+        self.absolute[index] = flag
+        self._convert_x_to_match_type(index, max_x)
+        others = range(1, index) if flag else range(index + 1, len(self) - 1)
+        for other in others:
+            if bool(self.absolute[other]) != bool(flag):
+                self.absolute[other] = flag
+                self._convert_x_to_match_type(other, max_x)
+
+    def delete(self, index):
+        # Endpoints (first/last) are locked.
+        if self.is_endpoint(index):
+            return False
+        self.x = np.delete(self.x, index)
+        self.y = np.delete(self.y, index)
+        self.shapes = np.delete(self.shapes, index)
+        self.absolute = np.delete(self.absolute, index)
+        return True
+
+    def sort(self):
+        order = np.argsort(self.x, kind="stable")
+        self.x, self.y = self.x[order], self.y[order]
+        self.shapes, self.absolute = self.shapes[order], self.absolute[order]
@@ -0,0 +1,254 @@
+"""Find attenuations that could be merged, from a curve export (see curve_export).
+
+Two levels:
+    exact  every curve type has the same use, the same points (X normalized by
+           RadiusMax, quantized) and the same shapes, and RadiusMax matches too.
+    near   every curve type has the same use and the curves, sampled on a common
+           normalized X grid, stay within `tolerance` of each other everywhere
+           (dB for volume curves, % for the others). RadiusMax may differ.
+
+Near matching never compares all pairs: attenuations are split by curve uses, each
+gets a few chunk means of its sampled Custom curves, those are bucketed on a
+`tolerance` grid, and only attenuations in neighbouring buckets are compared. Two
+curves within tolerance everywhere also have chunk means within tolerance, so no
+pair is missed. Buckets are compared a block of rows at a time (COMPARE_ROWS, COMPARE_ELEMENTS),
+and rows already linked to each other are not compared again, so a large cluster of
+near copies costs memory in proportion to its size, not its square.
+"""
+import hashlib
+import itertools
+from collections import defaultdict
+
+import numpy as np
+
+from curve_export import CURVE_TYPES
+from curves import sample_curve
+
+DEFAULT_TOLERANCE = 0.5
+SIGNATURE_SAMPLES = 32  # grid points per curve type
+SUMMARY_CHUNKS = 4  # chunk means used for bucketing
+X_DECIMALS = 4  # normalized X
+Y_DECIMALS = 3
+COMPARE_ELEMENTS = 1 << 22  # float64 differences per comparison block (32 MB)
+COMPARE_ROWS = 256  # rows compared against per block
+PREFILTER_STEP = 8  # sample stride of the first, coarse comparison
+
+
+class DuplicateGroup:
+    """Attenuations (row indices into the CurveTable) that could be merged."""
+    __slots__ = ("members", "exact", "max_difference")
+
+    def __init__(self, members, exact, max_difference=0.0):
+        self.members = members
+        self.exact = exact
+        self.max_difference = max_difference
+
+    def __repr__(self):
+        kind = "exact" if self.exact else f"near, max {self.max_difference:.3f}"
+        return f"DuplicateGroup({len(self.members)} attenuations, {kind})"
+
+
+def _object_curves(table):
+    """Per object row: {curve type: curve row}."""
+    curves = [dict() for _ in range(len(table))]
+    for row, (obj, curve_type) in enumerate(zip(table.curve_object.tolist(), table.curve_type.tolist())):
+        curves[obj][curve_type] = row
+    return curves
+
+
+def exact_key(table, object_index, curves):
+    """Hash of the quantized normalized curves + RadiusMax of one attenuation."""
+    radius = float(table.radius_max[object_index]) or 1.0
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(np.round(radius, Y_DECIMALS).tobytes())
+    for curve_type in CURVE_TYPES:
+        row = curves.get(curve_type)
+        if row is None:
+            continue
+        x, y, shapes = table.points(row)
+        digest.update(f"{curve_type}:{table.curve_use[row]}".encode())
+        digest.update(np.round(x / radius, X_DECIMALS).tobytes())
+        digest.update(np.round(y, Y_DECIMALS).tobytes())
+        digest.update(shapes.astype(np.int8).tobytes())
+    return digest.digest()
+
+
+def curve_signatures(table, samples=SIGNATURE_SAMPLES):
+    """
+    Returns (use_keys, values): per attenuation the tuple of curve uses (one per
+    CURVE_TYPES entry, "None" when absent) and a (objects, types * samples) array of
+    its Custom curves sampled on a normalized X grid (zeros for non-Custom types).
+    """
+    grid = np.linspace(0.0, 1.0, samples)
+    values = np.zeros((len(table), len(CURVE_TYPES) * samples))
+    use_keys = []
+    for obj, curves in enumerate(_object_curves(table)):
+        radius = float(table.radius_max[obj]) or 1.0
+        uses = []
+        for t, curve_type in enumerate(CURVE_TYPES):
+            row = curves.get(curve_type)
+            use = str(table.curve_use[row]) if row is not None else "None"
+            uses.append(use)
+            if use == "Custom":
+                x, y, shapes = table.points(row)
+                values[obj, t * samples:(t + 1) * samples] = sample_curve(x / radius, y, shapes, grid)
+        use_keys.append(tuple(uses))
+    return use_keys, values
+
+
+def _components(count, pairs):
+    parent = list(range(count))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for a, b in pairs:
+        ra, rb = find(a), find(b)
+        if ra != rb:
+            parent[max(ra, rb)] = min(ra, rb)
+    groups = defaultdict(list)
+    for i in range(count):
+        groups[find(i)].append(i)
+    return [members for members in groups.values() if len(members) > 1]
+
+
+def _compress(parent):
+    """Point every entry of a union-find parent array at its root."""
+    while True:
+        grandparent = parent[parent]
+        if np.array_equal(grandparent, parent):
+            return parent
+        parent = grandparent
+
+
+def _link_close(block, members, others, tolerance, parent, link):
+    """
+    Compare rows `members` of block against rows `others`, COMPARE_ROWS others at a time
+    and about COMPARE_ELEMENTS values per comparison; link(i, j) every close pair whose
+    rows aren't linked yet. `parent` is the union-find array over block rows that link updates.
+    """
+    members, others = np.asarray(members), np.asarray(others)
+    step = max(1, COMPARE_ELEMENTS // (COMPARE_ROWS * block.shape[1]))
+    for start in range(0, len(members), step):
+        chunk = members[start:start + step]
+        parent[:] = _compress(parent)
+        chunk_roots = parent[chunk]
+        # Rows already linked together are only compared with rows outside their cluster,
+        # so a cluster of near copies costs about one comparison per row.
+        for root in np.unique(chunk_roots).tolist():
+            member_rows = chunk[chunk_roots == root]
+            member_block = block[member_rows]
+            for others_start in range(0, len(others), COMPARE_ROWS):
+                parent[:] = _compress(parent)
+                other_rows = others[others_start:others_start + COMPARE_ROWS]
+                other_rows = other_rows[parent[other_rows] != parent[member_rows[0]]]
+                if not other_rows.size:
+                    continue
+                other_block = block[other_rows]
+                # Every PREFILTER_STEP-th sample first: most pairs that differ fail there already.
+                a, b = np.nonzero(np.abs(member_block[:, None, ::PREFILTER_STEP]
+                                         - other_block[None, :, ::PREFILTER_STEP]).max(axis=2) <= tolerance)
+                close = np.abs(member_block[a] - other_block[b]).max(axis=1) <= tolerance
+                a, b = a[close], b[close]
+                # One link per cluster reached; the rest would only join what is already joined.
+                _, first = np.unique(parent[other_rows[b]], return_index=True)
+                for k in first.tolist():
+                    link(int(member_rows[a[k]]), int(other_rows[b[k]]))
+
+
+def _near_pairs(use_keys, values, candidates, tolerance, samples=SIGNATURE_SAMPLES):
+    """
+    Pairs (i, j) of `candidates` with equal use keys and max |difference| <= tolerance,
+    enough to connect every such pair (pairs already connected through others are left out).
+    """
+    by_uses = defaultdict(list)
+    for index in candidates:
+        by_uses[use_keys[index]].append(index)
+
+    offsets = [offset for offset in itertools.product((-1, 0, 1), repeat=SUMMARY_CHUNKS)
+               if offset >= (0,) * SUMMARY_CHUNKS]  # each neighbour pair of buckets once
+    pairs = []
+    for uses, group in by_uses.items():
+        if len(group) < 2:
+            continue
+        columns = np.concatenate([np.arange(t * samples, (t + 1) * samples)
+                                  for t, use in enumerate(uses) if use == "Custom"] or [np.arange(0)])
+        if not columns.size:
+            # No Custom curve: same uses means same attenuation.
+            pairs.extend((group[0], other) for other in group[1:])
+            continue
+        group = np.array(group)
+        block = values[np.ix_(group, columns)]
+        summary = np.stack([chunk.mean(axis=1) for chunk in np.array_split(block, SUMMARY_CHUNKS, axis=1)], axis=1)
+        cells = np.floor(summary / tolerance).astype(np.int64)
+
+        parent = np.arange(len(group))
+
+        def link(i, j):
+            root_i, root_j = i, j
+            while parent[root_i] != root_i:
+                root_i = parent[root_i]
+            while parent[root_j] != root_j:
+                root_j = parent[root_j]
+            if root_i != root_j:
+                parent[max(root_i, root_j)] = min(root_i, root_j)
+                pairs.append((int(group[i]), int(group[j])))
+
+        buckets = defaultdict(list)
+        for position, cell in enumerate(map(tuple, cells.tolist())):
+            buckets[cell].append(position)
+        for cell, members in buckets.items():
+            for offset in offsets:
+                others = buckets.get(tuple(c + o for c, o in zip(cell, offset)))
+                if others is not None:
+                    _link_close(block, members, others, tolerance, parent, link)
+    return pairs
+
+
+def find_duplicates(table, tolerance=DEFAULT_TOLERANCE, samples=SIGNATURE_SAMPLES):
+    """
+    Exact and near duplicate groups of a CurveTable, largest first.
+    Exact groups come from exact_key; near groups link attenuations that are not
+    exact copies of each other (each exact group takes part through one representative).
+    """
+    object_curves = _object_curves(table)
+    by_key = defaultdict(list)
+    for obj, curves in enumerate(object_curves):
+        by_key[exact_key(table, obj, curves)].append(obj)
+    exact_groups = [DuplicateGroup(members, exact=True) for members in by_key.values() if len(members) > 1]
+
+    representatives = [members[0] for members in by_key.values()]
+    copies = {members[0]: members for members in by_key.values()}
+    use_keys, values = curve_signatures(table, samples)
+    pairs = _near_pairs(use_keys, values, representatives, tolerance)
+
+    position = {obj: i for i, obj in enumerate(representatives)}
+    near_groups = []
+    for component in _components(len(representatives), [(position[a], position[b]) for a, b in pairs]):
+        reps = [representatives[i] for i in component]
+        block = values[reps]
+        # Largest difference between any two members: the widest spread of any one sample.
+        max_difference = float((block.max(axis=0) - block.min(axis=0)).max())
+        members = sorted(obj for rep in reps for obj in copies[rep])
+        near_groups.append(DuplicateGroup(members, exact=False, max_difference=max_difference))
+
+    groups = exact_groups + near_groups
+    groups.sort(key=lambda group: (-len(group.members), not group.exact))
+    return groups
+
+
+def format_report(table, groups):
+    """Plain-text listing of duplicate groups, one attenuation per line."""
+    if not groups:
+        return "No duplicate attenuations found."
+    lines = []
+    for number, group in enumerate(groups, 1):
+        kind = "identical" if group.exact else f"within {group.max_difference:.2f}"
+        lines.append(f"Group {number}: {len(group.members)} attenuations, {kind}")
+        for obj in group.members:
+            lines.append(f"  • {table.object_name[obj]}  (RadiusMax {table.radius_max[obj]:g}, {table.object_id[obj]})")
+        lines.append("")
+    return "\n".join(lines)
@@ -0,0 +1,93 @@
+"""Curve preset files: the curves Set would write, saved as JSON.
+
+    {
+      "version": 1,
+      "name": "Footsteps",
+      "curves": {
+        "VolumeDryUsage": {
+          "use": "Custom",
+          "points": [{"x": 0, "y": 0, "shape": "Log1", "absolute": false}, ...]
+        }
+      }
+    }
+
+X is a percent of the target's RadiusMax, or a literal distance for absolute points;
+shapes are WAAPI shape names (curves.SHAPE_KEYS). Loaded presets are the
+{curveType: (use, specs)} dicts batch_apply works with.
+"""
+import json
+from pathlib import Path
+
+from curves import POSITIVE_CURVES, SHAPE_CODES, attenuation_map
+
+PRESET_VERSION = 1
+CURVE_TYPES = set(attenuation_map.values())
+
+
+class PresetError(ValueError):
+    """A file that isn't a valid curve preset."""
+
+
+def save_preset(path, curves, name=""):
+    """Write {curveType: (use, specs)} to `path`."""
+    data = {
+        "version": PRESET_VERSION,
+        "name": name,
+        "curves": {
+            curve_type: {
+                "use": use,
+                "points": [
+                    {"x": ui_x, "y": y, "shape": shape_key, "absolute": is_absolute}
+                    for ui_x, y, shape_key, is_absolute in specs
+                ],
+            }
+            for curve_type, (use, specs) in curves.items()
+        },
+    }
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(data, file, indent=2)
+
+
+def _curve_specs(curve_type, points):
+    if len(points) < 2:
+        raise PresetError(f"{curve_type}: a curve needs at least 2 points")
+    specs = []
+    for point in points:
+        try:
+            spec = (float(point["x"]), float(point["y"]), str(point.get("shape", "Linear")),
+                    bool(point.get("absolute", False)))
+        except (KeyError, TypeError, ValueError) as exc:
+            raise PresetError(f"{curve_type}: invalid point {point!r}") from exc
+        if spec[2] not in SHAPE_CODES:
+            raise PresetError(f"{curve_type}: unknown shape {spec[2]}")
+        low, high = (0.0, 100.0) if curve_type in POSITIVE_CURVES else (-200.0, 0.0)
+        if not low <= spec[1] <= high:
+            raise PresetError(f"{curve_type}: Y {spec[1]:g} outside {low:g}..{high:g}")
+        specs.append(spec)
+    # Same rules as the editor: relative endpoints at 0 and 100, absolute points a prefix of the middle ones.
+    if specs[0][3] or specs[-1][3] or specs[0][0] != 0.0 or specs[-1][0] != 100.0:
+        raise PresetError(f"{curve_type}: endpoints must be relative, at X 0 and 100")
+    flags = [spec[3] for spec in specs[1:-1]]
+    if flags != sorted(flags, reverse=True):
+        raise PresetError(f"{curve_type}: absolute points must come before the relative ones")
+    return specs
+
+
+def load_preset(path):
+    """Returns (name, {curveType: (use, specs)}). Raises PresetError."""
+    try:
+        with open(path, "r", encoding="utf-8") as file:
+            data = json.load(file)
+    except (OSError, ValueError) as exc:
+        raise PresetError(f"Could not read {Path(path).name}: {exc}") from exc
+    if not isinstance(data, dict) or data.get("version") != PRESET_VERSION or not data.get("curves"):
+        raise PresetError(f"{Path(path).name} is not a curve preset")
+
+    curves = {}
+    for curve_type, curve in data["curves"].items():
+        if curve_type not in CURVE_TYPES:
+            raise PresetError(f"Unknown curve type {curve_type}")
+        use = curve.get("use", "Custom")
+        # Linked uses (UseVolumeDry...) and None still need points for setAttenuationCurve.
+        curves[curve_type] = (use, _curve_specs(curve_type, curve.get("points", [])))
+    return str(data.get("name", "")), curves
@@ -0,0 +1,255 @@
+"""Render attenuation curves to image files, offscreen and in parallel.
+
+    python render_curves.py EXPORT.npz OUT_DIR [--format png|svg] [--sheet] [--workers N]
+    python render_curves.py --live OUT_DIR [...]
+
+Run from this folder. EXPORT.npz is a file written by Export... (see curve_export);
+--live exports the connected Wwise project to OUT_DIR/curves.npz first (incrementally
+on later runs) and renders that.
+
+Each attenuation gets one image with a panel per used curve type, styled like the
+editor graph (curve_plot). --sheet draws contact sheets instead: small tiles with all
+curves of one attenuation over relative distance, SHEET_COLUMNS x SHEET_ROWS per page.
+Pages/chunks of attenuations are spread over a process pool; each worker loads the
+export once and draws on the Agg canvas directly (no pyplot, no GUI backend).
+"""
+import argparse
+import logging
+import math
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import freeze_support
+
+import numpy as np
+
+from curve_export import CURVE_TYPES, CurveTable
+from curve_plot import FIGURE_COLOR, TITLE_COLOR, apply_curve_layout, curve_color, style_axes
+from curves import POSITIVE_CURVES, attenuation_map, evaluate_curve, y_to_positions
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+PANEL_SIZE = (5, 2)  # inches, the editor graph's figsize
+PANEL_COLUMNS = 2
+SHEET_COLUMNS = 8
+SHEET_ROWS = 10
+TILE_SIZE = (2.0, 1.4)
+DPI = 100
+# Attenuations per task in per-attenuation mode; small enough to keep every worker busy.
+CHUNK_OBJECTS = 25
+CURVE_NAMES = {curve_type: name for name, curve_type in attenuation_map.items()}
+
+# Per worker process, set by _init_worker.
+_table = None
+_out_dir = None
+_fmt = None
+_figures = {}
+
+
+def _init_worker(path, out_dir, fmt):
+    global _table, _out_dir, _fmt
+    _table = CurveTable.load(path)
+    _out_dir = out_dir
+    _fmt = fmt
+
+
+def _new_figure(size):
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=size, dpi=DPI)
+    FigureCanvasAgg(fig)
+    return fig
+
+
+def image_name(name, object_id):
+    """File name stem: the attenuation name made filesystem-safe, plus its id (names can repeat)."""
+    safe = re.sub(r"[^\w.-]+", "_", name).strip("._") or "attenuation"
+    return f"{safe}_{object_id.strip('{}')[:8]}"
+
+
+def _used_curves(table, obj):
+    """(curve type, curve row) of every curve stored for object row `obj`, in CURVE_TYPES order."""
+    rows = {str(table.curve_type[row]): row for row in table.curves_of(obj).tolist()}
+    return [(curve_type, rows[curve_type]) for curve_type in CURVE_TYPES if curve_type in rows]
+
+
+class _PanelFigure:
+    """A figure with a rows x columns grid of styled panels, reused for every attenuation with that grid."""
+    __slots__ = ("fig", "panels")
+
+    def __init__(self, rows, columns):
+        width, height = PANEL_SIZE[0] * columns, PANEL_SIZE[1] * rows + 0.4
+        self.fig = _new_figure((width, height))
+        # Fixed margins (inches): tight_layout would cost a full extra draw per image.
+        self.fig.subplots_adjust(left=0.6 / width, right=1 - 0.2 / width, bottom=0.35 / height,
+                                 top=1 - 0.65 / height, wspace=0.25, hspace=0.45)
+        self.panels = []
+        for panel in range(rows * columns):
+            ax = self.fig.add_subplot(rows, columns, panel + 1)
+            style_axes(self.fig, ax)
+            curve_line, = ax.plot([], [])
+            points_line, = ax.plot([], [], 'o')
+            self.panels.append((ax, curve_line, points_line))
+
+    def draw(self, table, obj, path):
+        curves = _used_curves(table, obj)
+        self.fig.suptitle(str(table.object_name[obj]), color=TITLE_COLOR)
+        radius = float(table.radius_max[obj]) or 1.0
+        for (ax, curve_line, points_line), (curve_type, row) in zip(self.panels, curves):
+            ax.set_visible(True)
+            x, y, shapes = table.points(row)
+            db_axis = curve_type not in POSITIVE_CURVES
+            color = curve_color(curve_type)
+            curve_line.set_data(*evaluate_curve(x, y, shapes, db_axis=db_axis))
+            points_line.set_data(x, y_to_positions(y) if db_axis else y)
+            curve_line.set_color(color)
+            points_line.set_color(color)
+            chart_max = max(radius, float(x.max())) if x.size else radius
+            title = CURVE_NAMES.get(curve_type, curve_type)
+            if str(table.curve_use[row]) != "Custom":
+                title += f" ({table.curve_use[row]})"
+            apply_curve_layout(ax, curve_type, chart_max, title, title_size=9)
+        for ax, _, _ in self.panels[len(curves):]:
+            ax.set_visible(False)
+        self.fig.savefig(path, facecolor=self.fig.get_facecolor())
+
+
+def render_attenuation(table, obj, path, figures=None):
+    """
+    One image of attenuation row `obj`: a panel per used curve type, X in real distance.
+    `figures` caches _PanelFigures by grid between calls.
+    """
+    count = max(1, len(_used_curves(table, obj)))
+    columns = min(PANEL_COLUMNS, count)
+    grid = (math.ceil(count / columns), columns)
+    figures = {} if figures is None else figures
+    if grid not in figures:
+        figures[grid] = _PanelFigure(*grid)
+    figures[grid].draw(table, obj, path)
+
+
+def render_sheet(table, objects, path):
+    """Contact sheet: one tile per attenuation, every curve over relative X and a shared 0-1 Y."""
+    from matplotlib.collections import LineCollection
+
+    rows = max(1, math.ceil(len(objects) / SHEET_COLUMNS))
+    fig = _new_figure((TILE_SIZE[0] * SHEET_COLUMNS, TILE_SIZE[1] * rows))
+    fig.patch.set_facecolor(FIGURE_COLOR)
+    for tile, obj in enumerate(objects):
+        ax = fig.add_subplot(rows, SHEET_COLUMNS, tile + 1)
+        style_axes(fig, ax)
+        radius = float(table.radius_max[obj]) or 1.0
+        segments, colors = [], []
+        for curve_type, row in _used_curves(table, obj):
+            x, y, shapes = table.points(row)
+            if curve_type in POSITIVE_CURVES:
+                curve_x, curve_y = evaluate_curve(x / radius, y / 100.0, shapes)
+            else:
+                curve_x, curve_y = evaluate_curve(x / radius, y, shapes, db_axis=True)
+            segments.append(np.column_stack((curve_x, curve_y)))
+            colors.append(curve_color(curve_type))
+        ax.add_collection(LineCollection(segments, colors=colors, linewidths=1))
+        ax.set_xlim(-0.05, 1.05)
+        ax.set_ylim(-0.05, 1.05)
+        ax.set_xticks([])
+        ax.set_yticks([])
+        ax.set_title(f"{table.object_name[obj]}\n{table.radius_max[obj]:g}", color=TITLE_COLOR, fontsize=7)
+    fig.tight_layout(pad=0.4)
+    fig.savefig(path, facecolor=fig.get_facecolor())
+
+
+def _render_chunk(objects):
+    for obj in objects:
+        name = image_name(str(_table.object_name[obj]), str(_table.object_id[obj]))
+        render_attenuation(_table, obj, os.path.join(_out_dir, f"{name}.{_fmt}"), _figures)
+    return len(objects)
+
+
+def _render_page(page, objects):
+    render_sheet(_table, objects, os.path.join(_out_dir, f"sheet-{page:03d}.{_fmt}"))
+    return len(objects)
+
+
+def render_export(path, out_dir, fmt="png", sheet=False, workers=None, report=None):
+    """
+    Render every attenuation of export `path` into `out_dir`; returns the number rendered.
+        report(done, total)  progress, called as tasks finish
+    """
+    table = CurveTable.load(path)
+    if table is None:
+        raise ValueError(f"{path} is not an attenuation export")
+    os.makedirs(out_dir, exist_ok=True)
+    total = len(table)
+    per_task = SHEET_COLUMNS * SHEET_ROWS if sheet else CHUNK_OBJECTS
+    chunks = [list(range(start, min(start + per_task, total))) for start in range(0, total, per_task)]
+
+    done = 0
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(path, out_dir, fmt)) as executor:
+        if sheet:
+            futures = [executor.submit(_render_page, page, chunk) for page, chunk in enumerate(chunks, 1)]
+        else:
+            futures = [executor.submit(_render_chunk, chunk) for chunk in chunks]
+        for future in as_completed(futures):
+            done += future.result()
+            if report is not None:
+                report(done, total)
+    return done
+
+
+def export_live(out_dir):
+    """Export the connected Wwise project to out_dir/curves.npz (incremental); returns the path."""
+    from curve_export import export_curves
+    from waapi_batch import WaapiPool
+
+    os.makedirs(out_dir, exist_ok=True)
+    path = os.path.join(out_dir, "curves.npz")
+    pool = WaapiPool()
+    try:
+        info, = pool.call_many("ak.wwise.core.getProjectInfo", [("info", {})])
+        if not info.ok:
+            raise RuntimeError(f"Cannot reach Wwise: {info.error}")
+        result = export_curves(path, pool, info.result.get("name", ""),
+                               report=lambda done, total: _print_progress("Reading", done, total))
+    finally:
+        pool.close()
+    print(f"\nExported {result.objects} attenuations ({result.fetched} fetched, {result.reused} unchanged)")
+    for name, error in result.failed:
+        print(f"  failed: {name}: {error}")
+    return path
+
+
+def _print_progress(label, done, total):
+    sys.stdout.write(f"\r{label} {done}/{total}")
+    sys.stdout.flush()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render attenuation curves to PNG/SVG files.")
+    parser.add_argument("export", nargs="?", help="curve export (.npz) written by Export...")
+    parser.add_argument("out_dir", help="folder for the images")
+    parser.add_argument("--live", action="store_true", help="export the connected Wwise project first")
+    parser.add_argument("--format", choices=("png", "svg"), default="png")
+    parser.add_argument("--sheet", action="store_true", help="contact sheets instead of one image per attenuation")
+    parser.add_argument("--workers", type=int, default=None, help="render processes (default: CPU count)")
+    args = parser.parse_args(argv)
+    if args.live == bool(args.export):
+        parser.error("give either an export file or --live")
+
+    try:
+        path = export_live(args.out_dir) if args.live else args.export
+        started = time.perf_counter()
+        count = render_export(path, args.out_dir, args.format, args.sheet, args.workers,
+                              report=lambda done, total: _print_progress("Rendered", done, total))
+    except (RuntimeError, ValueError) as exc:
+        parser.exit(1, f"{exc}\n")
+    print(f"\nRendered {count} attenuations to {args.out_dir} in {time.perf_counter() - started:.1f} s")
+
+
+if __name__ == "__main__":
+    freeze_support()
+    main()
@@ -0,0 +1,95 @@
+"""Rollback snapshots for batch applies.
+
+Before Set writes anything, the current curve of every target is read and saved
+as JSON in SNAPSHOT_DIR. A failed or cancelled apply is rolled back from it right
+away; any snapshot can also be restored later by hand (Restore...). Only the
+newest KEEP_SNAPSHOTS files are kept.
+"""
+import json
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+SNAPSHOT_VERSION = 1
+KEEP_SNAPSHOTS = 20
+
+
+def _tool_dir():
+    # Next to the .exe when frozen, next to the sources otherwise.
+    if getattr(sys, "frozen", False):
+        return Path(sys.executable).resolve().parent
+    return Path(__file__).resolve().parent
+
+
+SNAPSHOT_DIR = _tool_dir() / "snapshots"
+
+
+class SnapshotError(ValueError):
+    """A file that isn't a readable rollback snapshot."""
+
+
+def snapshot_entry(obj, curve_type, curve):
+    """One target curve as stored in a snapshot; `obj` is the target (id, name, @RadiusMax)."""
+    return {
+        "id": obj["id"],
+        "name": obj.get("name", ""),
+        "@RadiusMax": obj.get("@RadiusMax", 100),
+        "curveType": curve_type,
+        "use": curve.get("use", "None"),
+        "points": curve.get("points", []),
+    }
+
+
+def save_snapshot(entries, project="", directory=SNAPSHOT_DIR):
+    """Write `entries` to a new timestamped file in `directory`; returns its path."""
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    created = time.time()
+    stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(created))
+    path = directory / f"snapshot-{stamp}-{int(created * 1000) % 1000:03d}.json"
+    data = {"version": SNAPSHOT_VERSION, "project": project, "created": created, "curves": entries}
+    tmp_path = path.with_suffix(".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as file:
+        json.dump(data, file, indent=1)
+    os.replace(tmp_path, path)
+    _prune(directory)
+    return path
+
+
+def _prune(directory, keep=KEEP_SNAPSHOTS):
+    for old in sorted(directory.glob("snapshot-*.json"))[:-keep]:
+        try:
+            old.unlink()
+        except OSError:
+            logger.warning("Could not remove old snapshot %s", old)
+
+
+def load_snapshot(path):
+    """The snapshot dict (project, created, curves) stored at `path`. Raises SnapshotError."""
+    try:
+        with open(path, "r", encoding="utf-8") as file:
+            data = json.load(file)
+    except (OSError, ValueError) as exc:
+        raise SnapshotError(f"Could not read {Path(path).name}: {exc}") from exc
+    if not isinstance(data, dict) or data.get("version") != SNAPSHOT_VERSION or "curves" not in data:
+        raise SnapshotError(f"{Path(path).name} is not an attenuation snapshot")
+    return data
+
+
+def restore_calls(entries):
+    """(entry, setAttenuationCurve args) pairs that put every snapshot curve back."""
+    calls = []
+    for entry in entries:
+        # Unused curves may come back without points; Wwise still wants some.
+        points = entry["points"] or [
+            {"x": 0.0, "y": 0.0, "shape": "Linear"},
+            {"x": float(entry["@RadiusMax"]), "y": 0.0, "shape": "Linear"},
+        ]
+        args = {"object": entry["id"], "curveType": entry["curveType"], "use": entry["use"], "points": points}
+        calls.append((entry, args))
+    return calls
@@ -0,0 +1,99 @@
+"""Resolve batch-edit targets: the Wwise selection, a WAQL query, a name pattern or ids.
+
+Resolvers return Attenuation objects with id, name, type, path and @RadiusMax,
+ready for the conflict check and the batch apply. Sounds, containers and other
+objects stand for the Attenuation they actually use: the effective (@@) values, so an
+object that inherits positioning resolves through its parent, and one with attenuation
+disabled stands for none. Those are read with one extra WAQL call and each Attenuation
+is returned once, however many objects share it.
+"""
+import fnmatch
+
+TARGET_RETURN = ["id", "name", "type", "path", "@RadiusMax", "@@EnableAttenuation", "@@Attenuation"]
+ALL_ATTENUATIONS_WAQL = "$ from type Attenuation"
+NULL_ID = "{00000000-0000-0000-0000-000000000000}"
+
+
+class TargetQueryError(ValueError):
+    """Wwise rejected a target query (usually a WAQL syntax error)."""
+
+
+def is_waql(query):
+    return query.lstrip().startswith("$")
+
+
+def _waql(client, waql):
+    result = client.call("ak.wwise.core.object.get", {"waql": waql}, options={"return": TARGET_RETURN})
+    if result is None:
+        raise TargetQueryError(f"Wwise rejected the query: {waql}")
+    return result.get("return", [])
+
+
+def selected_objects(client):
+    """The objects selected in Wwise, whatever their type."""
+    return client.call("ak.wwise.ui.getSelectedObjects", {}, options={"return": TARGET_RETURN})["objects"]
+
+
+def referenced_attenuation_id(obj):
+    """
+    Id of the Attenuation ShareSet `obj` uses, or None. Effective values: with
+    OverridePositioning off, Wwise resolves @@EnableAttenuation and @@Attenuation from
+    the parent that sets positioning, not the object's own (stale) reference.
+    """
+    if not obj.get("@@EnableAttenuation", False):
+        return None
+    reference = obj.get("@@Attenuation") or {}
+    reference_id = reference.get("id")
+    return reference_id if reference_id and reference_id != NULL_ID else None
+
+
+def attenuations_of(client, objects):
+    """
+    The Attenuations among `objects` plus the ones the other objects reference,
+    each once, in first-seen order.
+    """
+    targets = {}
+    referenced = []
+    for obj in objects:
+        if obj.get("type") == "Attenuation":
+            targets.setdefault(obj["id"], obj)
+        else:
+            reference_id = referenced_attenuation_id(obj)
+            if reference_id is not None:
+                referenced.append(reference_id)
+    missing = [i for i in dict.fromkeys(referenced) if i not in targets]
+    if missing:
+        for obj in _waql(client, "$ " + ", ".join(f'"{i}"' for i in missing)):
+            targets.setdefault(obj["id"], obj)
+    return list(targets.values())
+
+
+def resolve_ids(client, object_ids):
+    """Attenuations for a list of object ids (Attenuations, or sounds/containers using one)."""
+    object_ids = list(dict.fromkeys(object_ids))
+    if not object_ids:
+        return []
+    return attenuations_of(client, _waql(client, "$ " + ", ".join(f'"{i}"' for i in object_ids)))
+
+
+def resolve_targets(client, query):
+    """
+    Attenuations for `query`:
+        ""             the objects selected in Wwise
+        "$ ..."        a WAQL query, e.g. $ "\\Attenuations\\Default Work Unit" select descendants;
+                       results without an Attenuation (work units, folders...) are dropped
+        anything else  a name pattern (fnmatch, case-insensitive), e.g. Footstep_*;
+                       with a backslash it is matched against the full path instead
+    """
+    query = query.strip()
+    if not query:
+        return attenuations_of(client, selected_objects(client))
+    if is_waql(query):
+        return attenuations_of(client, _waql(client, query))
+
+    field = "path" if "\\" in query else "name"
+    pattern = query.lower()
+    return [
+        obj for obj in _waql(client, ALL_ATTENUATIONS_WAQL)
+        if fnmatch.fnmatchcase(obj.get(field, "").lower(), pattern)
+    ]
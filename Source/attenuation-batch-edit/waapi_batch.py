@@ -0,0 +1,112 @@
+"""Pipelined WAAPI calls for batch edits.
+
+A WaapiClient handles its requests one at a time, so keeping many calls in flight
+needs several connections. WaapiPool lazily opens one connection per worker thread
+and fans a list of calls out over them; results come back per call, in input order.
+"""
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from waapi import WaapiClient
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+DEFAULT_CONCURRENCY = 8
+
+
+class CallResult:
+    """Outcome of one call of a batch. `key` is whatever the caller used to identify the call."""
+    __slots__ = ("key", "result", "error")
+
+    def __init__(self, key, result=None, error=None):
+        self.key = key
+        self.result = result
+        self.error = error
+
+    @property
+    def ok(self):
+        return self.error is None
+
+    def __repr__(self):
+        return f"CallResult({self.key!r}, ok={self.ok})"
+
+
+def _error_message(exc):
+    # WaapiRequestFailed carries Wwise's own message in kwargs; prefer it over the URI.
+    kwargs = getattr(exc, "kwargs", None)
+    if isinstance(kwargs, dict) and kwargs.get("message"):
+        return kwargs["message"]
+    return str(exc) or type(exc).__name__
+
+
+class WaapiPool:
+    def __init__(self, concurrency=DEFAULT_CONCURRENCY, url=None):
+        self.concurrency = max(1, int(concurrency))
+        self.url = url
+        self._local = threading.local()
+        self._clients = []
+        self._clients_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="waapi")
+
+    def _client(self):
+        client = getattr(self._local, "client", None)
+        if client is None:
+            client = WaapiClient(url=self.url, allow_exception=True)
+            self._local.client = client
+            with self._clients_lock:
+                self._clients.append(client)
+        return client
+
+    def _run_one(self, key, uri, args, options, cancel_event):
+        if cancel_event is not None and cancel_event.is_set():
+            return CallResult(key, error="Cancelled")
+        try:
+            if options:
+                result = self._client().call(uri, args, options=options)
+            else:
+                result = self._client().call(uri, args)
+        except Exception as exc:
+            logger.debug("%s failed for %r: %s", uri, key, exc)
+            return CallResult(key, error=_error_message(exc))
+        if result is None:
+            return CallResult(key, error="No response from Wwise")
+        return CallResult(key, result=result)
+
+    def call_many(self, uri, calls, options=None, on_progress=None, cancel_event=None):
+        """
+        Run `uri` once per (key, args) in `calls`, up to `concurrency` at a time.
+            on_progress(done, total)  called from worker threads after each call
+            cancel_event              threading.Event; calls not started yet return "Cancelled"
+        Blocks until every call finished; returns CallResults in input order.
+        """
+        calls = list(calls)
+        total = len(calls)
+        done = 0
+        done_lock = threading.Lock()
+
+        def _count(_future):
+            nonlocal done
+            with done_lock:
+                done += 1
+                current = done
+            if on_progress is not None:
+                on_progress(current, total)
+
+        futures = []
+        for key, args in calls:
+            future = self._executor.submit(self._run_one, key, uri, args, options, cancel_event)
+            future.add_done_callback(_count)
+            futures.append(future)
+        return [future.result() for future in futures]
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+        with self._clients_lock:
+            clients, self._clients = self._clients, []
+        for client in clients:
+            try:
+                client.disconnect()
+            except Exception:
+                logger.exception("Failed to disconnect pooled WAAPI client")
@@ -1,4 +1,9 @@
 
+import json
+import os
+import re
+import sys
+import time
 import traceback
 import customtkinter
 
@@ -9,7 +14,7 @@ from customtkinter import (
     CTkCheckBox,
     CTkLabel,
     CTkEntry,
-    CTkScrollableFrame
+    CTkScrollbar
 )
 
 from waapi import WaapiClient
@@ -18,104 +23,160 @@ ver = "v1.0.0"
 
 DARK_BG = "#2E2E2E"  
 GREY_BG = "#212120"
+ROW_HEIGHT = 42  # fixed slot height of one sound row in the list view
+
+NULL_GUID = "{00000000-0000-0000-0000-000000000000}"
+GUID_PATTERN = re.compile(r"^\{[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-[0-9A-Fa-f]{4}-[0-9A-Fa-f]{4}-[0-9A-Fa-f]{12}\}$")
+# Transports pre-warmed per Tk tick after an import; each one is a WAAPI round trip
+PREWARM_BATCH = 10
+PREWARM_INTERVAL_MS = 10
 
 def truncate_text(text, max_chars=40):
     return text if len(text) <= max_chars else text[:max_chars - 3] + "..."
 
-# Class representing sounds
+def get_resource_path(filename):
+    # Running  „frozen” (.exe)
+    if getattr(sys, 'frozen', False):
+        base_path = os.path.dirname(sys.executable)
+    else:
+        # Running as  .py
+        base_path = os.path.dirname(os.path.realpath(__file__))
+
+    return os.path.join(base_path, filename)
+
+# Original UserAuxSend0 / OverrideUserAuxSends of every tracked sound, kept until restored
+AUX_SNAPSHOT_PATH = get_resource_path("aux_send_snapshot.json")
+
+def load_aux_snapshot():
+    if not os.path.exists(AUX_SNAPSHOT_PATH):
+        return {}
+    try:
+        with open(AUX_SNAPSHOT_PATH, "r", encoding="utf-8") as file:
+            return json.load(file).get("sounds", {})
+    except Exception as e:
+        print(f"Could not read AUX snapshot: {e}")
+        return {}
+
+def save_aux_snapshot(snapshot):
+    try:
+        with open(AUX_SNAPSHOT_PATH, "w", encoding="utf-8") as file:
+            json.dump({"sounds": snapshot}, file, indent=4)
+    except Exception as e:
+        print(f"Could not save AUX snapshot: {e}")
+
+def is_guid(value):
+    return bool(GUID_PATTERN.match(value or ""))
+
+def get_aux_sends(client, sound_ids):
+    # None when Wwise rejects the call (WaapiClient returns None on error)
+    try:
+        result = client.call(
+            "ak.wwise.core.object.get",
+            {"from": {"id": list(sound_ids)}},
+            {"return": ["id", "@UserAuxSend0", "@OverrideUserAuxSends"]}
+        )
+    except Exception as e:
+        print(f"Error reading AUX sends: {e}")
+        return None
+    if result is None:
+        return None
+    snapshot = {}
+    for obj in result.get("return", []):
+        aux_ref = obj.get("@UserAuxSend0") or {}
+        snapshot[obj["id"]] = {
+            "aux": aux_ref.get("id") or NULL_GUID,
+            "override": bool(obj.get("@OverrideUserAuxSends", False)),
+        }
+    return snapshot
+
+def read_aux_sends(client, sound_ids):
+    # One bulk read of the current aux reference and override flag of every sound.
+    # A stale id fails the whole call, so then each sound is read alone; unreadable ones are left out.
+    sound_ids = list(sound_ids)
+    snapshot = get_aux_sends(client, sound_ids)
+    if snapshot is not None or len(sound_ids) < 2:
+        return snapshot or {}
+    snapshot = {}
+    for sound_id in sound_ids:
+        snapshot.update(get_aux_sends(client, [sound_id]) or {})
+    return snapshot
+
+def set_aux_sends(client, values):
+    try:
+        return client.call("ak.wwise.core.object.set", {
+            "objects": [
+                {
+                    "object": sound_id,
+                    "@UserAuxSend0": value["aux"],
+                    "@OverrideUserAuxSends": value["override"],
+                }
+                for sound_id, value in values.items()
+            ]
+        }) is not None
+    except Exception as e:
+        print(f"Error setting AUX sends: {e}")
+        return False
+
+def write_aux_sends(client, values):
+    # values: {sound_id: {"aux": guid, "override": bool}} -> one batched object.set,
+    # or one set per sound if Wwise rejects the batch. Returns the ids that couldn't be written.
+    if not values or set_aux_sends(client, values):
+        return []
+    if len(values) == 1:
+        return list(values)
+    return [
+        sound_id for sound_id, value in values.items()
+        if not set_aux_sends(client, {sound_id: value})
+    ]
+
+def restore_aux_snapshot(client, snapshot):
+    # Returns the part of the snapshot that couldn't be written back; it stays on disk
+    failed = write_aux_sends(client, snapshot)
+    remaining = {sound_id: snapshot[sound_id] for sound_id in failed}
+    print(f"Restored AUX sends of {len(snapshot) - len(remaining)} sound(s).")
+    if remaining:
+        print(f"Could not restore {len(remaining)} sound(s), kept in {AUX_SNAPSHOT_PATH}: "
+              + ", ".join(remaining))
+        save_aux_snapshot(remaining)
+    elif os.path.exists(AUX_SNAPSHOT_PATH):
+        os.remove(AUX_SNAPSHOT_PATH)
+    return remaining
+
+# Class representing sounds (model only; rows are drawn by SoundListView)
 class Sound:
-    def __init__(self, parent, app, index, on_delete=lambda idx: None):
+    __slots__ = ("app", "object_id", "name", "loop", "is_playing", "transport_id", "scheduler")
+
+    def __init__(self, app, object_id="", name="Name"):
         self.app = app          # Reference to main app
-        self.index = index
-        self.on_delete = on_delete
+        self.object_id = object_id
+        self.name = name
+        self.loop = False
         self.is_playing = False
         self.transport_id = None
-        self.current_object_id = None
-
-        # Frame for sounds
-        self.frame = CTkFrame(parent, fg_color=DARK_BG)
-        self.frame.pack(fill="x", pady=5)
-
-        # Columns configuration
-        self.frame.columnconfigure(0, weight=0)
-        self.frame.columnconfigure(1, weight=1)
-        self.frame.columnconfigure(2, weight=0)
-        self.frame.columnconfigure(3, weight=0)
-        self.frame.columnconfigure(4, weight=0)
-        self.frame.columnconfigure(5, weight=0)
-
-        self.sound_id_entry = CTkEntry(
-            self.frame,
-            width=100,
-            placeholder_text="Sound ID"
-        )
-        self.sound_id_entry.grid(row=0, column=0, padx=5)
-        self.sound_id_entry.bind("<KeyRelease>", lambda e: self.get_object_name())
-
-        self.sound_name_label = CTkLabel(
-            self.frame,
-            text="Name"
-        )
-        self.sound_name_label.grid(row=0, column=1, padx=5, sticky="w")
-
-        # Text icon placeholder
-        self.icon_label = CTkLabel(
-            self.frame,
-            text="",
-            width=20,
-            fg_color=DARK_BG
-        )
-        self.icon_label.grid(row=0, column=2, padx=5)
-
-        self.loop_check = CTkCheckBox(
-            self.frame,
-            text="Loop",
-            fg_color=DARK_BG
-        )
-        self.loop_check.grid(row=0, column=3, padx=5)
+        self.scheduler = None
 
-        self.play_stop_button = CTkButton(
-            self.frame,
-            text="Play",
-            width=45,
-            fg_color=("#337733", "#337733"),
-            hover_color=("#449944", "#449944"),
-            command=self.toggle_play_stop
-        )
-        self.play_stop_button.grid(row=0, column=4, padx=5)
-
-        self.delete_button = CTkButton(
-            self.frame,
-            text="Delete",
-            fg_color=("#803333", "#803333"),
-            hover_color=("#993333", "#993333"),
-            width=50,
-            command=lambda: self.on_delete(self.index)
-        )
-        self.delete_button.grid(row=0, column=5, padx=5)
+    def set_object_id(self, object_id):
+        # If user entered a new ID - Reset Transport
+        if self.object_id != object_id:
+            self.destroy_transport()
+            self.object_id = object_id
 
     def get_object_name(self):
         try:
-            object_id = self.sound_id_entry.get().strip()
+            object_id = self.object_id
             if not object_id:
-                self.sound_name_label.configure(text="")
+                self.name = ""
                 return
 
-            # If user entered a new ID - Reset Transport
-            
-            if self.current_object_id != object_id:
-                self.current_object_id = object_id
-                self.transport_id = None
-
             if not self.app.client:
-                self.sound_name_label.configure(text="No WAAPI client")
+                self.name = "No WAAPI client"
                 return
 
             # GUID validation
             if len(object_id) == 38 and object_id.startswith('{') and object_id.endswith('}'):
                 id_value = object_id
             else:
-                self.sound_name_label.configure(text="Invalid ID format")
+                self.name = "Invalid ID format"
                 return
 
             try:
@@ -125,17 +186,19 @@ class Sound:
                     {"return": ["id", "type", "name"]}
                 )
                 if result and "return" in result and len(result["return"]) > 0:
-                    name = result["return"][0].get("name")
-                    self.sound_name_label.configure(text=name)
+                    self.name = result["return"][0].get("name")
+                    # Pre-warm the transport so the first Play has no setup round trip
+                    if not self.transport_id:
+                        self.app.prewarm_transports([self])
                 else:
-                    self.sound_name_label.configure(text="Object not found")
+                    self.name = "Object not found"
             except Exception as api_error:
                 print(f"WAAPI error: {api_error}")
-                self.sound_name_label.configure(text="Invalid ID")
+                self.name = "Invalid ID"
         except Exception as e:
             traceback.print_exc()
             print(f"Error in get_object_name: {e}")
-            self.sound_name_label.configure(text="Error")
+            self.name = "Error"
 
     def create_transport(self, object_id):
         if not self.app.client:
@@ -148,12 +211,22 @@ class Sound:
             traceback.print_exc()
             print(f"Error creating transport: {e}")
 
+    def destroy_transport(self):
+        # Transports live in Wwise until destroyed, so every one created here is destroyed here
+        transport_id, self.transport_id = self.transport_id, None
+        if not transport_id or not self.app.client:
+            return
+        try:
+            self.app.client.call("ak.wwise.core.transport.destroy", {"transport": transport_id})
+        except Exception as e:
+            print(f"Error destroying transport: {e}")
+
     def schedule_check_state(self, delay_ms=400):
-        self.icon_label.after(delay_ms, self.check_state_and_loop)
+        self.app.after(delay_ms, self.check_state_and_loop)
 
     def check_state_and_loop(self):
-        # If the sound is not supposed to be playing, exit the function
-        if not self.is_playing:
+        # Only single (non-scheduled) plays are polled; loops and sequences run on the scheduler
+        if not self.is_playing or self.scheduler is not None:
             return
 
         if not self.transport_id or not self.app.client:
@@ -166,43 +239,11 @@ class Sound:
                 return
 
             current_state = state_response.get("state", "").lower().strip()
-            print(f"[Sound {self.index}] Transport state: {repr(current_state)}")
+            print(f"[Sound {self.object_id}] Transport state: {repr(current_state)}")
 
             if current_state in ["stopped", "finished", "ended"]:
-                # If loop is enabled and sound should continue playing, delay before replaying
-                if self.loop_check.get() == 1 and self.is_playing:
-                    try:
-                        delay_str = self.app.sequence_delay_entry.get().strip()
-                        delay = int(delay_str) if delay_str else 0
-                    except Exception as ex:
-                        delay = 0
-                    # Delay the playback by the specified delay
-                    self.app.after(delay, lambda: self.app.client.call("ak.wwise.core.transport.executeAction",
-                                                                    {"transport": self.transport_id, "action": "play"}))
-                    # Schedule the next state check with the same delay
-                    self.schedule_check_state(delay_ms=delay)
-                    return
-                else:
-                    self.is_playing = False
-                    self.play_stop_button.configure(
-                        text="Play",
-                        fg_color=("#337733", "#337733"),
-                        hover_color=("#449944", "#449944")
-                    )
-                    self.sound_id_entry.configure(state="normal")
-                    self.loop_check.configure(state="normal")
-                    self.delete_button.configure(state="normal")
-                    self.clear_icon()
-
-                    if self.app.var_sequence.get() and not self.app.sequence_stopped:
-                        next_index = (self.index + 1) % len(self.app.sound_list)
-                        try:
-                            delay_str = self.app.sequence_delay_entry.get().strip()
-                            delay = int(delay_str) if delay_str else 0
-                        except Exception as ex:
-                            delay = 0
-                        self.app.after(delay, lambda: self.app.sound_list[next_index].toggle_play_stop(sequence_playing=True))
-                    return
+                self.mark_stopped()
+                return
 
             if self.is_playing:
                 self.schedule_check_state()
@@ -210,71 +251,394 @@ class Sound:
             traceback.print_exc()
             print(f"Error in check_state_and_loop: {e}")
 
+    def mark_playing(self):
+        self.is_playing = True
+        self.app.sound_view.refresh_sound(self)
 
+    def mark_stopped(self, refresh=True):
+        self.is_playing = False
+        if refresh:
+            self.app.sound_view.refresh_sound(self)
 
-    def toggle_play_stop(self, sequence_playing=False):
-        object_id = self.sound_id_entry.get().strip()
-        if not object_id:
+    def ensure_transport(self):
+        if not self.object_id:
             print("No sound ID provided.")
-            return
+            return False
 
         if not self.app.client:
             print("WAAPI client not connected.")
-            return
+            return False
 
         if not self.transport_id:
-            self.create_transport(object_id)
+            self.create_transport(self.object_id)
             if not self.transport_id:
                 print("No transport ID created.")
-                return
+                return False
+        return True
 
-        try:
-            if not self.is_playing:
-                if sequence_playing and self.app.sequence_stopped:
-                    return
-
-                self.app.sequence_stopped = False
-                self.is_playing = True
-                self.play_stop_button.configure(
-                    text="Stop",
-                    fg_color=("#883333", "#883333"),
-                    hover_color=("#993333", "#993333")
-                )
-                self.sound_id_entry.configure(state="disabled")
-                self.loop_check.configure(state="disabled")
-                self.delete_button.configure(state="disabled")
+    def play(self):
+        play_args = {"transport": self.transport_id, "action": "play"}
+        self.app.client.call("ak.wwise.core.transport.executeAction", play_args)
 
-                
-                # Use text character "▶" as "playin sound icon"
-                self.icon_label.configure(text="▶")
+    def toggle_play_stop(self):
+        if not self.is_playing:
+            # A sound waiting its turn in a running sequence/loop: end that timeline first, or
+            # this play would go unpolled (check_state_and_loop leaves scheduled sounds alone)
+            if self.scheduler is not None:
+                self.scheduler.stop()
+            if self.app.var_sequence.get():
+                self.app.start_sequence(self.app.sound_list.index(self))
+                return
+            if self.loop:
+                self.app.start_loop(self)
+                return
 
-                play_args = {"transport": self.transport_id, "action": "play"}
-                self.app.client.call("ak.wwise.core.transport.executeAction", play_args)
+        if not self.ensure_transport():
+            return
 
+        try:
+            if not self.is_playing:
+                self.mark_playing()
+                self.play()
                 self.schedule_check_state()
+            elif self.scheduler is not None:
+                self.scheduler.stop()
             else:
                 stop_args = {"transport": self.transport_id, "action": "stop"}
                 self.app.client.call("ak.wwise.core.transport.executeAction", stop_args)
-                self.is_playing = False
-
-                self.play_stop_button.configure(
-                    text="Play",
-                    fg_color=("#337733", "#337733"),
-                    hover_color=("#449944", "#449944")
-                )
-                self.sound_id_entry.configure(state="normal")
-                self.loop_check.configure(state="normal")
-                self.delete_button.configure(state="normal")
-                self.clear_icon()
+                self.mark_stopped()
         except Exception as e:
             traceback.print_exc()
             print(f"Error in toggle_play_stop: {e}")
-            
-    def clear_icon(self):
-     
-        #Remove "icon" 
-        self.icon_label.configure(text="")
-        self.icon_label.update_idletasks()
+
+# One recycled row of widgets, bound to whichever Sound is scrolled into its slot
+class SoundRow:
+    def __init__(self, parent, app):
+        self.app = app
+        self.sound = None
+
+        # Frame for sounds
+        self.frame = CTkFrame(parent, fg_color=DARK_BG, height=ROW_HEIGHT - 10)
+
+        # Columns configuration
+        self.frame.columnconfigure(0, weight=0)
+        self.frame.columnconfigure(1, weight=1)
+        self.frame.columnconfigure(2, weight=0)
+        self.frame.columnconfigure(3, weight=0)
+        self.frame.columnconfigure(4, weight=0)
+        self.frame.columnconfigure(5, weight=0)
+
+        self.sound_id_entry = CTkEntry(
+            self.frame,
+            width=100,
+            placeholder_text="Sound ID"
+        )
+        self.sound_id_entry.grid(row=0, column=0, padx=5)
+        self.sound_id_entry.bind("<KeyRelease>", lambda e: self.on_id_edited())
+
+        self.sound_name_label = CTkLabel(
+            self.frame,
+            text="Name"
+        )
+        self.sound_name_label.grid(row=0, column=1, padx=5, sticky="w")
+
+        # Text icon placeholder
+        self.icon_label = CTkLabel(
+            self.frame,
+            text="",
+            width=20,
+            fg_color=DARK_BG
+        )
+        self.icon_label.grid(row=0, column=2, padx=5)
+
+        self.loop_check = CTkCheckBox(
+            self.frame,
+            text="Loop",
+            fg_color=DARK_BG,
+            command=self.on_loop_toggled
+        )
+        self.loop_check.grid(row=0, column=3, padx=5)
+
+        self.play_stop_button = CTkButton(
+            self.frame,
+            text="Play",
+            width=45,
+            fg_color=("#337733", "#337733"),
+            hover_color=("#449944", "#449944"),
+            command=lambda: self.sound and self.sound.toggle_play_stop()
+        )
+        self.play_stop_button.grid(row=0, column=4, padx=5)
+
+        self.delete_button = CTkButton(
+            self.frame,
+            text="Delete",
+            fg_color=("#803333", "#803333"),
+            hover_color=("#993333", "#993333"),
+            width=50,
+            command=lambda: self.sound and self.app.delete_sound(self.sound)
+        )
+        self.delete_button.grid(row=0, column=5, padx=5)
+
+    def on_id_edited(self):
+        if self.sound is None or self.sound.is_playing:
+            return
+        self.sound.set_object_id(self.sound_id_entry.get().strip())
+        self.sound.get_object_name()
+        self.sound_name_label.configure(text=self.sound.name)
+
+    def on_loop_toggled(self):
+        if self.sound is not None:
+            self.sound.loop = self.loop_check.get() == 1
+
+    def bind_sound(self, sound):
+        self.sound = sound
+        state = "disabled" if sound.is_playing else "normal"
+
+        self.sound_id_entry.configure(state="normal")
+        if self.sound_id_entry.get() != sound.object_id:
+            self.sound_id_entry.delete(0, "end")
+            if sound.object_id:
+                self.sound_id_entry.insert(0, sound.object_id)
+        self.sound_id_entry.configure(state=state)
+
+        self.sound_name_label.configure(text=sound.name)
+        self.icon_label.configure(text="▶" if sound.is_playing else "")
+
+        self.loop_check.configure(state="normal")
+        if sound.loop:
+            self.loop_check.select()
+        else:
+            self.loop_check.deselect()
+        self.loop_check.configure(state=state)
+
+        if sound.is_playing:
+            self.play_stop_button.configure(
+                text="Stop",
+                fg_color=("#883333", "#883333"),
+                hover_color=("#993333", "#993333")
+            )
+        else:
+            self.play_stop_button.configure(
+                text="Play",
+                fg_color=("#337733", "#337733"),
+                hover_color=("#449944", "#449944")
+            )
+        self.delete_button.configure(state=state)
+
+# Virtualized list: only as many SoundRow widgets as fit on screen, rebound on scroll
+class SoundListView(CTkFrame):
+    WHEEL_ROWS = 3
+
+    def __init__(self, parent, app, **kwargs):
+        super().__init__(parent, **kwargs)
+        self.app = app
+        self.first_index = 0
+        self.pool = []
+
+        self.rows_frame = CTkFrame(self, fg_color=DARK_BG)
+        self.rows_frame.pack(side="left", fill="both", expand=True)
+        self.scrollbar = CTkScrollbar(self, command=self.yview)
+        self.scrollbar.pack(side="right", fill="y")
+
+        self.rows_frame.bind("<Configure>", lambda e: self.resize_pool(e.height))
+        # CTk widgets refuse bind_all; the toplevel's bindtag sees the wheel over any child widget
+        toplevel = self.winfo_toplevel()
+        toplevel.bind("<MouseWheel>", self.on_mousewheel, add="+")
+        toplevel.bind("<Button-4>", lambda e: self.on_mousewheel(e, -1), add="+")
+        toplevel.bind("<Button-5>", lambda e: self.on_mousewheel(e, 1), add="+")
+
+    @property
+    def sounds(self):
+        return self.app.sound_list
+
+    def visible_count(self):
+        return len(self.pool)
+
+    def resize_pool(self, height):
+        wanted = max(1, height // ROW_HEIGHT)
+        while len(self.pool) < wanted:
+            self.pool.append(SoundRow(self.rows_frame, self.app))
+        while len(self.pool) > wanted:
+            self.pool.pop().frame.destroy()
+        self.refresh()
+
+    def max_first_index(self):
+        return max(0, len(self.sounds) - self.visible_count())
+
+    def scroll_to(self, first_index):
+        first_index = max(0, min(first_index, self.max_first_index()))
+        if first_index != self.first_index:
+            self.first_index = first_index
+            self.refresh()
+
+    def scroll_to_end(self):
+        self.scroll_to(self.max_first_index())
+        self.refresh()
+
+    def yview(self, *args):
+        # Scrollbar protocol: ("moveto", fraction) or ("scroll", n, "units"/"pages")
+        if args[0] == "moveto":
+            self.scroll_to(round(float(args[1]) * len(self.sounds)))
+        elif args[0] == "scroll":
+            step = self.visible_count() if args[2] == "pages" else 1
+            self.scroll_to(self.first_index + int(args[1]) * step)
+
+    def is_pointer_over(self, event):
+        # The widget under the pointer, not event.widget: on Windows the wheel goes to the focus widget
+        under = self.winfo_containing(event.x_root, event.y_root)
+        path = str(self)
+        return under is not None and (str(under) == path or str(under).startswith(path + "."))
+
+    def on_mousewheel(self, event, direction=None):
+        if not self.is_pointer_over(event):
+            return
+        if direction is None:
+            direction = -1 if event.delta > 0 else 1
+        self.scroll_to(self.first_index + direction * self.WHEEL_ROWS)
+
+    def refresh(self):
+        self.first_index = max(0, min(self.first_index, self.max_first_index()))
+        for slot, row in enumerate(self.pool):
+            index = self.first_index + slot
+            if index < len(self.sounds):
+                row.bind_sound(self.sounds[index])
+                row.frame.place(x=0, y=slot * ROW_HEIGHT + 5, relwidth=1.0)
+            else:
+                row.sound = None
+                row.frame.place_forget()
+
+        total = len(self.sounds)
+        if total:
+            self.scrollbar.set(self.first_index / total,
+                               min(1.0, (self.first_index + self.visible_count()) / total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def refresh_sound(self, sound):
+        for row in self.pool:
+            if row.sound is sound:
+                row.bind_sound(sound)
+                return
+
+# Plays a list of sounds from a monotonic-clock timeline instead of chained after() calls
+class SequenceScheduler:
+    POLL_MS = 50          # state polling for sounds whose duration Wwise can't report
+    EARLY_TOLERANCE = 0.002
+
+    def __init__(self, app, sounds, gap_ms=0, loops=0):
+        self.app = app
+        self.sounds = list(sounds)
+        self.gap = max(0, gap_ms) / 1000.0
+        self.loops = loops      # 0 = endless
+        self.durations = {}
+        self.step = 0
+        self.next_due = None
+        self.current = None
+        self.lateness = []
+        self.after_id = None
+        self.running = False
+
+    def start(self):
+        self.sounds = [s for s in self.sounds if s.ensure_transport()]
+        if not self.sounds:
+            return False
+        self.durations = self.app.fetch_durations(self.sounds)
+        self.running = True
+        for sound in self.sounds:
+            sound.scheduler = self
+        self.next_due = time.monotonic()
+        self._schedule()
+        return True
+
+    def stop(self, stop_transport=True):
+        if not self.running:
+            return
+        self.running = False
+        if self.after_id:
+            self.app.after_cancel(self.after_id)
+            self.after_id = None
+        if stop_transport and self.current is not None and self.current.is_playing:
+            try:
+                self.app.client.call("ak.wwise.core.transport.executeAction",
+                                     {"transport": self.current.transport_id, "action": "stop"})
+            except Exception as e:
+                print(f"Error stopping sequence: {e}")
+        for sound in self.sounds:
+            sound.scheduler = None
+        self.app.on_scheduler_finished(self)
+
+    def _schedule(self):
+        delay_ms = max(0, int((self.next_due - time.monotonic()) * 1000))
+        self.after_id = self.app.after(delay_ms, self._fire)
+
+    def _fire(self):
+        self.after_id = None
+        if not self.running:
+            return
+        now = time.monotonic()
+        # Tk rounds after() to whole milliseconds; never start early
+        if self.next_due - now > self.EARLY_TOLERANCE:
+            self._schedule()
+            return
+
+        if self.current is not None:
+            self.current.mark_stopped()
+            self.current = None
+
+        if self.loops and self.step >= self.loops * len(self.sounds):
+            self.stop()
+            return
+
+        sound = self.sounds[self.step % len(self.sounds)]
+        try:
+            sound.play()
+        except Exception as e:
+            traceback.print_exc()
+            print(f"Error in sequence playback: {e}")
+            self.stop()
+            return
+        self.lateness.append(now - self.next_due)
+        sound.mark_playing()
+        self.current = sound
+        self.step += 1
+
+        duration = self.durations.get(sound.object_id)
+        if duration is None:
+            self.after_id = self.app.after(self.POLL_MS, self._poll_current)
+        else:
+            # Advance from the planned start, not from now, so lateness never accumulates
+            self.next_due += duration + self.gap
+            self._schedule()
+
+    def _poll_current(self):
+        self.after_id = None
+        if not self.running or self.current is None:
+            return
+        try:
+            state_response = self.app.client.call(
+                "ak.wwise.core.transport.getState", {"transport": self.current.transport_id}
+            )
+            state = (state_response or {}).get("state", "").lower().strip()
+        except Exception as e:
+            traceback.print_exc()
+            print(f"Error polling transport state: {e}")
+            state = "stopped"
+
+        if state in ["stopped", "finished", "ended"]:
+            self.next_due = time.monotonic() + self.gap
+            self._schedule()
+        else:
+            self.after_id = self.app.after(self.POLL_MS, self._poll_current)
+
+    def jitter_report(self):
+        if not self.lateness:
+            return None
+        lateness_ms = [t * 1000.0 for t in self.lateness]
+        return {
+            "starts": len(lateness_ms),
+            "mean_ms": sum(lateness_ms) / len(lateness_ms),
+            "max_ms": max(lateness_ms),
+        }
 
 # Main App
 class MainApp(CTk):
@@ -298,8 +662,14 @@ class MainApp(CTk):
             self.project_name = "Not Connected"
 
         self.sound_list = []
+        self.prewarm_queue = []
+        self.prewarm_after_id = None
         self.subscription_id = None
-        self.sequence_stopped = False
+        self.schedulers = []
+        # Loaded from disk so a snapshot left by a crashed session is never overwritten
+        self.aux_snapshot = load_aux_snapshot()
+        if self.aux_snapshot:
+            print(f"Found AUX snapshot of {len(self.aux_snapshot)} sound(s); use Restore AUX to revert them.")
 
         self.configure(fg_color=DARK_BG)
 
@@ -323,6 +693,16 @@ class MainApp(CTk):
         )
         self.toggle_aux_button.pack(side="left", padx=(0,5))
 
+        self.restore_aux_button = CTkButton(
+            self.aux_button_icon_frame,
+            text="Restore AUX",
+            width=90,
+            fg_color=("#333333", "#333333"),
+            hover_color=("#444444", "#444444"),
+            command=self.restore_aux_sends
+        )
+        self.restore_aux_button.pack(side="left", padx=(0,5))
+
         self.aux_icon_label = CTkLabel(
             self.aux_button_icon_frame,
             text="",  # Initially an empty label for animation
@@ -346,10 +726,12 @@ class MainApp(CTk):
 
         # Sequence controls and buttons for adding/stopping
         self.sequence_delay_entry = CTkEntry(self.control_frame, width=70, placeholder_text="Delay(ms)")
+        self.sequence_loops_entry = CTkEntry(self.control_frame, width=55, placeholder_text="Loops")
         self.sequence_check = CTkCheckBox(self.control_frame, text="Sequence", fg_color=DARK_BG)
         self.var_sequence = customtkinter.BooleanVar()
         self.sequence_check.configure(variable=self.var_sequence)
         self.sequence_check.pack(side="right", padx=(5,5))
+        self.sequence_loops_entry.pack(side="right", padx=(5,5))
         self.sequence_delay_entry.pack(side="right", padx=(5,5))
         self.sequence_stop_button = CTkButton(
             self.control_frame,
@@ -369,10 +751,19 @@ class MainApp(CTk):
             command=self.add_sound
         )
         self.add_sound_button.pack(side="right", padx=(10,0))
+        self.import_selection_button = CTkButton(
+            self.control_frame,
+            text="Import",
+            width=60,
+            fg_color=("#333333", "#333333"),
+            hover_color=("#444444", "#444444"),
+            command=self.import_selection
+        )
+        self.import_selection_button.pack(side="right", padx=(10,0))
 
         #Scrollable Frame for sounds
-        self.sound_frame = CTkScrollableFrame(self.main_frame, fg_color=DARK_BG)
-        self.sound_frame.pack(fill="both", expand=True, padx=5, pady=5)
+        self.sound_view = SoundListView(self.main_frame, self, fg_color=DARK_BG)
+        self.sound_view.pack(fill="both", expand=True, padx=5, pady=5)
 
         # Footer / project label
         self.project_label_frame = CTkFrame(self.main_frame, fg_color=DARK_BG)
@@ -391,10 +782,24 @@ class MainApp(CTk):
         )
         self.verion_label.pack(side="right")
 
+        self.sequence_status_label = CTkLabel(
+            self.project_label_frame,
+            text="",
+            fg_color=DARK_BG
+        )
+        self.sequence_status_label.pack(side="right", padx=(0,10))
+
         self.protocol("WM_DELETE_WINDOW", self.on_closing)
         
     def on_closing(self):
         self.stop_sequence()
+        if self.subscription_id is not None:
+            self.toggle_aux_function()
+        if self.prewarm_after_id:
+            self.after_cancel(self.prewarm_after_id)
+            self.prewarm_after_id = None
+        for sound in self.sound_list:
+            sound.destroy_transport()
         if self.client:
             self.client.disconnect()
         self.destroy()
@@ -432,31 +837,55 @@ class MainApp(CTk):
                 self.selected_aux_label.configure(text="AUX: Selected None")
 
             if selected_object_type == 'AuxBus':
-                for sound in self.sound_list:
-                    sound_id = sound.sound_id_entry.get().strip()
-                    if sound_id:
-                        set_args = {
-                            "object": sound_id,
-                            "reference": "UserAuxSend0",
-                            "value": id_aux
-                        }
-                        try:
-                            self.client.call("ak.wwise.core.object.setReference", set_args)
-                            print(f"Updated Aux Send for sound {sound_id} to {id_aux}")
-                            #overide parrent user aux sends
-                            override_args = {
-                            "object": sound_id,
-                            "property": "OverrideUserAuxSends", 
-                            "value": True
-                            }
-                            self.client.call("ak.wwise.core.object.setProperty", override_args)
-                            
-                        except Exception as aux_e:
-                            print(f"Failed to set Aux Send for sound {sound_id}: {aux_e}")
+                sounds = [sound for sound in self.sound_list if sound.object_id]
+                # Sounds added after tracking started still need their originals saved first
+                self.capture_aux_snapshot({sound.object_id for sound in sounds})
+                # Only sounds whose original is saved are touched, so Restore AUX can always revert them
+                skipped = [sound for sound in sounds if sound.object_id not in self.aux_snapshot]
+                sound_ids = {sound.object_id for sound in sounds} - {sound.object_id for sound in skipped}
+                #overide parrent user aux sends
+                failed = write_aux_sends(self.client, {
+                    sound_id: {"aux": id_aux, "override": True}
+                    for sound_id in sound_ids
+                })
+                print(f"Updated Aux Send for {len(sound_ids) - len(failed)} sound(s) to {id_aux}")
+                if skipped:
+                    print(f"Skipped {len(skipped)} sound(s) whose AUX send could not be saved: "
+                          + ", ".join(f"{sound.name} {sound.object_id}" for sound in skipped))
+                if failed:
+                    print(f"Failed to set Aux Sends of {len(failed)} sound(s): " + ", ".join(failed))
         except Exception as e:
             traceback.print_exc()
             print(f"Error in assign_aux_send: {str(e)}")
 
+    def capture_aux_snapshot(self, sound_ids):
+        # Malformed ids are never sent: one bad id would fail the whole bulk read
+        missing = [s for s in sound_ids if is_guid(s) and s not in self.aux_snapshot]
+        if not missing:
+            return
+        try:
+            captured = read_aux_sends(self.client, missing)
+            if captured:
+                self.aux_snapshot.update(captured)
+                save_aux_snapshot(self.aux_snapshot)
+        except Exception as e:
+            traceback.print_exc()
+            print(f"Error capturing AUX snapshot: {e}")
+
+    def restore_aux_sends(self):
+        if not self.client:
+            print("Cannot restore AUX sends, no WAAPI client.")
+            return
+        snapshot = self.aux_snapshot or load_aux_snapshot()
+        if not snapshot:
+            print("No AUX snapshot to restore.")
+            return
+        try:
+            self.aux_snapshot = restore_aux_snapshot(self.client, snapshot)
+        except Exception as e:
+            traceback.print_exc()
+            print(f"Error restoring AUX sends, snapshot kept at {AUX_SNAPSHOT_PATH}: {e}")
+
     def start_aux_icon_animation(self):
         self.aux_rotating = True
         self.aux_spinner_index = 0
@@ -493,6 +922,7 @@ class MainApp(CTk):
             )
             self.aux_icon_label.configure(text="")
             self.start_aux_icon_animation()
+            self.capture_aux_snapshot({s.object_id for s in self.sound_list if s.object_id})
             try:
                 self.subscription_id = self.client.subscribe(
                     "ak.wwise.ui.selectionChanged",
@@ -517,28 +947,164 @@ class MainApp(CTk):
                 print("Unsubscription successful.")
             except Exception as e:
                 print(f"Unsubscription failed: {e}")
+            self.restore_aux_sends()
 
     def add_sound(self):
-        index = len(self.sound_list)
-        new_sound = Sound(self.sound_frame, self, index, on_delete=self.delete_sound)
-        self.sound_list.append(new_sound)
+        self.sound_list.append(Sound(self))
+        self.sound_view.scroll_to_end()
 
-    def delete_sound(self, index):
-        sound_obj = self.sound_list[index]
-        sound_obj.frame.destroy()
-        self.sound_list.pop(index)
-        for i, snd in enumerate(self.sound_list):
-            snd.index = i
+    def import_selection(self):
+        if not self.client:
+            print("Cannot import selection, no WAAPI client.")
+            return
+        try:
+            # One read of the Wwise selection; names come back in the same call
+            selected = self.client.call(
+                "ak.wwise.ui.getSelectedObjects",
+                {},
+                options={"return": ["id", "name"]}
+            )
+            objects = selected.get("objects", []) if selected else []
+        except Exception as e:
+            traceback.print_exc()
+            print(f"Error reading Wwise selection: {e}")
+            return
+
+        existing_ids = {s.object_id for s in self.sound_list}
+        new_sounds = []
+        for obj in objects:
+            object_id = obj.get("id")
+            if not object_id or object_id in existing_ids:
+                continue
+            existing_ids.add(object_id)
+            new_sounds.append(Sound(self, object_id, obj.get("name", "Unknown")))
+        self.sound_list.extend(new_sounds)
+        self.sound_view.refresh()
+
+        print(f"Imported {len(new_sounds)} sound(s) from selection.")
+        self.prewarm_transports(new_sounds)
+
+    def prewarm_transports(self, sounds):
+        # Queued and created a few per Tk tick, so a large import never freezes the window
+        self.prewarm_queue.extend([s for s in sounds if s not in self.prewarm_queue])
+        if self.prewarm_after_id is None:
+            self.prewarm_after_id = self.after(PREWARM_INTERVAL_MS, self.prewarm_next_batch)
+
+    def prewarm_next_batch(self):
+        self.prewarm_after_id = None
+        batch = self.prewarm_queue[:PREWARM_BATCH]
+        del self.prewarm_queue[:PREWARM_BATCH]
+        for sound in batch:
+            if not sound.transport_id and sound.object_id:
+                sound.create_transport(sound.object_id)
+        if self.prewarm_queue:
+            self.prewarm_after_id = self.after(PREWARM_INTERVAL_MS, self.prewarm_next_batch)
+
+    def delete_sound(self, sound_obj):
+        for scheduler in list(self.schedulers):
+            if sound_obj in scheduler.sounds:
+                scheduler.stop()
+        if sound_obj in self.prewarm_queue:
+            self.prewarm_queue.remove(sound_obj)
+        sound_obj.destroy_transport()
+        self.sound_list.remove(sound_obj)
+        self.sound_view.refresh()
+
+    def read_int_entry(self, entry):
+        try:
+            value_str = entry.get().strip()
+            return max(0, int(value_str)) if value_str else 0
+        except ValueError:
+            return 0
+
+    def fetch_durations(self, sounds):
+        # One object.get for every sound; None marks a duration only polling can tell
+        ids = list({s.object_id for s in sounds if s.object_id})
+        durations = dict.fromkeys(ids)
+        if not ids or not self.client:
+            return durations
+        try:
+            result = self.client.call(
+                "ak.wwise.core.object.get",
+                {"from": {"id": ids}},
+                {"return": ["id", "duration"]}
+            )
+            for obj in (result or {}).get("return", []):
+                duration = obj.get("duration") or {}
+                # Random/switch children can differ in length (min != max): only polling is exact
+                if (duration.get("type") == "oneShot" and duration.get("max") is not None
+                        and duration.get("min") == duration["max"]):
+                    durations[obj["id"]] = float(duration["max"])
+        except Exception as e:
+            print(f"Could not fetch durations, falling back to state polling: {e}")
+        return durations
+
+    def run_scheduler(self, sounds, loops):
+        scheduler = SequenceScheduler(
+            self, sounds,
+            gap_ms=self.read_int_entry(self.sequence_delay_entry),
+            loops=loops
+        )
+        if scheduler.start():
+            self.schedulers.append(scheduler)
+            self.sequence_status_label.configure(text="")
+
+    def start_sequence(self, start_index):
+        self.stop_sequence()
+        ordered = self.sound_list[start_index:] + self.sound_list[:start_index]
+        self.run_scheduler(ordered, self.read_int_entry(self.sequence_loops_entry))
+
+    def start_loop(self, sound):
+        self.run_scheduler([sound], loops=0)
+
+    def on_scheduler_finished(self, scheduler):
+        if scheduler in self.schedulers:
+            self.schedulers.remove(scheduler)
+        if scheduler.current is not None:
+            scheduler.current.mark_stopped()
+            scheduler.current = None
+        report = scheduler.jitter_report()
+        if report:
+            text = (f"Jitter: avg {report['mean_ms']:.1f} ms, "
+                    f"max {report['max_ms']:.1f} ms ({report['starts']} starts)")
+            print(f"Sequence finished. {text}")
+            self.sequence_status_label.configure(text=text)
 
     def stop_sequence(self):
-        self.sequence_stopped = True
+        playing = any(s.is_playing for s in self.sound_list)
+        # Cancel the timelines first so nothing restarts between the stop and the UI update
+        for scheduler in list(self.schedulers):
+            scheduler.stop(stop_transport=False)
+
+        if self.client and playing:
+            try:
+                # No transport given: Wwise stops every transport in a single call
+                self.client.call("ak.wwise.core.transport.executeAction", {"action": "stop"})
+            except Exception as e:
+                traceback.print_exc()
+                print(f"Error in stop_sequence: {e}")
+
         for s in self.sound_list:
-            if s.is_playing:
-                s.toggle_play_stop()
-            else:
-                s.clear_icon()
+            s.mark_stopped(refresh=False)
+        self.sound_view.refresh()
+        self.update_idletasks()
+
+def restore_from_command_line():
+    # Crash recovery without the UI: python reverb-mixing-helper --restore-aux
+    snapshot = load_aux_snapshot()
+    if not snapshot:
+        print("No AUX snapshot to restore.")
+        return
+    client = WaapiClient()
+    try:
+        restore_aux_snapshot(client, snapshot)
+    finally:
+        client.disconnect()
 
 def main():
+    if "--restore-aux" in sys.argv:
+        restore_from_command_line()
+        return
     app = MainApp()
     app.mainloop()
     if app.client: